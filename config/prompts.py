@@ -17,6 +17,7 @@ BEHAVIOR:
 - Confirm what you heard to avoid errors
 - If unclear, ask for clarification
 - Offer to escalate to human if needed
+- Messages starting with [keypad] are digits the caller typed on the phone keypad
 
 AVAILABLE ACTIONS:
 - Check order status
@@ -24,3 +25,29 @@ AVAILABLE ACTIONS:
 - Answer FAQs
 - Transfer to human agent
 """
+
+SUMMARY_PROMPT = """
+Summarize the earlier part of this customer service phone call in at most
+three short sentences. Keep every order number, date, time, name and
+commitment the agent made. Write plain text only.
+
+Conversation so far:
+"""
+
+# Short phrases pre-synthesized at startup to cover slow turns, keyed by situation
+FILLER_PHRASES = {
+    "lookup": [
+        "One moment while I check that.",
+        "Let me look that up for you.",
+    ],
+    "thinking": [
+        "One moment, please.",
+        "Just a second.",
+    ],
+}
+
+# Opening line of every call; pre-synthesized at startup
+GREETING = "Hello! How can I help you today?"
+
+# Spoken when the LLM fails or its circuit is open; pre-synthesized so it plays even if TTS is down
+APOLOGY = "I'm having trouble processing that. Could you repeat?"
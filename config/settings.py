@@ -2,7 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     environment: str = Field("development", alias="ENVIRONMENT")
     debug: bool = Field(False, alias="DEBUG")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
+    log_format: str = Field("json", alias="LOG_FORMAT")  # "json" or "text"
+    log_async: bool = Field(True, alias="LOG_ASYNC")  # write from a background thread
+    log_queue_size: int = Field(10000, alias="LOG_QUEUE_SIZE")
+    log_rate_limit: int = Field(20, alias="LOG_RATE_LIMIT")  # INFO records/s per message; 0 = unlimited
+    log_sample_every: int = Field(50, alias="LOG_SAMPLE_EVERY")  # beyond the limit, keep 1 in N
     host: str = Field("0.0.0.0", alias="HOST")
     port: int = Field(8000, alias="PORT")
 
@@ -39,6 +44,137 @@ class Settings(BaseSettings):
     database_url: str = Field("sqlite:///./voice_bot.db", alias="DATABASE_URL")
     redis_url: Optional[str] = Field(None, alias="REDIS_URL")
 
+    # Appointment availability (src/business/availability.py); times are business-local
+    appointment_resources: List[str] = Field(["default"], alias="APPOINTMENT_RESOURCES")  # JSON list
+    appointment_slot_minutes: int = Field(30, alias="APPOINTMENT_SLOT_MINUTES")
+    appointment_open: str = Field("09:00", alias="APPOINTMENT_OPEN")
+    appointment_close: str = Field("17:00", alias="APPOINTMENT_CLOSE")
+    appointment_weekdays: List[int] = Field([0, 1, 2, 3, 4], alias="APPOINTMENT_WEEKDAYS")  # Monday = 0
+    appointment_horizon_days: int = Field(28, alias="APPOINTMENT_HORIZON_DAYS")
+    appointment_hold_seconds: float = Field(120.0, alias="APPOINTMENT_HOLD_SECONDS")  # offered alternatives
+    appointment_refresh_seconds: float = Field(30.0, alias="APPOINTMENT_REFRESH_SECONDS")
+
+    # Speculative tool prefetch
+    prefetch_enabled: bool = Field(True, alias="PREFETCH_ENABLED")
+    prefetch_max_per_turn: int = Field(2, alias="PREFETCH_MAX_PER_TURN")
+
+    # Conversation context (token estimates)
+    context_token_budget: int = Field(1500, alias="CONTEXT_TOKEN_BUDGET")
+    context_summary_token_budget: int = Field(300, alias="CONTEXT_SUMMARY_TOKEN_BUDGET")
+    context_min_recent_messages: int = Field(4, alias="CONTEXT_MIN_RECENT_MESSAGES")
+
+    # Admission control / overload shedding
+    max_concurrent_calls: int = Field(50, alias="MAX_CONCURRENT_CALLS")
+    max_loop_lag_ms: float = Field(200.0, alias="MAX_LOOP_LAG_MS")
+    admission_reservation_ttl: float = Field(20.0, alias="ADMISSION_RESERVATION_TTL")
+    # Loop monitor: report callbacks/coroutine steps that block the loop this long
+    loop_monitor_enabled: bool = Field(True, alias="LOOP_MONITOR_ENABLED")
+    loop_slow_callback_ms: float = Field(100.0, alias="LOOP_SLOW_CALLBACK_MS")
+    loop_monitor_max_offenders: int = Field(50, alias="LOOP_MONITOR_MAX_OFFENDERS")
+    # Call supervisor: per-call resource accounting; reaps calls whose stream went quiet
+    call_supervisor_enabled: bool = Field(True, alias="CALL_SUPERVISOR_ENABLED")
+    call_supervisor_interval: float = Field(10.0, alias="CALL_SUPERVISOR_INTERVAL")  # seconds
+    call_idle_timeout: float = Field(60.0, alias="CALL_IDLE_TIMEOUT")  # no Twilio messages for this long
+    call_max_seconds: float = Field(14400.0, alias="CALL_MAX_SECONDS")
+    call_teardown_timeout: float = Field(5.0, alias="CALL_TEARDOWN_TIMEOUT")
+    stt_audio_queue_size: int = Field(250, alias="STT_AUDIO_QUEUE_SIZE")  # 20ms frames
+    stt_transcript_queue_size: int = Field(16, alias="STT_TRANSCRIPT_QUEUE_SIZE")
+
+    # Speech
+    stt_backend: str = Field("async", alias="STT_BACKEND")  # "async" or "threaded"
+    # 8000 streams Twilio MULAW as-is; 16000 upsamples to LINEAR16 for wideband models
+    stt_sample_rate: int = Field(8000, alias="STT_SAMPLE_RATE")
+    # "mulaw" asks TTS for 8 kHz MULAW; "linear16" synthesizes at TTS_SYNTHESIS_RATE and converts
+    tts_audio_encoding: str = Field("mulaw", alias="TTS_AUDIO_ENCODING")
+    tts_synthesis_rate: int = Field(24000, alias="TTS_SYNTHESIS_RATE")
+    tts_segment_parallelism: int = Field(3, alias="TTS_SEGMENT_PARALLELISM")
+
+    # End-of-utterance detection: start a turn on VAD silence plus a stable interim
+    # transcript, before the STT final (which confirms it); pause threshold adapts per caller
+    endpointing_enabled: bool = Field(True, alias="ENDPOINTING_ENABLED")
+    endpoint_initial_pause_ms: float = Field(700.0, alias="ENDPOINT_INITIAL_PAUSE_MS")
+    endpoint_min_pause_ms: float = Field(300.0, alias="ENDPOINT_MIN_PAUSE_MS")
+    endpoint_max_pause_ms: float = Field(1500.0, alias="ENDPOINT_MAX_PAUSE_MS")
+    endpoint_stable_ms: float = Field(200.0, alias="ENDPOINT_STABLE_MS")  # interim unchanged this long
+    vad_min_speech_rms: float = Field(300.0, alias="VAD_MIN_SPEECH_RMS")  # PCM16 RMS
+
+    # Keypad (DTMF) input: a sequence ends on the terminator, max length or a pause
+    dtmf_inter_digit_timeout: float = Field(3.0, alias="DTMF_INTER_DIGIT_TIMEOUT")  # seconds
+    dtmf_terminator: str = Field("#", alias="DTMF_TERMINATOR")
+    dtmf_max_digits: int = Field(12, alias="DTMF_MAX_DIGITS")
+    # Keyed sequences at least this long are looked up as order numbers without the LLM
+    dtmf_order_min_digits: int = Field(4, alias="DTMF_ORDER_MIN_DIGITS")
+
+    # LLM request policy: overall deadline, hedging past the rolling quantile, jittered retries
+    llm_deadline_seconds: float = Field(6.0, alias="LLM_DEADLINE_SECONDS")
+    llm_hedge_enabled: bool = Field(True, alias="LLM_HEDGE_ENABLED")
+    llm_hedge_quantile: float = Field(95.0, alias="LLM_HEDGE_QUANTILE")
+    llm_hedge_min_delay_ms: float = Field(300.0, alias="LLM_HEDGE_MIN_DELAY_MS")
+    llm_max_attempts: int = Field(2, alias="LLM_MAX_ATTEMPTS")
+    llm_retry_delay: float = Field(0.2, alias="LLM_RETRY_DELAY")
+    llm_retry_jitter: float = Field(0.5, alias="LLM_RETRY_JITTER")
+
+    # Model routing: per-turn tier choice; LLM_TIERS is JSON overriding tier fields
+    llm_router_enabled: bool = Field(True, alias="LLM_ROUTER_ENABLED")
+    llm_router_short_turn_words: int = Field(6, alias="LLM_ROUTER_SHORT_TURN_WORDS")
+    llm_tiers: Dict[str, Dict[str, Any]] = Field({}, alias="LLM_TIERS")
+
+    # On-demand profiler (/debug/profile); requires PROFILER_TOKEN as a bearer token
+    profiler_enabled: bool = Field(False, alias="PROFILER_ENABLED")
+    profiler_token: Optional[str] = Field(None, alias="PROFILER_TOKEN")
+    profiler_max_seconds: float = Field(60.0, alias="PROFILER_MAX_SECONDS")
+
+    # Operator endpoints (/analytics, /export, /debug/loop, /debug/calls); require ADMIN_TOKEN as a bearer token
+    admin_token: Optional[str] = Field(None, alias="ADMIN_TOKEN")
+
+    # Tenants: JSON file mapping called numbers to bot profiles (see src/business/tenants.py)
+    tenant_profiles_path: Optional[str] = Field(None, alias="TENANT_PROFILES_PATH")
+    tenant_cache_size: int = Field(32, alias="TENANT_CACHE_SIZE")  # cached model/voice sets
+
+    # Circuit breakers (per backend: stt, tts, llm)
+    breaker_window: int = Field(20, alias="BREAKER_WINDOW")  # most recent calls considered
+    breaker_min_calls: int = Field(5, alias="BREAKER_MIN_CALLS")
+    breaker_error_rate: float = Field(0.5, alias="BREAKER_ERROR_RATE")
+    breaker_slow_rate: float = Field(0.5, alias="BREAKER_SLOW_RATE")
+    breaker_reset_seconds: float = Field(30.0, alias="BREAKER_RESET_SECONDS")
+    llm_slow_call_ms: float = Field(5000.0, alias="LLM_SLOW_CALL_MS")
+    tts_slow_call_ms: float = Field(3000.0, alias="TTS_SLOW_CALL_MS")
+    # How long a call handed to <Say> while TTS is down may take to reconnect its stream
+    say_handoff_timeout: float = Field(120.0, alias="SAY_HANDOFF_TIMEOUT")
+
+    # Filler audio for slow turns
+    filler_enabled: bool = Field(True, alias="FILLER_ENABLED")
+    filler_threshold_ms: int = Field(1200, alias="FILLER_THRESHOLD_MS")
+
+    # Per-subsystem thread pools
+    llm_executor_workers: int = Field(16, alias="LLM_EXECUTOR_WORKERS")
+    tts_executor_workers: int = Field(16, alias="TTS_EXECUTOR_WORKERS")
+    db_executor_workers: int = Field(4, alias="DB_EXECUTOR_WORKERS")
+    stt_max_threads: int = Field(64, alias="STT_MAX_THREADS")
+    recording_writer_workers: int = Field(2, alias="RECORDING_WRITER_WORKERS")
+    export_executor_workers: int = Field(2, alias="EXPORT_EXECUTOR_WORKERS")  # concurrent bulk exports
+
+    # Call recording (QA)
+    recording_enabled: bool = Field(False, alias="RECORDING_ENABLED")
+    recording_dir: str = Field("recordings", alias="RECORDING_DIR")
+    recording_channels: int = Field(2, alias="RECORDING_CHANNELS")  # 2: caller left, bot right; 1: mixed
+    recording_chunk_bytes: int = Field(16000, alias="RECORDING_CHUNK_BYTES")  # 2 s of 8 kHz MULAW
+    recording_prealloc_chunks: int = Field(4, alias="RECORDING_PREALLOC_CHUNKS")  # per leg
+    recording_flush_interval: float = Field(5.0, alias="RECORDING_FLUSH_INTERVAL")
+
+    # Raw media session capture for replay
+    capture_enabled: bool = Field(False, alias="CAPTURE_ENABLED")
+    capture_dir: str = Field("captures", alias="CAPTURE_DIR")
+    capture_flush_every: int = Field(500, alias="CAPTURE_FLUSH_EVERY")  # entries
+
+    # Log retention / archival
+    retention_enabled: bool = Field(False, alias="RETENTION_ENABLED")
+    retention_days: int = Field(30, alias="RETENTION_DAYS")
+    retention_archive_dir: str = Field("archive", alias="RETENTION_ARCHIVE_DIR")
+    retention_batch_size: int = Field(500, alias="RETENTION_BATCH_SIZE")
+    retention_batch_pause: float = Field(0.05, alias="RETENTION_BATCH_PAUSE")  # seconds between batches
+    retention_interval_hours: float = Field(24.0, alias="RETENTION_INTERVAL_HOURS")
+
     @property
     def credentials_path(self) -> Optional[Path]:
         """Return Path to Google credentials if configured."""
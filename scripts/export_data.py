@@ -0,0 +1,48 @@
+"""Export calls or conversation transcripts as CSV/JSONL, streaming from the database.
+
+Usage:
+    python scripts/export_data.py conversations --format jsonl --gzip \\
+        --start 2026-01-01 --end 2026-01-02 --output conversations-2026-01-01.jsonl.gz
+"""
+
+import argparse
+import sys
+from datetime import datetime
+
+from src.database.export import DEFAULT_BATCH_SIZE, EXPORTS, FORMATS, iter_export, parse_call_sids
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stream a table export to a file.")
+    parser.add_argument("table", choices=sorted(EXPORTS), help="Table to export.")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl", help="Output format.")
+    parser.add_argument("--gzip", action="store_true", help="Gzip-compress the output.")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="Only rows at or after this UTC time.")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="Only rows before this UTC time.")
+    parser.add_argument("--call-sid", action="append", help="Only these calls (repeat or comma-separate).")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows fetched per batch.")
+    parser.add_argument("--output", required=True, help="Destination file.")
+    args = parser.parse_args()
+
+    try:
+        with open(args.output, "wb") as out:
+            for chunk in iter_export(
+                args.table,
+                args.format,
+                args.gzip,
+                args.start,
+                args.end,
+                parse_call_sids(args.call_sid),
+                args.batch_size,
+            ):
+                out.write(chunk)
+    except Exception as exc:
+        logger.error("Export failed: %s", exc)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
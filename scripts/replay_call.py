@@ -0,0 +1,67 @@
+"""Replay a captured call and print a per-turn timing report.
+
+Usage:
+    python scripts/replay_call.py captures/CA123.jsonl.gz --speed 0 --output after.jsonl
+    diff before.jsonl after.jsonl
+
+Captures are written when the server runs with CAPTURE_ENABLED=true. Database
+writes go to a throwaway SQLite file unless DATABASE_URL is set.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+# Keep replays out of the real call log
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/voice_bot_replay.db")
+
+from src.database.db import init_db  # noqa: E402
+from src.telephony.capture import read_capture  # noqa: E402
+from src.telephony.replay import format_report, replay_session  # noqa: E402
+from src.utils.logger import get_logger  # noqa: E402
+from src.utils.metrics import percentile  # noqa: E402
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a captured Twilio media session.")
+    parser.add_argument("capture", help="Capture file (.jsonl or .jsonl.gz).")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed; 0 replays as fast as possible.")
+    parser.add_argument("--llm-latency-ms", type=int, default=0, help="Simulated Gemini latency per call.")
+    parser.add_argument("--tts-latency-ms", type=int, default=0, help="Simulated TTS latency per sentence.")
+    parser.add_argument("--output", help="Report file; defaults to stdout (mixed with logs).")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.capture):
+        logger.error("Capture not found: %s", args.capture)
+        sys.exit(1)
+
+    init_db()
+    turns = asyncio.run(
+        replay_session(
+            read_capture(args.capture),
+            speed=args.speed,
+            llm_latency_ms=args.llm_latency_ms,
+            tts_latency_ms=args.tts_latency_ms,
+        )
+    )
+    report = format_report(turns)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(report)
+    else:
+        sys.stdout.write(report)
+    first_audio = [turn.first_audio_ms for turn in turns if turn.first_audio_ms is not None]
+    logger.info(
+        "Replayed %d turns; first audio p50=%s ms p95=%s ms",
+        len(turns),
+        percentile(first_audio, 50),
+        percentile(first_audio, 95),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Archive and delete call log rows older than the retention window.
+
+Usage:
+    python scripts/run_retention.py --days 30 --archive-dir /backups/voice-bot
+"""
+
+import argparse
+import json
+import sys
+
+from src.database.retention import ARCHIVED_TABLES, run_retention_sync
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move expired rows into compressed archive files.")
+    parser.add_argument("--days", type=int, help="Archive rows older than this many days (default: RETENTION_DAYS).")
+    parser.add_argument("--batch-size", type=int, help="Rows per delete transaction (default: RETENTION_BATCH_SIZE).")
+    parser.add_argument("--archive-dir", help="Archive root (default: RETENTION_ARCHIVE_DIR).")
+    parser.add_argument("--table", action="append", choices=sorted(ARCHIVED_TABLES), help="Limit to these tables.")
+    args = parser.parse_args()
+
+    try:
+        report = run_retention_sync(
+            max_age_days=args.days,
+            batch_size=args.batch_size,
+            archive_dir=args.archive_dir,
+            tables=args.table or tuple(ARCHIVED_TABLES),
+        )
+    except Exception as exc:
+        logger.error("Retention failed: %s", exc)
+        sys.exit(1)
+    print(json.dumps(report.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,189 @@
-"""Conversation context and history management."""
+"""Conversation context and history management.
 
+Recent turns are kept verbatim within a token budget. Older turns are folded
+into a running summary, and key facts (order numbers, requested and booked
+slots) are pinned so they survive any amount of folding.
+"""
+
+import re
 from collections import deque
-from typing import Deque, Dict, List
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+
+from config.settings import settings
+from src.ai.prefetch import ExtractedEntities
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4
+SUMMARY_ACK = "Understood."
+
+# Dates and times only count as a booking request in a turn about appointments
+_BOOKING_INTENT_RE = re.compile(
+    r"\b(?:appointment|book|booking|schedule|reschedule|slot|available|availability|visit)\w*",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _brief(text: str, limit: int = 120) -> str:
+    """First sentence of ``text``, capped at ``limit`` characters."""
+    text = " ".join(text.split())
+    for stop in (". ", "? ", "! "):
+        idx = text.find(stop)
+        if 0 < idx < limit:
+            return text[: idx + 1]
+    return text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
 
 
 class ConversationContext:
-    """Track recent conversation history for prompting."""
+    """Track conversation history for prompting under a token budget."""
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        min_recent_messages: Optional[int] = None,
+        summary_token_budget: Optional[int] = None,
+    ):
+        self.token_budget = token_budget or settings.context_token_budget
+        self.min_recent_messages = min_recent_messages or settings.context_min_recent_messages
+        self.summary_token_budget = summary_token_budget or settings.context_summary_token_budget
+        self.history: Deque[Dict[str, str]] = deque()
+        self.pinned: Dict[str, str] = {}
+        self._summary_lines: List[str] = []
+        self._history_tokens = 0
+        self._compacting = False
 
-    def __init__(self, max_turns: int = 10):
-        self.history: Deque[Dict[str, str]] = deque(maxlen=max_turns * 2)  # user + assistant per turn
+    # ── Mutation ────────────────────────────────────────────────────────
 
     def add_message(self, role: str, content: str) -> None:
         self.history.append({"role": role, "content": content})
+        self._history_tokens += estimate_tokens(content)
+        self._enforce_budget()
+
+    def pin(self, key: str, value: str) -> None:
+        """Remember a fact verbatim for the rest of the call."""
+        self.pinned[key] = value
+
+    def pin_entities(self, entities: ExtractedEntities, transcript: str = "") -> None:
+        """Pin the most recent entities extracted from a caller transcript.
+
+        Dates and times are pinned as a requested slot only while a booking
+        is being discussed; "how are you today?" requests nothing.
+        """
+        if entities.order_numbers:
+            self.pin("order number", entities.order_numbers[-1])
+        if not (entities.dates or entities.times) or not self._booking_in_progress(transcript):
+            return
+        if entities.dates:
+            self.pin("requested date", entities.dates[-1])
+        if entities.times:
+            self.pin("requested time", entities.times[-1])
+
+    def _booking_in_progress(self, transcript: str) -> bool:
+        if _BOOKING_INTENT_RE.search(transcript):
+            return True
+        if "booked appointment" not in self.pinned and (
+            "requested date" in self.pinned or "requested time" in self.pinned
+        ):
+            return True  # "how about 4 pm?" after asking for tomorrow
+        for message in reversed(self.history):
+            if message["role"] == "model":
+                # The agent just asked "what day works for your appointment?"
+                return bool(_BOOKING_INTENT_RE.search(message["content"]))
+        return False
+
+    def _enforce_budget(self) -> None:
+        """Fold the oldest user/model pairs into the summary until within budget.
+
+        The summary and pinned facts get their own share of the budget, kept
+        in check by ``compact``; the verbatim window gets the rest.
+        """
+        verbatim_budget = self.token_budget - self.summary_token_budget
+        while self._history_tokens > verbatim_budget and len(self.history) > self.min_recent_messages:
+            evicted = [self.history.popleft()]
+            # Evict whole turns so the verbatim window always opens on a user message
+            while self.history and self.history[0]["role"] != "user":
+                evicted.append(self.history.popleft())
+            for message in evicted:
+                self._history_tokens -= estimate_tokens(message["content"])
+            self._summary_lines.append(self._fold(evicted))
+
+    @staticmethod
+    def _fold(messages: List[Dict[str, str]]) -> str:
+        speakers = {"user": "Caller", "model": "Agent"}
+        return " ".join(
+            f"{speakers.get(m['role'], m['role'])}: {_brief(m['content'])}" for m in messages
+        )
+
+    # ── Summary compaction (off the critical path) ──────────────────────
+
+    @property
+    def summary(self) -> str:
+        return " ".join(self._summary_lines)
+
+    def needs_compaction(self) -> bool:
+        return not self._compacting and estimate_tokens(self.summary) > self.summary_token_budget
+
+    async def compact(self, summarizer: Optional[Callable[[str], Awaitable[str]]] = None) -> None:
+        """Rewrite the folded lines into a shorter summary.
+
+        Meant to run as a background task after a response has been sent.
+        Lines folded while the summarizer runs are kept and appended after it.
+        """
+        if self._compacting or not self._summary_lines:
+            return
+        self._compacting = True
+        folded = len(self._summary_lines)
+        try:
+            compacted = ""
+            if summarizer is not None:
+                try:
+                    compacted = (await summarizer(self.summary)).strip()
+                except Exception as exc:
+                    logger.warning("Context summarization failed: %s", exc)
+            if not compacted:
+                # Fallback: drop the oldest folded lines; pinned facts still survive
+                keep = list(self._summary_lines[:folded])
+                while keep and estimate_tokens(" ".join(keep)) > self.summary_token_budget:
+                    keep.pop(0)
+                compacted = " ".join(keep)
+            self._summary_lines[:folded] = [compacted] if compacted else []
+        finally:
+            self._compacting = False
+
+    # ── Rendering ───────────────────────────────────────────────────────
+
+    def _preface_text(self) -> str:
+        parts = []
+        if self.pinned:
+            facts = "; ".join(f"{key}: {value}" for key, value in self.pinned.items())
+            parts.append(f"Known facts: {facts}.")
+        if self._summary_lines:
+            parts.append(f"Earlier in this call: {self.summary}")
+        return " ".join(parts)
+
+    def _preface_tokens(self) -> int:
+        preface = self._preface_text()
+        return estimate_tokens(preface) + estimate_tokens(SUMMARY_ACK) if preface else 0
+
+    def prompt_tokens(self) -> int:
+        """Estimated tokens sent by ``to_gemini_format``."""
+        return self._history_tokens + self._preface_tokens()
 
     def get_history(self) -> List[Dict[str, str]]:
         return list(self.history)
 
     def to_gemini_format(self) -> List[Dict[str, str]]:
-        return [{"role": item["role"], "parts": [item["content"]]} for item in self.history]
+        messages = [{"role": item["role"], "parts": [item["content"]]} for item in self.history]
+        preface = self._preface_text()
+        if preface:
+            messages[:0] = [
+                {"role": "user", "parts": [preface]},
+                {"role": "model", "parts": [SUMMARY_ACK]},
+            ]
+        return messages
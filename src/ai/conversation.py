@@ -2,25 +2,51 @@
 
 import asyncio
 import json
+import re
 import time
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from contextlib import aclosing
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
+from config.prompts import APOLOGY
+from config.settings import settings
 from src.ai.context import ConversationContext
 from src.ai.gemini_client import GeminiClient, GeminiResponse
+from src.ai.prefetch import ToolPrefetcher
+from src.ai.router import model_router
 from src.business.handlers import BusinessHandlers
-from src.database.call_logger import log_call_end, log_call_start, log_message, log_metrics
+from src.business.tenants import DEFAULT_PROFILE, TenantProfile, tenants
+from src.database.call_logger import (
+    log_call_end,
+    log_call_start,
+    log_message,
+    log_metrics,
+    log_recording,
+)
 from src.speech.audio_utils import encode_base64_audio
-from src.speech.google_stt import GoogleSTT
+from src.speech.filler import LatencyMask, filler_bank, phrase_cache
+from src.speech.google_stt import create_stt
 from src.speech.google_tts import GoogleTTS
+from src.speech.recorder import CallRecorder
+from src.speech.segmenter import split_sentences, synthesize_segments
+from src.telephony.capture import SessionCapture
+from src.telephony.dtmf import DtmfCollector, KeypadInput, keypad_transcript
+from src.telephony.twilio_handler import handle_say_and_reconnect, redirect_call
+from src.utils.circuit_breaker import CLOSED, tts_breaker
+from src.utils.executors import tts_executor
 from src.utils.helpers import chunk_bytes
 from src.utils.logger import get_logger
+from src.utils.metrics import metrics
 
 logger = get_logger(__name__)
 
 MAX_TOOL_ROUNDS = 3
 
+# "What's your order number?", "could you give me the order #?"
+_ORDER_NUMBER_PROMPT_RE = re.compile(r"\border\s*(?:number|no\b|#|id\b)", re.IGNORECASE)
+
 # Maps tool names to BusinessHandlers method names
 TOOL_METHOD_MAP: Dict[str, str] = {
     "check_order_status": "check_order_status",
@@ -28,19 +54,104 @@ TOOL_METHOD_MAP: Dict[str, str] = {
     "get_faq_answer": "get_faq_answer",
 }
 
+# Context of calls handed to Twilio <Say> while TTS is down, keyed by Twilio
+# CallSid; the stream that reconnects afterwards picks it up again. If none
+# does within SAY_HANDOFF_TIMEOUT the entry is dropped and the call ended.
+_handed_off: Dict[str, ConversationContext] = {}
+_handoff_expiry: Dict[str, asyncio.Task] = {}
+
+# Recording and capture files finish after their orchestrator is gone; the
+# loop only keeps weak references to tasks, so hold them here until done
+_finishing: Set[asyncio.Task] = set()
+
+
+def _park_handoff(twilio_call_sid: str, call_sid: str, context: ConversationContext) -> None:
+    _handed_off[twilio_call_sid] = context
+    _handoff_expiry[twilio_call_sid] = asyncio.create_task(
+        _expire_handoff(twilio_call_sid, call_sid, settings.say_handoff_timeout)
+    )
+
+
+def _resume_handoff(twilio_call_sid: str) -> Optional[ConversationContext]:
+    """Take back a parked context (its stream reconnected, or the redirect failed)."""
+    expiry = _handoff_expiry.pop(twilio_call_sid, None)
+    if expiry:
+        expiry.cancel()
+    return _handed_off.pop(twilio_call_sid, None)
+
+
+async def _expire_handoff(twilio_call_sid: str, call_sid: str, timeout: float) -> None:
+    await asyncio.sleep(timeout)
+    _handoff_expiry.pop(twilio_call_sid, None)
+    if _handed_off.pop(twilio_call_sid, None) is None:
+        return
+    logger.warning("Call %s did not reconnect within %.0fs of its <Say> handoff", call_sid, timeout)
+    metrics.incr("tts.say_handoffs_expired")
+    await log_call_end(call_sid)
+
+
+def _segment_parallelism() -> int:
+    # While TTS recovers only the probe gets through; segments racing it would come back empty
+    return settings.tts_segment_parallelism if tts_breaker.state == CLOSED else 1
+
 
 class ConversationOrchestrator:
     """Maintain per-call conversation flow."""
 
-    def __init__(self, call_sid: str, websocket: WebSocket, on_cleanup: Optional[Callable[[], None]] = None):
+    # Timings of the first call handled by this process are logged once
+    _first_call_logged = False
+    _first_turn_logged = False
+
+    def __init__(
+        self,
+        call_sid: str,
+        websocket: WebSocket,
+        on_cleanup: Optional[Callable[[], None]] = None,
+        stt=None,
+        gemini=None,
+        tts=None,
+        handlers_factory: Callable[..., BusinessHandlers] = BusinessHandlers,
+    ):
         self.call_sid = call_sid
         self.websocket = websocket
         self._on_cleanup = on_cleanup
         self.context = ConversationContext()
-        self.gemini = GeminiClient()
-        self.stt = GoogleSTT()
-        self.tts = GoogleTTS()
-        self.handlers = BusinessHandlers()
+        # Replaced once the start event names the called number
+        self.profile: TenantProfile = DEFAULT_PROFILE
+        self.called_number: Optional[str] = None
+        # stt/gemini/tts and the business handlers may be injected (e.g. by the replay harness)
+        self._own_gemini = gemini is None
+        self._own_tts = tts is None
+        self.gemini = gemini or GeminiClient()
+        self.stt = stt or create_stt()
+        self.tts = tts or GoogleTTS()
+        self._handlers_factory = handlers_factory
+        self.handlers = handlers_factory(call_sid=call_sid)
+        self.prefetcher = ToolPrefetcher(
+            self._dispatch_tool,
+            max_per_turn=settings.prefetch_max_per_turn,
+            enabled=settings.prefetch_enabled,
+        )
+        self.recorder: Optional[CallRecorder] = CallRecorder(call_sid) if settings.recording_enabled else None
+        self.capture: Optional[SessionCapture] = SessionCapture(call_sid) if settings.capture_enabled else None
+        self.keypad = DtmfCollector(
+            self._queue_keypad_input,
+            inter_digit_timeout=settings.dtmf_inter_digit_timeout,
+            terminator=settings.dtmf_terminator,
+            max_digits=settings.dtmf_max_digits,
+        )
+        # Completed keypad sequences, run as turns by the stream handler like speech
+        self._keyed: Deque[KeypadInput] = deque()
+        self._summary_task: Optional[asyncio.Task] = None
+        self._turns = 0
+        # (mark name, filler played) for a response Twilio has not started playing yet
+        self._awaiting_mark: Optional[Tuple[str, bool]] = None
+        self.twilio_call_sid: Optional[str] = None
+        self._handing_off = False
+        # Lifetime bookkeeping for the call supervisor (src.telephony.supervisor)
+        self.started_at = self.last_activity = time.monotonic()
+        self.stream_task: Optional[asyncio.Task] = None
+        self.stopped = False
         self.state = "greeting"
 
     async def on_call_connected(self, payload: dict) -> None:
@@ -48,36 +159,123 @@ class ConversationOrchestrator:
 
     async def on_call_started(self, payload: dict) -> None:
         logger.info("Call %s started with metadata: %s", self.call_sid, payload.get("start", {}))
+        started = time.monotonic()
+        start = payload.get("start", {})
+        self.twilio_call_sid = start.get("callSid")
+        self.called_number = start.get("customParameters", {}).get("To")
+        profile = tenants.resolve(self.called_number)
+        if profile is not self.profile:
+            self._apply_profile(profile)
+        resumed = _resume_handoff(self.twilio_call_sid) if self.twilio_call_sid else None
+        if self.recorder:
+            await self.recorder.start()
+        if resumed is not None:
+            # Stream reopened after a <Say> handoff: same call, same conversation
+            logger.info("Call %s resumed after TTS handoff", self.call_sid)
+            self.context = resumed
+            await self.stt.start_stream()
+            return
         await log_call_start(self.call_sid)
         await self.stt.start_stream()
-        await self.send_text("Hello! How can I help you today?")
+        await self.send_text(self.profile.greeting)
+        if not ConversationOrchestrator._first_call_logged:
+            ConversationOrchestrator._first_call_logged = True
+            greeting_ms = (time.monotonic() - started) * 1000
+            metrics.set_gauge("startup.first_greeting_ms", round(greeting_ms, 1))
+            logger.info("First call %s: greeting sent in %.0f ms", self.call_sid, greeting_ms)
+
+    def _apply_profile(self, profile: TenantProfile) -> None:
+        """Switch to a tenant's prompt, tools, FAQs and voice (models/voices are cached)."""
+        logger.info("Call %s uses tenant profile %s", self.call_sid, profile.key)
+        self.profile = profile
+        if self._own_gemini:
+            self.gemini = GeminiClient(profile=profile)
+        if self._own_tts:
+            self.tts = GoogleTTS(voice=profile.voice)
+        self.handlers = self._handlers_factory(faqs=profile.faqs, call_sid=self.call_sid)
+
+    def _cached_audio(self, text: str) -> Optional[bytes]:
+        """Pre-synthesized audio for ``text``, if it was made in this call's voice."""
+        if self.profile.voice != DEFAULT_PROFILE.voice:
+            return None
+        return phrase_cache.get(text)
 
     async def on_audio_chunk(self, audio: bytes) -> None:
         """Receive audio chunk from Twilio stream."""
         await self.stt.process_audio_chunk(audio)
         transcript = await self.stt.get_transcript()
         if transcript:
+            if self.capture:
+                self.capture.record_transcript(transcript)
             await self.handle_user_input(transcript)
+        await self._run_keypad_turns()
+
+    async def on_dtmf(self, payload: dict) -> None:
+        """Twilio reports one keypad press per ``dtmf`` event."""
+        digit = payload.get("dtmf", {}).get("digit")
+        if digit:
+            await self.keypad.press(digit)
+        await self._run_keypad_turns()
+
+    async def _queue_keypad_input(self, keyed: KeypadInput) -> None:
+        # May run in the keypad's timer task; the turn waits for the stream handler
+        self._keyed.append(keyed)
+
+    async def _run_keypad_turns(self) -> None:
+        while self._keyed:
+            await self.handle_keypad_input(self._keyed.popleft())
 
     async def on_call_stopped(self, payload: dict) -> None:
         logger.info("Call %s ended", self.call_sid)
-        await log_call_end(self.call_sid)
+        self.stopped = True
+        if self._awaiting_mark:
+            # Caller hung up before hearing the response to their last turn
+            metrics.incr("calls.abandoned_mid_turn")
+            if self._awaiting_mark[1]:
+                metrics.incr("calls.abandoned_mid_turn.after_filler")
+        if not self._handing_off:
+            await log_call_end(self.call_sid)
         await self.cleanup()
 
     async def handle_user_input(self, transcript: str) -> None:
+        """Process user speech text, masking slow turns with filler audio."""
+        self._turns += 1
+        metrics.incr("turns.started")
+        mask = LatencyMask(self._send_audio_to_websocket, filler_bank, settings.filler_threshold_ms)
+        self._awaiting_mark = (f"response-{self._turns}", False)
+        # Fillers are pre-synthesized in the default voice only
+        if settings.filler_enabled and self.profile.voice == DEFAULT_PROFILE.voice:
+            mask.start()
+        try:
+            await self._handle_turn(transcript, mask)
+        finally:
+            mask.cancel()
+
+    async def _handle_turn(self, transcript: str, mask: LatencyMask) -> None:
         """Process user speech text with tool dispatch loop."""
         logger.info("User said: %s", transcript)
         self.context.add_message("user", transcript)
-        await log_message(self.call_sid, "user", transcript)
-
         turn_start = time.monotonic()
 
-        # Initial LLM call
+        # Kick off likely read-only lookups so they overlap with the LLM call
+        entities = self.prefetcher.start_turn(transcript)
+        self.context.pin_entities(entities, transcript)
+
+        await log_message(self.call_sid, "user", transcript)
+
+        # Initial LLM call, on the tier the router picks for this turn
+        route = model_router.route(transcript, entities, self.context)
+        metrics.observe("context.prompt_tokens", self.context.prompt_tokens())
         llm_start = time.monotonic()
         result = await self.gemini.generate_response(
-            self.context.to_gemini_format(), transcript
+            self.context.to_gemini_format(), transcript, tier=route.tier
         )
-        llm_elapsed_ms = int((time.monotonic() - llm_start) * 1000)
+        llm_elapsed_ms = tier_ms = int((time.monotonic() - llm_start) * 1000)
+        metrics.incr(f"llm.tier.{route.tier.name}")
+        metrics.observe(f"llm.tier.{route.tier.name}.latency_ms", tier_ms)
+        logger.info("Turn routed to %s tier (%s) in %d ms", route.tier.name, route.reason, tier_ms)
+        if self.capture:
+            self.capture.record_llm(result)
 
         # Tool dispatch loop — max MAX_TOOL_ROUNDS consecutive function calls
         rounds = 0
@@ -86,41 +284,197 @@ class ConversationOrchestrator:
             logger.info(
                 "Tool call %d: %s(%s)", rounds, result.function_call, result.function_args
             )
+            mask.on_tool_call()
             tool_result = await self._execute_tool(result.function_call, result.function_args)
+            self._pin_tool_result(result.function_call, tool_result)
 
             llm_start = time.monotonic()
             result = await self.gemini.send_function_result(
                 self.context.to_gemini_format(),
                 result.function_call,
                 tool_result,
+                tier=model_router.tool_tier,
             )
             llm_elapsed_ms += int((time.monotonic() - llm_start) * 1000)
+            if self.capture:
+                self.capture.record_llm(result)
+
+        self.prefetcher.cancel()
 
         # We now have a text response
         response_text = result.text or "I'm sorry, I couldn't process that."
         self.context.add_message("model", response_text)
         await log_message(self.call_sid, "assistant", response_text)
 
-        # TTS
+        # TTS, sentence by sentence; any filler already playing is sent in full first
         tts_start = time.monotonic()
-        await self.send_text(response_text)
+        segment_timings = await self._speak_response(response_text, mask)
         tts_elapsed_ms = int((time.monotonic() - tts_start) * 1000)
 
         total_elapsed_ms = int((time.monotonic() - turn_start) * 1000)
+        if not ConversationOrchestrator._first_turn_logged:
+            ConversationOrchestrator._first_turn_logged = True
+            metrics.set_gauge("startup.first_turn_ms", total_elapsed_ms)
+            logger.info(
+                "First turn on call %s: llm=%d ms tts=%d ms total=%d ms",
+                self.call_sid, llm_elapsed_ms, tts_elapsed_ms, total_elapsed_ms,
+            )
+
+        # Compact folded history once the caller already has their answer
+        if self.context.needs_compaction():
+            self._summary_task = asyncio.create_task(self.context.compact(self.gemini.summarize))
+
+        payload = {
+            "tts_segments": segment_timings,
+            "llm_tier": route.tier.name,
+            "llm_route_reason": route.reason,
+            "llm_tier_ms": tier_ms,
+        }
+        # How the end of the caller's speech was detected (see src.speech.endpointer)
+        endpoint = getattr(transcript, "endpoint", None)
+        stt_elapsed_ms = int(endpoint.decision_ms) if endpoint else None
+        if endpoint:
+            payload["endpoint_source"] = endpoint.source
+            payload["endpoint_ms"] = endpoint.decision_ms
+            payload["endpoint_pause_threshold_ms"] = endpoint.pause_threshold_ms
 
         # Log latency metrics (fire-and-forget)
         asyncio.create_task(
             log_metrics(
                 self.call_sid,
+                stt_latency=stt_elapsed_ms,
                 llm_latency=llm_elapsed_ms,
                 tts_latency=tts_elapsed_ms,
                 total_latency=total_elapsed_ms,
+                payload=payload,
+            )
+        )
+
+    async def _speak_response(self, text: str, mask: LatencyMask) -> List[dict]:
+        """Speak a turn's response after any filler; returns per-segment timings."""
+        segment_timings = []
+        cached = self._cached_audio(text)
+        if cached:
+            await mask.finish()
+            self._awaiting_mark = (f"response-{self._turns}", mask.played)
+            await self._send_mark(self._awaiting_mark[0])
+            await self._send_audio_to_websocket(cached)
+        elif tts_breaker.is_open:
+            await mask.finish()
+            await self._speak_degraded(text)
+        else:
+            unspoken: Optional[int] = None
+            segments = synthesize_segments(self.tts.synthesize, text, _segment_parallelism())
+            async with aclosing(segments):
+                async for segment in segments:
+                    if segment.index == 0:
+                        await mask.finish()
+                        # Twilio echoes the mark once playback reaches the start of the response
+                        self._awaiting_mark = (f"response-{self._turns}", mask.played)
+                        await self._send_mark(self._awaiting_mark[0])
+                    if not segment.audio:
+                        # TTS failed (or its breaker opened) mid-reply: the rest falls back together
+                        unspoken = segment.index
+                        break
+                    await self._send_audio_to_websocket(segment.audio)
+                    segment_timings.append(
+                        {"chars": len(segment.text), "synth_ms": segment.synth_ms, "ready_ms": segment.ready_ms}
+                    )
+            if unspoken is not None:
+                if unspoken:
+                    metrics.incr("tts.partial_responses")
+                await self._speak_degraded(" ".join(split_sentences(text)[unspoken:]))
+        return segment_timings
+
+    def _pin_tool_result(self, tool_name: str, tool_result: Any) -> None:
+        """Pin facts from tool results that later turns must not lose."""
+        if tool_name == "book_appointment" and isinstance(tool_result, dict) and tool_result.get("confirmed"):
+            self.context.pin(
+                "booked appointment", f"{tool_result.get('date')} at {tool_result.get('time')}"
+            )
+
+    def _expecting_order_number(self) -> bool:
+        """An order is already under discussion, or the agent just asked for its number."""
+        if "order number" in self.context.pinned:
+            return True
+        for message in reversed(self.context.history):
+            if message["role"] == "model":
+                return bool(_ORDER_NUMBER_PROMPT_RE.search(message["content"]))
+        return False
+
+    async def handle_keypad_input(self, keyed: KeypadInput) -> None:
+        """Handle a complete keyed-in sequence.
+
+        While the conversation is about an order, a long enough sequence is
+        looked up directly, without an LLM round trip. Anything else (a phone
+        number or date keyed in for a booking) becomes a regular turn.
+        """
+        logger.info("Caller keyed in %s (%s)", keyed.digits, keyed.reason)
+        transcript = keypad_transcript(keyed.digits)
+        if (
+            len(keyed.digits) < settings.dtmf_order_min_digits
+            or not self.profile.allows_tool("check_order_status")
+            or not self._expecting_order_number()
+        ):
+            await self.handle_user_input(transcript)
+            return
+        turn_start = time.monotonic()
+        tool_result = await self._dispatch_tool("check_order_status", {"order_number": keyed.digits})
+        tool_ms = int((time.monotonic() - turn_start) * 1000)
+        response_text = tool_result.get("message") if isinstance(tool_result, dict) else None
+        if not response_text:
+            # Lookup failed; let the model explain and ask again
+            metrics.incr("dtmf.direct_lookups.fallback")
+            await self.handle_user_input(transcript)
+            return
+
+        self._turns += 1
+        metrics.incr("turns.started")
+        metrics.incr("dtmf.direct_lookups")
+        self.context.add_message("user", transcript)
+        self.context.pin("order number", keyed.digits)
+        self.context.add_message("model", response_text)
+        await log_message(self.call_sid, "user", transcript)
+        await log_message(self.call_sid, "assistant", response_text)
+
+        tts_start = time.monotonic()
+        self._awaiting_mark = (f"response-{self._turns}", False)
+        # No filler: the lookup is done before anything is said
+        mask = LatencyMask(self._send_audio_to_websocket, filler_bank, settings.filler_threshold_ms)
+        segment_timings = await self._speak_response(response_text, mask)
+        tts_elapsed_ms = int((time.monotonic() - tts_start) * 1000)
+        total_elapsed_ms = int((time.monotonic() - turn_start) * 1000)
+        metrics.observe("dtmf.direct_lookup_ms", total_elapsed_ms)
+        asyncio.create_task(
+            log_metrics(
+                self.call_sid,
+                llm_latency=0,
+                tts_latency=tts_elapsed_ms,
+                total_latency=total_elapsed_ms,
+                payload={
+                    "tts_segments": segment_timings,
+                    "input": "dtmf",
+                    "dtmf_reason": keyed.reason,
+                    "tool": "check_order_status",
+                    "tool_ms": tool_ms,
+                },
             )
         )
 
     async def _execute_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
+        """Return a prefetched result if one matches, otherwise dispatch live."""
+        hit, result = await self.prefetcher.take(tool_name, args)
+        if hit:
+            logger.info("Tool %s served from prefetch", tool_name)
+            return result
+        return await self._dispatch_tool(tool_name, args)
+
+    async def _dispatch_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
         """Dispatch a tool call to the appropriate BusinessHandlers method."""
         method_name = TOOL_METHOD_MAP.get(tool_name)
+        if method_name and not self.profile.allows_tool(tool_name):
+            logger.warning("Tool %s not enabled for tenant %s", tool_name, self.profile.key)
+            return {"error": f"Tool not available: {tool_name}"}
         if not method_name:
             logger.warning("Unknown tool: %s", tool_name)
             return {"error": f"Unknown tool: {tool_name}"}
@@ -135,12 +489,50 @@ class ConversationOrchestrator:
             return {"error": f"Tool execution failed: {exc}"}
 
     async def send_text(self, text: str) -> None:
-        """Convert text to audio and stream back to caller."""
-        audio_bytes = await self.tts.synthesize(text)
-        await self._send_audio_to_websocket(audio_bytes)
+        """Convert text to audio and stream back to caller, sentence by sentence."""
+        cached = self._cached_audio(text)
+        if cached:
+            await self._send_audio_to_websocket(cached)
+            return
+        async for segment in synthesize_segments(self.tts.synthesize, text, _segment_parallelism()):
+            await self._send_audio_to_websocket(segment.audio)
+
+    async def _speak_degraded(self, text: str) -> None:
+        """TTS is down: let Twilio speak ``text``, or play the cached apology."""
+        metrics.incr("tts.degraded_responses")
+        if await self._handoff_to_say(text):
+            return
+        apology = phrase_cache.get(APOLOGY)
+        if apology:
+            await self._send_audio_to_websocket(apology)
+        else:
+            logger.error("No audio available for call %s; response dropped", self.call_sid)
+
+    async def _handoff_to_say(self, text: str) -> bool:
+        """Redirect the call to TwiML ``<Say>`` followed by a fresh media stream.
+
+        The context is parked in ``_handed_off`` so the reconnected stream
+        continues the same conversation.
+        """
+        if not (self.twilio_call_sid and settings.twilio_account_sid and settings.twilio_auth_token):
+            return False
+        _park_handoff(self.twilio_call_sid, self.call_sid, self.context)
+        self._handing_off = True
+        try:
+            twiml = handle_say_and_reconnect(text, self.called_number)
+            await tts_executor.run(redirect_call, self.twilio_call_sid, twiml)
+        except Exception as exc:
+            logger.error("Say handoff failed for call %s: %s", self.call_sid, exc)
+            _resume_handoff(self.twilio_call_sid)
+            self._handing_off = False
+            return False
+        metrics.incr("tts.say_handoffs")
+        return True
 
     async def _send_audio_to_websocket(self, audio: bytes) -> None:
         """Send base64 audio payload to Twilio via WebSocket, chunked for streaming."""
+        if self.recorder:
+            self.recorder.record_outbound(audio)
         if not audio:
             await self.websocket.send_json(
                 {
@@ -161,12 +553,46 @@ class ConversationOrchestrator:
                 }
             )
 
+    async def _send_mark(self, name: str) -> None:
+        await self.websocket.send_json(
+            {"event": "mark", "streamSid": self.call_sid, "mark": {"name": name}}
+        )
+
+    async def on_mark(self, payload: dict) -> None:
+        """Twilio reached a mark we sent; the caller is now hearing that response."""
+        name = payload.get("mark", {}).get("name")
+        if self._awaiting_mark and self._awaiting_mark[0] == name:
+            self._awaiting_mark = None
+
+    @staticmethod
+    def _finish_in_background(coro) -> None:
+        task = asyncio.create_task(coro)
+        _finishing.add(task)
+        task.add_done_callback(_finishing.discard)
+
+    async def _save_recording(self) -> None:
+        path = await self.recorder.close()
+        if path:
+            await log_recording(self.call_sid, path)
+
     async def cleanup(self) -> None:
         """Release resources at end of call."""
+        self.prefetcher.cancel()
+        self.keypad.close()
+        self._keyed.clear()
+        # Alternatives offered to this caller stay free for everyone else
+        self.handlers.calendar.release_owner(self.handlers.call_sid)
+        if self._summary_task and not self._summary_task.done():
+            self._summary_task.cancel()
         try:
             await self.stt.close()
         except Exception:
             logger.debug("STT cleanup skipped")
+        if self.recorder:
+            # Writing the WAV file can take a moment; don't hold up teardown
+            self._finish_in_background(self._save_recording())
+        if self.capture:
+            self._finish_in_background(self.capture.close())
         if self._on_cleanup:
             try:
                 self._on_cleanup()
@@ -1,18 +1,55 @@
 """Gemini client wrapper with structured responses and tool calling support."""
 
-import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import google.generativeai as genai
-
-from config.prompts import SYSTEM_PROMPT
+from config.prompts import APOLOGY, SUMMARY_PROMPT
 from config.settings import settings
-from src.business.tools import AVAILABLE_TOOLS
+from src.ai.request_policy import HedgedRequestPolicy
+from src.ai.router import CAPABLE, DEFAULT_TIERS, ModelTier, model_router
+from src.business.tenants import DEFAULT_PROFILE, TenantProfile
+from src.utils.circuit_breaker import CircuitOpenError, llm_breaker
+from src.utils.executors import llm_executor
+from src.utils.lazy import lazy_import
 from src.utils.logger import get_logger
+from src.utils.lru import LRUCache
 
 logger = get_logger(__name__)
 
+genai = lazy_import("google.generativeai")
+
+MODEL_NAME = DEFAULT_TIERS[CAPABLE].model
+TROUBLE_RESPONSE = APOLOGY
+
+
+def _build_policy(tier_name: str) -> HedgedRequestPolicy:
+    return HedgedRequestPolicy(
+        f"llm.{tier_name}",
+        deadline=settings.llm_deadline_seconds,
+        hedge=settings.llm_hedge_enabled,
+        hedge_quantile=settings.llm_hedge_quantile,
+        min_hedge_delay_ms=settings.llm_hedge_min_delay_ms,
+        max_attempts=settings.llm_max_attempts,
+        retry_delay=settings.llm_retry_delay,
+        retry_jitter=settings.llm_retry_jitter,
+    )
+
+
+# One policy per model tier, shared by every call so each tier's hedge
+# threshold learns from all of that tier's traffic and no other's
+_llm_policies: Dict[str, HedgedRequestPolicy] = {name: _build_policy(name) for name in model_router.tiers}
+
+
+def llm_policy(tier_name: str) -> HedgedRequestPolicy:
+    """The request policy for a tier; metrics are reported under ``llm.<tier>.*``."""
+    if tier_name not in _llm_policies:
+        _llm_policies[tier_name] = _build_policy(tier_name)
+    return _llm_policies[tier_name]
+
+
+# Per-tenant chat models (one per tier), built once and shared by that tenant's calls
+tenant_models: LRUCache[Any] = LRUCache("tenant_models", settings.tenant_cache_size)
+
 
 @dataclass
 class GeminiResponse:
@@ -30,20 +67,54 @@ class GeminiResponse:
 class GeminiClient:
     """Lightweight async wrapper for Gemini calls with tool-calling support."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, ModelTier]] = None,
+        profile: TenantProfile = DEFAULT_PROFILE,
+    ):
         if settings.gemini_api_key:
             genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(
-            model_name="gemini-2.0-flash-exp",
-            tools=AVAILABLE_TOOLS,
-            system_instruction=SYSTEM_PROMPT.strip(),
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.8,
-                "top_k": 40,
-                "max_output_tokens": 150,
-            },
+        self.tiers = tiers or model_router.tiers
+        self.policies = {name: llm_policy(name) for name in self.tiers}
+        self.profile = profile
+        # Keyed by what the models are built from: tenants may share a display name
+        self.models = tenant_models.get_or_create(
+            (profile.system_prompt, profile.tools, tuple(self.tiers.values())),
+            lambda: self._build_models(profile, self.tiers),
         )
+        self.model = self.models[CAPABLE]
+        # Plain model (no tools, no voice persona) for background context summaries
+        self.summary_model = tenant_models.get_or_create(
+            "summary",
+            lambda: genai.GenerativeModel(
+                model_name=MODEL_NAME,
+                generation_config={
+                    "temperature": 0.2,
+                    "max_output_tokens": settings.context_summary_token_budget,
+                },
+            ),
+        )
+
+    @staticmethod
+    def _build_models(profile: TenantProfile, tiers: Dict[str, ModelTier]) -> Dict[str, Any]:
+        """One chat model per tier; all share the tenant's tools and persona."""
+        return {
+            name: genai.GenerativeModel(
+                model_name=tier.model,
+                tools=profile.tool_declarations,
+                system_instruction=profile.system_prompt.strip(),
+                generation_config=tier.generation_config(),
+            )
+            for name, tier in tiers.items()
+        }
+
+    @staticmethod
+    def warm_up() -> None:
+        """Configure the SDK and resolve the model once so the first call skips it."""
+        if settings.gemini_api_key:
+            genai.configure(api_key=settings.gemini_api_key)
+        for model_name in {tier.model for tier in model_router.tiers.values()}:
+            genai.get_model(f"models/{model_name}")
 
     def _parse_response(self, response) -> GeminiResponse:
         """Extract text or function call from a Gemini response."""
@@ -56,53 +127,82 @@ class GeminiClient:
         text = response.text if response.text else "I am here to help."
         return GeminiResponse(text=text)
 
+    def _model_for(self, tier: Optional[ModelTier]):
+        return self.models.get(tier.name, self.model) if tier else self.model
+
+    def _policy_for(self, tier: Optional[ModelTier]) -> HedgedRequestPolicy:
+        return self.policies.get(tier.name if tier else CAPABLE) or self.policies[CAPABLE]
+
+    async def _request(
+        self, run: Callable[[], GeminiResponse], label: str, tier: Optional[ModelTier] = None
+    ) -> GeminiResponse:
+        """Run a blocking Gemini call through the breaker and the tier's request policy."""
+        policy = self._policy_for(tier)
+        try:
+            return await llm_breaker.call(lambda: policy.call(lambda: llm_executor.run(run)))
+        except CircuitOpenError:
+            logger.warning("%s skipped: circuit open", label)
+        except Exception as exc:
+            logger.error("%s failed: %r", label, exc)
+        return GeminiResponse(text=TROUBLE_RESPONSE)
+
     async def generate_response(
-        self, history: List[dict], user_message: str
+        self, history: List[dict], user_message: str, tier: Optional[ModelTier] = None
     ) -> GeminiResponse:
-        """Send conversation history to Gemini and return structured response."""
+        """Send conversation history to Gemini and return structured response.
+
+        ``tier`` selects the model (see ``src.ai.router``); defaults to the capable tier.
+        """
         if not settings.gemini_api_key:
             logger.warning("GEMINI_API_KEY not configured; returning fallback response.")
             return GeminiResponse(text="I am not fully configured yet, but I am here to help.")
 
+        model = self._model_for(tier)
+
         def _run() -> GeminiResponse:
-            try:
-                chat = self.model.start_chat(history=history)
-                response = chat.send_message(user_message)
-                return self._parse_response(response)
-            except Exception as exc:
-                logger.error("Gemini call failed: %s", exc)
-                return GeminiResponse(
-                    text="I'm having trouble processing that. Could you repeat?"
-                )
+            chat = model.start_chat(history=history)
+            response = chat.send_message(user_message)
+            return self._parse_response(response)
 
-        return await asyncio.to_thread(_run)
+        return await self._request(_run, "Gemini call", tier)
 
     async def send_function_result(
         self,
         history: List[dict],
         function_name: str,
         result: Any,
+        tier: Optional[ModelTier] = None,
     ) -> GeminiResponse:
         """Send a function result back to Gemini and return the next response."""
         if not settings.gemini_api_key:
             return GeminiResponse(text="I am not fully configured yet, but I am here to help.")
+        model = self._model_for(tier)
 
         def _run() -> GeminiResponse:
-            try:
-                chat = self.model.start_chat(history=history)
-                response = chat.send_message(
-                    genai.protos.Part(
-                        function_response=genai.protos.FunctionResponse(
-                            name=function_name,
-                            response={"result": result},
-                        )
+            chat = model.start_chat(history=history)
+            response = chat.send_message(
+                genai.protos.Part(
+                    function_response=genai.protos.FunctionResponse(
+                        name=function_name,
+                        response={"result": result},
                     )
                 )
-                return self._parse_response(response)
+            )
+            return self._parse_response(response)
+
+        return await self._request(_run, "Gemini function result call", tier)
+
+    async def summarize(self, text: str) -> str:
+        """Condense earlier conversation text; returns "" when unavailable."""
+        if not settings.gemini_api_key:
+            return ""
+
+        def _run() -> str:
+            try:
+                response = self.summary_model.generate_content(SUMMARY_PROMPT.strip() + "\n" + text)
+                return response.text or ""
             except Exception as exc:
-                logger.error("Gemini function result call failed: %s", exc)
-                return GeminiResponse(
-                    text="I'm having trouble processing that. Could you repeat?"
-                )
+                logger.error("Gemini summary call failed: %s", exc)
+                return ""
 
-        return await asyncio.to_thread(_run)
+        return await llm_executor.run(_run)
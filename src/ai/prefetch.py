@@ -0,0 +1,186 @@
+"""Speculative tool prefetch driven by entities in the caller's transcript.
+
+While Gemini decides which tool to call, likely side-effect-free lookups are
+already running. When the model then asks for one of them, the orchestrator
+returns the prefetched result instead of hitting the backend again.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from src.business.tools import SIDE_EFFECT_FREE_TOOLS
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+# "order 12345", "order number is AB-1234", "order #9 8 7 6"
+_ORDER_CONTEXT_RE = re.compile(
+    r"\border\s+(?:(?:number|no\.?|num)\s+)?(?:is\s+)?#?\s*([A-Z]{0,3}-?\d(?:[ -]?\d){2,})",
+    re.IGNORECASE,
+)
+# Bare digit runs long enough to be an order number; STT often spaces digits out
+_DIGIT_RUN_RE = re.compile(r"\b\d(?:[ -]?\d){4,}\b")
+
+_WEEKDAY_RE = re.compile(
+    r"\b(?:today|tomorrow|(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))\b",
+    re.IGNORECASE,
+)
+_MONTH_DAY_RE = re.compile(
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?\b",
+    re.IGNORECASE,
+)
+_NUMERIC_DATE_RE = re.compile(r"\b(?:\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b")
+_TIME_RE = re.compile(
+    r"\b(?:\d{1,2}(?::\d{2})?\s*(?:a\.?m\.?|p\.?m\.?)|\d{1,2}:\d{2}|noon|midday)(?!\w)",
+    re.IGNORECASE,
+)
+
+_NORMALIZE_RE = re.compile(r"[^0-9A-Za-z]")
+
+CallKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class ExtractedEntities:
+    """Entities detected in a single final transcript."""
+
+    order_numbers: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    times: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.order_numbers or self.dates or self.times)
+
+
+def _normalize(value: Any) -> str:
+    return _NORMALIZE_RE.sub("", str(value)).upper()
+
+
+def _call_key(tool_name: str, args: Dict[str, Any]) -> CallKey:
+    """Key a tool call so cosmetic differences ("12 345" vs "12345") still match."""
+    return tool_name, tuple(sorted((k, _normalize(v)) for k, v in args.items()))
+
+
+def _dedupe(items: List[str]) -> List[str]:
+    seen: Dict[str, None] = {}
+    for item in items:
+        seen.setdefault(item, None)
+    return list(seen)
+
+
+class EntityExtractor:
+    """Pull order numbers and dates/times out of transcript text."""
+
+    def extract(self, transcript: str) -> ExtractedEntities:
+        orders = [_normalize(m) for m in _ORDER_CONTEXT_RE.findall(transcript)]
+        if not orders:
+            orders = [_normalize(m) for m in _DIGIT_RUN_RE.findall(transcript)]
+        dates = (
+            _WEEKDAY_RE.findall(transcript)
+            + _MONTH_DAY_RE.findall(transcript)
+            + _NUMERIC_DATE_RE.findall(transcript)
+        )
+        times = _TIME_RE.findall(transcript)
+        return ExtractedEntities(
+            order_numbers=_dedupe(orders),
+            dates=_dedupe([d.lower() for d in dates]),
+            times=_dedupe([t.lower() for t in times]),
+        )
+
+
+def plan_tool_calls(entities: ExtractedEntities) -> List[Tuple[str, Dict[str, Any]]]:
+    """Map entities to the tool calls Gemini is likely to request.
+
+    Dates and times point at ``book_appointment``, which has side effects, so
+    they are extracted but never turned into a prefetch here.
+    """
+    return [("check_order_status", {"order_number": number}) for number in entities.order_numbers]
+
+
+class ToolPrefetcher:
+    """Run likely tool calls for the current turn ahead of the LLM."""
+
+    def __init__(
+        self,
+        dispatch: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+        extractor: Optional[EntityExtractor] = None,
+        allowed_tools: FrozenSet[str] = SIDE_EFFECT_FREE_TOOLS,
+        max_per_turn: int = 2,
+        enabled: bool = True,
+    ):
+        self._dispatch = dispatch
+        self.enabled = enabled
+        self._extractor = extractor or EntityExtractor()
+        self._allowed_tools = allowed_tools
+        self._max_per_turn = max_per_turn
+        self._pending: Dict[CallKey, asyncio.Task] = {}
+        self.issued = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def start_turn(self, transcript: str) -> ExtractedEntities:
+        """Extract entities and launch prefetches; returns the entities found."""
+        self.cancel()
+        entities = self._extractor.extract(transcript)
+        if not self.enabled:
+            return entities
+        for tool_name, args in plan_tool_calls(entities)[: self._max_per_turn]:
+            if tool_name not in self._allowed_tools:
+                continue
+            key = _call_key(tool_name, args)
+            if key in self._pending:
+                continue
+            self._pending[key] = asyncio.create_task(self._dispatch(tool_name, args))
+            self.issued += 1
+            metrics.incr("prefetch.issued")
+            logger.debug("Prefetching %s(%s)", tool_name, args)
+        return entities
+
+    async def take(self, tool_name: str, args: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Return ``(True, result)`` for a prefetch hit, ``(False, None)`` otherwise."""
+        if tool_name not in self._allowed_tools:
+            return False, None
+        metrics.incr("prefetch.lookups")
+        task = self._pending.pop(_call_key(tool_name, args), None)
+        result: Any = None
+        if task is not None:
+            try:
+                result = await task
+            except Exception as exc:
+                logger.debug("Prefetch for %s failed: %s", tool_name, exc)
+                task = None
+        if task is None or (isinstance(result, dict) and "error" in result):
+            self.misses += 1
+            metrics.incr("prefetch.misses")
+            return False, None
+        self.hits += 1
+        metrics.incr("prefetch.hits")
+        return True, result
+
+    def cancel(self) -> None:
+        """Drop prefetches the model never asked for."""
+        for task in self._pending.values():
+            if not task.done():
+                task.cancel()
+            metrics.incr("prefetch.wasted")
+        self._pending.clear()
+
+
+def prefetch_stats() -> dict:
+    """Process-wide prefetch counters plus the derived hit rate."""
+    return {
+        "issued": metrics.counter("prefetch.issued"),
+        "hits": metrics.counter("prefetch.hits"),
+        "misses": metrics.counter("prefetch.misses"),
+        "wasted": metrics.counter("prefetch.wasted"),
+        "hit_rate": metrics.ratio("prefetch.hits", "prefetch.lookups"),
+    }
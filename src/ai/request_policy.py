@@ -0,0 +1,111 @@
+"""Deadlines, hedging and retries for LLM requests.
+
+``HedgedRequestPolicy.call`` runs an attempt factory under three rules:
+
+- Deadline: the whole call, retries included, fails with
+  ``asyncio.TimeoutError`` after ``deadline`` seconds.
+- Hedging: if an attempt has not finished by the rolling latency quantile
+  (p95 by default), an identical second attempt is started; whichever
+  succeeds first wins and the other is cancelled. Until ``min_samples``
+  latencies have been seen there is no estimate and nothing is hedged.
+- Retries: a failed attempt (both copies failed, if hedged) is retried via
+  ``retry_async`` with jittered backoff.
+
+Only use it for idempotent requests. Cancelling a request that is running on
+an executor thread stops the wait, not the thread; the thread's result is
+discarded when it finishes.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Set, TypeVar
+
+from src.utils.helpers import retry_async
+from src.utils.metrics import metrics
+
+T = TypeVar("T")
+
+
+class HedgedRequestPolicy:
+    """Per-backend request policy; metrics are reported under ``<name>.*``."""
+
+    def __init__(
+        self,
+        name: str,
+        deadline: float,
+        hedge: bool = True,
+        hedge_quantile: float = 95.0,
+        min_hedge_delay_ms: float = 300.0,
+        min_samples: int = 20,
+        max_attempts: int = 2,
+        retry_delay: float = 0.2,
+        retry_jitter: float = 0.5,
+    ):
+        self.name = name
+        self.deadline = deadline
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.min_hedge_delay_ms = min_hedge_delay_ms
+        self.min_samples = min_samples
+        self._attempt_with_retries = retry_async(
+            max_attempts=max_attempts,
+            delay=retry_delay,
+            jitter=retry_jitter,
+            on_retry=lambda attempt, exc: metrics.incr(f"{name}.retries"),
+        )(self._hedged_attempt)
+
+    @property
+    def latency_metric(self) -> str:
+        return f"{self.name}.latency_ms"
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None when hedging is off or unknown."""
+        if not self.hedge or metrics.sample_count(self.latency_metric) < self.min_samples:
+            return None
+        threshold = max(metrics.quantile(self.latency_metric, self.hedge_quantile), self.min_hedge_delay_ms)
+        metrics.set_gauge(f"{self.name}.hedge_delay_ms", threshold)
+        return threshold / 1000
+
+    async def call(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        metrics.incr(f"{self.name}.requests")
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(self._attempt_with_retries(attempt), timeout=self.deadline)
+        except asyncio.TimeoutError:
+            metrics.incr(f"{self.name}.deadline_exceeded")
+            raise
+        except Exception:
+            metrics.incr(f"{self.name}.errors")
+            raise
+        metrics.observe(f"{self.name}.call_ms", (time.monotonic() - started) * 1000)
+        return result
+
+    async def _timed(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await attempt()
+        metrics.observe(self.latency_metric, (time.monotonic() - started) * 1000)
+        return result
+
+    async def _hedged_attempt(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        primary = asyncio.ensure_future(self._timed(attempt))
+        pending: Set[asyncio.Future] = {primary}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    metrics.incr(f"{self.name}.hedged")
+                    pending.add(asyncio.ensure_future(self._timed(attempt)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            metrics.incr(f"{self.name}.hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,155 @@
+"""Pick a Gemini model tier per turn from the transcript and conversation state.
+
+Most turns are "yes", "no" or "thanks" and do not need the model that runs
+booking flows. ``ModelRouter`` classifies each caller turn with cheap rules
+(no model call) and returns the tier to use:
+
+- ``small``: short confirmations and small talk; fastest model, low
+  ``max_output_tokens``.
+- ``capable``: anything that names an order, a date/time or a tool intent,
+  a confirmation while a booking is still pending, and every follow-up call
+  that carries a tool result.
+
+The tier table defaults to ``DEFAULT_TIERS``; ``LLM_TIERS`` (JSON) overrides
+individual fields, e.g. ``{"small": {"model": "gemini-1.5-flash-8b"}}``.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from config.settings import settings
+from src.ai.context import ConversationContext
+from src.ai.prefetch import ExtractedEntities
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SMALL = "small"
+CAPABLE = "capable"
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    name: str
+    model: str
+    max_output_tokens: int
+    temperature: float = 0.7
+    top_p: float = 0.8
+    top_k: int = 40
+
+    def generation_config(self) -> Dict[str, Any]:
+        return {
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "top_k": self.top_k,
+            "max_output_tokens": self.max_output_tokens,
+        }
+
+
+DEFAULT_TIERS: Dict[str, ModelTier] = {
+    SMALL: ModelTier(SMALL, "gemini-2.0-flash-lite", max_output_tokens=60, temperature=0.5),
+    CAPABLE: ModelTier(CAPABLE, "gemini-2.0-flash-exp", max_output_tokens=150),
+}
+
+
+def load_tiers(overrides: Optional[Mapping[str, Mapping[str, Any]]] = None) -> Dict[str, ModelTier]:
+    """Apply per-field overrides to the default tier table; unknown tiers are ignored."""
+    tiers = dict(DEFAULT_TIERS)
+    for name, fields in (overrides or {}).items():
+        if name not in tiers:
+            logger.warning("Ignoring unknown LLM tier %r", name)
+            continue
+        tiers[name] = replace(tiers[name], **{k: v for k, v in fields.items() if k != "name"})
+    return tiers
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    tier: ModelTier
+    reason: str
+
+
+_WORD_RE = re.compile(r"[a-z']+")
+
+# Words that make up confirmations, refusals, greetings and thanks
+_SMALL_TALK_WORDS = frozenset(
+    """
+    yes yeah yep yup sure ok okay alright right correct exactly absolutely please
+    no nope nah not
+    thanks thank you cheers great perfect cool awesome fine good nice
+    hi hello hey bye goodbye see ya later have a day morning afternoon evening
+    that's sounds that it is all that'll be do does i'm im it's so much very well oh um uh hmm
+    """.split()
+)
+
+# Words that signal a turn will end in a tool call
+_TOOL_INTENT_RE = re.compile(
+    r"\b(?:order|package|delivery|deliver|shipping|ship|track|status|refund|return|"
+    r"appointment|book|booking|schedule|reschedule|cancel|slot|available|availability|"
+    r"hours|open|price|cost|policy)\w*",
+    re.IGNORECASE,
+)
+
+
+class ModelRouter:
+    """Classify caller turns onto tiers of ``tiers``; decisions are rule based."""
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, ModelTier]] = None,
+        enabled: bool = True,
+        short_turn_words: int = 6,
+    ):
+        self.tiers = tiers or dict(DEFAULT_TIERS)
+        self.enabled = enabled
+        self.short_turn_words = short_turn_words
+
+    @property
+    def tool_tier(self) -> ModelTier:
+        """Tier for calls that carry tool results."""
+        return self.tiers[CAPABLE]
+
+    def route(
+        self,
+        transcript: str,
+        entities: Optional[ExtractedEntities] = None,
+        context: Optional[ConversationContext] = None,
+    ) -> RouteDecision:
+        tier_name, reason = self._classify(transcript, entities, context)
+        return RouteDecision(self.tiers[tier_name], reason)
+
+    def _classify(
+        self,
+        transcript: str,
+        entities: Optional[ExtractedEntities],
+        context: Optional[ConversationContext],
+    ) -> Tuple[str, str]:
+        if not self.enabled:
+            return CAPABLE, "router_disabled"
+        if entities is not None and not entities.is_empty():
+            return CAPABLE, "entities"
+        if _TOOL_INTENT_RE.search(transcript):
+            return CAPABLE, "tool_intent"
+        words = _WORD_RE.findall(transcript.lower())
+        if not words or len(words) > self.short_turn_words:
+            return CAPABLE, "long_turn"
+        if not all(word in _SMALL_TALK_WORDS for word in words):
+            return CAPABLE, "open_question"
+        if context is not None and _booking_pending(context):
+            # "yes" to "shall I book 3 pm?" is the booking itself
+            return CAPABLE, "pending_confirmation"
+        return SMALL, "small_talk"
+
+
+def _booking_pending(context: ConversationContext) -> bool:
+    pinned = context.pinned
+    requested = "requested date" in pinned or "requested time" in pinned
+    return requested and "booked appointment" not in pinned
+
+
+model_router = ModelRouter(
+    load_tiers(settings.llm_tiers),
+    enabled=settings.llm_router_enabled,
+    short_turn_words=settings.llm_router_short_turn_words,
+)
@@ -0,0 +1,53 @@
+"""Latency analytics endpoints over the call log."""
+
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.api.auth import require_admin_token
+from src.database.analytics import ROLLUP_METRICS, call_detail, latency_summary, slowest_calls
+
+router = APIRouter(prefix="/analytics", dependencies=[Depends(require_admin_token)])
+
+DEFAULT_WINDOW = timedelta(hours=1)
+
+
+def _time_range(start: Optional[datetime], end: Optional[datetime]) -> Tuple[datetime, datetime]:
+    # Timestamps are stored as naive UTC
+    end = end or datetime.utcnow()
+    start = start or end - DEFAULT_WINDOW
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    return start.replace(tzinfo=None), end.replace(tzinfo=None)
+
+
+@router.get("/latency")
+async def latency(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    metric: str = "total",
+    window_minutes: Optional[int] = Query(None, ge=1, le=1440),
+) -> dict:
+    if metric not in ROLLUP_METRICS:
+        raise HTTPException(status_code=400, detail=f"metric must be one of {', '.join(ROLLUP_METRICS)}")
+    start, end = _time_range(start, end)
+    return await latency_summary(start, end, metric, window_minutes)
+
+
+@router.get("/slowest-calls")
+async def slowest(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(10, ge=1, le=100),
+) -> dict:
+    start, end = _time_range(start, end)
+    return {"start": start.isoformat(), "end": end.isoformat(), "calls": await slowest_calls(start, end, limit)}
+
+
+@router.get("/calls/{call_sid}")
+async def call(call_sid: str) -> dict:
+    detail = await call_detail(call_sid)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="call not found")
+    return detail
@@ -0,0 +1,22 @@
+"""Bearer-token checks for operator endpoints."""
+
+import hmac
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+from config.settings import settings
+
+
+def check_bearer(request: Request, token: Optional[str], enabled: bool = True, name: str = "admin") -> None:
+    """404 unless enabled with a token (the route stays hidden); 401 on a wrong token."""
+    if not (enabled and token):
+        raise HTTPException(status_code=404, detail="Not Found")
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        raise HTTPException(status_code=401, detail=f"invalid {name} token")
+
+
+def require_admin_token(request: Request) -> None:
+    """Router dependency for call data and diagnostics (transcripts, exports, per-call state)."""
+    check_bearer(request, settings.admin_token)
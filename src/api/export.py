@@ -0,0 +1,43 @@
+"""Bulk export endpoint streaming calls and transcripts."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from src.api.auth import require_admin_token
+from src.database.export import EXPORTS, FORMATS, export_filename, parse_call_sids, stream_export
+
+router = APIRouter(prefix="/export", dependencies=[Depends(require_admin_token)])
+
+MEDIA_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+
+@router.get("/{table}")
+async def export_table(
+    table: str,
+    format: str = "jsonl",
+    gzip: bool = False,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    call_sid: Optional[List[str]] = Query(None),
+) -> StreamingResponse:
+    if table not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"unknown export table: {table}")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(FORMATS)}")
+    body = stream_export(
+        table,
+        format,
+        gzip,
+        start.replace(tzinfo=None) if start else None,
+        end.replace(tzinfo=None) if end else None,
+        parse_call_sids(call_sid),
+    )
+    filename = export_filename(table, format, gzip)
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
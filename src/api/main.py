@@ -1,17 +1,66 @@
+import asyncio
+import time
+from typing import Optional
+
 from fastapi import FastAPI
 
 from config.settings import settings
+from src.api.analytics import router as analytics_router
+from src.api.export import router as export_router
 from src.api.routes import router
+from src.api.warmup import run_warmup
+from src.business.availability import availability_loop
 from src.database.db import init_db
-from src.utils.logger import get_logger
+from src.database.retention import retention_loop
+from src.telephony.admission import admission
+from src.telephony.supervisor import call_supervisor
+from src.utils.call_context import install_task_factory
+from src.utils.executors import shutdown_executors
+from src.utils.logger import get_logger, shutdown_logging
+from src.utils.loop_monitor import loop_monitor
 
 logger = get_logger(__name__)
 
+_IMPORTED_AT = time.monotonic()
+_warmup_task: Optional[asyncio.Task] = None
+_retention_task: Optional[asyncio.Task] = None
+_availability_task: Optional[asyncio.Task] = None
+
 app = FastAPI(title="AI Voice Bot", version="0.1.0", debug=settings.debug)
 app.include_router(router)
+app.include_router(analytics_router)
+app.include_router(export_router)
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
+    global _warmup_task, _retention_task, _availability_task
     logger.info("Starting AI Voice Bot in %s mode", settings.environment)
     init_db()
+    admission.lag_probe.start()
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+    if settings.call_supervisor_enabled:
+        call_supervisor.start()
+    if settings.profiler_enabled:
+        # Lets the profiler attribute CPU of per-call child tasks to their call
+        install_task_factory(asyncio.get_running_loop())
+    # Accept requests right away; /ready flips once warm-up is done
+    _warmup_task = asyncio.create_task(run_warmup())
+    if settings.retention_enabled:
+        _retention_task = asyncio.create_task(retention_loop())
+    # Loads upcoming appointments, then keeps the index in step with the database
+    _availability_task = asyncio.create_task(availability_loop())
+    logger.info("Startup finished %.0f ms after import", (time.monotonic() - _IMPORTED_AT) * 1000)
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    admission.lag_probe.stop()
+    loop_monitor.stop()
+    call_supervisor.stop()
+    for task in (_warmup_task, _retention_task, _availability_task):
+        if task and not task.done():
+            task.cancel()
+    shutdown_executors()
+    shutdown_logging()
@@ -1,20 +1,122 @@
-from fastapi import APIRouter, Request, Response, WebSocket
+import asyncio
+import threading
 
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, WebSocket
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from config.settings import settings
+
+from src.ai.prefetch import prefetch_stats
+from src.api.auth import check_bearer, require_admin_token
+from src.api.warmup import warmup_state
+from src.telephony.admission import admission
 from src.telephony.audio_stream import handle_audio_stream
-from src.telephony.twilio_handler import handle_incoming_call
+from src.telephony.supervisor import call_supervisor
+from src.telephony.twilio_handler import handle_busy_call, handle_incoming_call
+from src.utils.circuit_breaker import breaker_states
+from src.utils.executors import executor_stats
+from src.utils.logger import get_logger
+from src.utils.loop_monitor import loop_monitor
+from src.utils.profiler import ProfilerBusyError, profiler
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
 
 @router.get("/")
 async def root() -> dict:
-    return {"status": "ok", "message": "AI Voice Bot is running"}
+    breakers = breaker_states()
+    degraded = any(state["state"] != "closed" for state in breakers.values())
+    return {
+        "status": "degraded" if degraded else "ok",
+        "message": "AI Voice Bot is running",
+        "breakers": breakers,
+    }
+
+
+@router.get("/ready")
+async def ready() -> JSONResponse:
+    # Readiness probe: 503 until startup warm-up has finished
+    return JSONResponse(warmup_state.snapshot(), status_code=200 if warmup_state.ready else 503)
+
+
+@router.get("/metrics")
+async def metrics_endpoint() -> dict:
+    snapshot = metrics.snapshot()
+    snapshot["prefetch"] = prefetch_stats()
+    snapshot["executors"] = executor_stats()
+    snapshot["breakers"] = breaker_states()
+    return snapshot
+
+
+@router.get("/debug/loop", dependencies=[Depends(require_admin_token)])
+async def loop_debug(limit: int = 20) -> dict:
+    # Slowest loop callbacks by total blocked time, plus the most recent ones with stack samples
+    return loop_monitor.report(limit)
+
+
+@router.get("/debug/calls", dependencies=[Depends(require_admin_token)])
+async def calls_debug() -> dict:
+    # Per-call age, idle time, threads, queue depths and buffered-memory estimate
+    calls = sorted((r.as_dict() for r in call_supervisor.snapshot()), key=lambda r: -r["memory_bytes"])
+    return {
+        "calls": calls,
+        "memory_bytes": sum(call["memory_bytes"] for call in calls),
+        "idle_timeout_s": call_supervisor.idle_timeout,
+    }
+
+
+def _require_profiler_token(request: Request) -> None:
+    # Hidden unless explicitly enabled with a token
+    check_bearer(request, settings.profiler_token, settings.profiler_enabled, "profiler")
+
+
+@router.get("/debug/profile")
+async def profile_debug(
+    request: Request,
+    seconds: float = 10.0,
+    interval_ms: float = 5.0,
+    format: str = "collapsed",
+    by_call: bool = False,
+    wall: bool = False,
+    threads: str = "stt-stream",
+) -> Response:
+    # Sample the loop thread (and threads named by prefix) for N seconds
+    _require_profiler_token(request)
+    if format not in ("collapsed", "json"):
+        raise HTTPException(status_code=400, detail="format must be collapsed or json")
+    if not 0 < seconds <= settings.profiler_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be in (0, {settings.profiler_max_seconds:g}]")
+    try:
+        result = await asyncio.to_thread(
+            profiler.run,
+            seconds,
+            interval=max(interval_ms, 1.0) / 1000,
+            loop=asyncio.get_running_loop(),
+            loop_thread_id=threading.get_ident(),
+            thread_prefixes=[prefix for prefix in threads.split(",") if prefix],
+            by_call=by_call,
+            wall=wall,
+        )
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if format == "json":
+        return JSONResponse(result.as_dict())
+    return PlainTextResponse(result.collapsed())
 
 
 @router.post("/voice")
 async def voice_webhook(request: Request) -> Response:
     # Twilio posts call metadata here; we respond with TwiML
-    twiml = handle_incoming_call()
+    decision = admission.try_admit()
+    if decision.admitted:
+        form = await request.form()
+        twiml = handle_incoming_call(form.get("To"))
+    else:
+        logger.warning("Rejecting call (%s); load=%d", decision.reason, admission.load)
+        twiml = handle_busy_call()
     return Response(content=twiml, media_type="application/xml")
 
 
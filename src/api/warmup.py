@@ -0,0 +1,119 @@
+"""Startup warm-up: import heavy SDKs, connect shared clients, pre-synthesize audio.
+
+Runs as a background task after the app starts accepting requests. ``/ready``
+reports not-ready until it finishes, so a load balancer only routes calls to
+an instance whose first caller will not pay for imports, TLS handshakes,
+auth token fetches or greeting synthesis. Every phase is best-effort: a
+failure is logged and recorded, and the instance still becomes ready with
+the lazy per-call paths as fallback.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from config.prompts import APOLOGY, GREETING
+from config.settings import settings
+from src.ai import gemini_client
+from src.ai.gemini_client import GeminiClient
+from src.speech import google_stt, google_tts
+from src.speech.filler import filler_bank, phrase_cache
+from src.speech.google_stt import AsyncGoogleSTT, GoogleSTT
+from src.speech.google_tts import GoogleTTS
+from src.telephony import twilio_handler
+from src.utils.lazy import import_times
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+GOOGLE_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+
+class WarmupState:
+    """Progress of the startup warm-up, reported by ``/ready``."""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "phases_ms": dict(self.phases),
+            "imports_ms": dict(import_times),
+            "errors": dict(self.errors),
+        }
+
+
+warmup_state = WarmupState()
+
+
+def _load_modules() -> None:
+    for module in (
+        google_stt.speech,
+        google_tts.texttospeech,
+        gemini_client.genai,
+        twilio_handler.voice_response,
+    ):
+        module.load()
+
+
+def _fetch_credentials():
+    """Resolve application default credentials and fetch an access token once."""
+    import google.auth
+    from google.auth.transport.requests import Request
+
+    credentials, _ = google.auth.default(scopes=GOOGLE_SCOPES)
+    credentials.refresh(Request())
+    return credentials
+
+
+async def _warm_stt(credentials) -> None:
+    if settings.stt_backend == "async":
+        await AsyncGoogleSTT.warm_up(credentials)
+    else:
+        await asyncio.to_thread(GoogleSTT.warm_up, credentials)
+
+
+async def _preload_audio() -> None:
+    tts = GoogleTTS()
+    jobs = [phrase_cache.preload(tts, [GREETING, APOLOGY])]
+    if settings.filler_enabled:
+        jobs.append(filler_bank.load(tts))
+    await asyncio.gather(*jobs)
+
+
+async def _phase(state: WarmupState, name: str, coro) -> Any:
+    started = time.monotonic()
+    try:
+        return await coro
+    except Exception as exc:
+        state.errors[name] = str(exc)
+        logger.warning("Warm-up phase %s failed: %s", name, exc)
+        return None
+    finally:
+        elapsed = round((time.monotonic() - started) * 1000, 1)
+        state.phases[name] = elapsed
+        metrics.set_gauge(f"startup.{name}_ms", elapsed)
+
+
+async def run_warmup(state: WarmupState = warmup_state) -> None:
+    """Run every warm-up phase, then mark the instance ready."""
+    state.started_at = time.monotonic()
+    await _phase(state, "imports", asyncio.to_thread(_load_modules))
+    credentials = await _phase(state, "credentials", asyncio.to_thread(_fetch_credentials))
+    await asyncio.gather(
+        _phase(state, "stt_client", _warm_stt(credentials)),
+        _phase(state, "tts_client", asyncio.to_thread(GoogleTTS.warm_up, credentials)),
+        _phase(state, "gemini", asyncio.to_thread(GeminiClient.warm_up)),
+    )
+    # After the TTS client so synthesis reuses its warm channel
+    await _phase(state, "audio", _preload_audio())
+    total = round((time.monotonic() - state.started_at) * 1000, 1)
+    state.phases["total"] = total
+    metrics.set_gauge("startup.warmup_ms", total)
+    state.ready = True
+    logger.info("Warm-up finished in %.0f ms: %s", total, state.phases)
@@ -0,0 +1,433 @@
+"""In-memory appointment availability with atomic slot reservation.
+
+Bookable time is a grid of ``APPOINTMENT_SLOT_MINUTES`` slots between
+``APPOINTMENT_OPEN`` and ``APPOINTMENT_CLOSE`` on ``APPOINTMENT_WEEKDAYS``, for
+each resource in ``APPOINTMENT_RESOURCES``. ``AvailabilityIndex`` keeps, per
+(resource, day), an int bitmap of booked slots plus short holds keyed by
+call:
+
+- ``nearest`` answers "free slots near X" from the bitmaps alone: the same
+  day by distance from X, then following days by distance from X's time of
+  day. No database query is involved.
+- ``hold`` checks and claims a slot in one synchronous step. Every caller of
+  the index runs on the event loop, so two calls in this worker cannot both
+  claim a slot. Holds expire after ``APPOINTMENT_HOLD_SECONDS``, so offered
+  alternatives stay reserved for the caller while they decide.
+- ``reserve_slot`` holds, inserts the ``Appointment`` row, then marks the slot
+  booked. The partial unique index on confirmed rows settles races with
+  other workers; a conflict marks the slot booked here too.
+
+``availability_loop`` loads upcoming appointments at startup and then
+applies rows changed since the last refresh, including rows written by other
+workers or by staff, every ``APPOINTMENT_REFRESH_SECONDS``.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from datetime import time as dtime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from config.settings import settings
+from src.database.db import SessionLocal
+from src.database.models import Appointment
+from src.utils.executors import db_executor
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+DayKey = Tuple[str, date]
+ChangedRow = Tuple[int, str, datetime, str, datetime]  # id, resource, start, status, updated_at
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+
+_MONTH_DAY_RE = re.compile(r"\b([a-z]{3})[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b")
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?\b")
+_TIME_RE = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([ap])?\.?\s*m?\.?(?!\w)")
+
+
+class SlotUnavailableError(Exception):
+    """The requested slot is booked, held by another call, or outside opening hours."""
+
+
+@dataclass(frozen=True)
+class Slot:
+    resource: str
+    start: datetime
+
+    @property
+    def label(self) -> str:
+        """Speakable form, e.g. "Tuesday, March 5 at 3:30 PM"."""
+        clock = self.start.strftime("%I:%M %p").lstrip("0").replace(":00", "")
+        return f"{self.start:%A, %B} {self.start.day} at {clock}"
+
+    def as_dict(self) -> dict:
+        return {"resource": self.resource, "date": self.start.date().isoformat(), "time": f"{self.start:%H:%M}"}
+
+
+@dataclass
+class Hold:
+    owner: str
+    expires_at: float  # time.monotonic()
+
+
+# ── Parsing what the model passes to book_appointment ────────────────────
+
+
+def parse_date(text: str, today: date) -> Optional[date]:
+    """Resolve "today", "next friday", "March 5", "2025-03-05" or "3/5" to a date."""
+    text = text.lower().strip()
+    if "today" in text:
+        return today
+    if "tomorrow" in text:
+        return today + timedelta(days=1)
+    match = _ISO_DATE_RE.search(text)
+    if match:
+        try:
+            return date(*map(int, match.groups()))
+        except ValueError:
+            return None
+    for index, name in enumerate(WEEKDAYS):
+        if name in text:
+            # The coming one; today's weekday means a week from today
+            return today + timedelta(days=(index - today.weekday()) % 7 or 7)
+    month, day = None, None
+    match = _MONTH_DAY_RE.search(text)
+    if match and match.group(1) in MONTHS:
+        month, day = MONTHS.index(match.group(1)) + 1, int(match.group(2))
+    else:
+        match = _NUMERIC_DATE_RE.search(text)
+        if match:
+            month, day = int(match.group(1)), int(match.group(2))
+    if month is None:
+        return None
+    try:
+        candidate = date(today.year, month, day)
+    except ValueError:
+        return None
+    # "March 5" said in December means next year's
+    return candidate if candidate >= today else candidate.replace(year=today.year + 1)
+
+
+def parse_time(text: str) -> Optional[dtime]:
+    """Resolve "3pm", "3:30 p.m.", "15:00" or "noon" to a time of day."""
+    text = text.lower().strip()
+    if "noon" in text or "midday" in text:
+        return dtime(12, 0)
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if meridiem == "p" and hour < 12:
+        hour += 12
+    elif meridiem == "a" and hour == 12:
+        hour = 0
+    elif meridiem is None and 1 <= hour <= 7:
+        hour += 12  # "at 3" during business hours means the afternoon
+    if hour > 23 or minute > 59:
+        return None
+    return dtime(hour, minute)
+
+
+def parse_slot_time(date_text: str, time_text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    now = now or datetime.now()
+    day, clock = parse_date(date_text, now.date()), parse_time(time_text)
+    if day is None or clock is None:
+        return None
+    return datetime.combine(day, clock)
+
+
+def _parse_clock(value: str) -> dtime:
+    hour, minute = value.split(":")
+    return dtime(int(hour), int(minute))
+
+
+# ── Index ────────────────────────────────────────────────────────────────
+
+
+class AvailabilityIndex:
+    """Booked-slot bitmaps and holds per (resource, day); not thread-safe (loop only)."""
+
+    def __init__(
+        self,
+        resources: Sequence[str] = ("default",),
+        slot_minutes: int = 30,
+        open_time: dtime = dtime(9, 0),
+        close_time: dtime = dtime(17, 0),
+        weekdays: Sequence[int] = (0, 1, 2, 3, 4),
+        horizon_days: int = 28,
+        hold_seconds: float = 120.0,
+    ):
+        self.resources = tuple(resources)
+        self.slot = timedelta(minutes=slot_minutes)
+        self.open_time = open_time
+        self.weekdays = frozenset(weekdays)
+        self.horizon_days = horizon_days
+        self.hold_seconds = hold_seconds
+        open_minutes = open_time.hour * 60 + open_time.minute
+        close_minutes = close_time.hour * 60 + close_time.minute
+        self.slots_per_day = max(0, (close_minutes - open_minutes) // slot_minutes)
+        self._open_mask = (1 << self.slots_per_day) - 1
+        self._booked: Dict[DayKey, int] = {}
+        self._holds: Dict[DayKey, Dict[int, Hold]] = {}
+        # Appointment row id -> booked position, so cancellations clear the right bit
+        self._rows: Dict[int, Tuple[DayKey, int]] = {}
+        self.watermark: Optional[datetime] = None
+        self.loaded = False
+
+    @classmethod
+    def from_settings(cls) -> "AvailabilityIndex":
+        return cls(
+            resources=settings.appointment_resources,
+            slot_minutes=settings.appointment_slot_minutes,
+            open_time=_parse_clock(settings.appointment_open),
+            close_time=_parse_clock(settings.appointment_close),
+            weekdays=settings.appointment_weekdays,
+            horizon_days=settings.appointment_horizon_days,
+            hold_seconds=settings.appointment_hold_seconds,
+        )
+
+    # ── Slot arithmetic ────────────────────────────────────────────────
+
+    def slot_start(self, day: date, index: int) -> datetime:
+        return datetime.combine(day, self.open_time) + index * self.slot
+
+    def slot_index(self, start: datetime) -> Optional[int]:
+        """Position of ``start`` in its day's grid; None if not a bookable slot start."""
+        if start.weekday() not in self.weekdays:
+            return None
+        offset = start - datetime.combine(start.date(), self.open_time)
+        index, remainder = divmod(offset, self.slot)
+        if remainder or not 0 <= index < self.slots_per_day:
+            return None
+        return index
+
+    def _live_holds(self, key: DayKey, now: float) -> Dict[int, Hold]:
+        holds = self._holds.get(key)
+        if not holds:
+            return {}
+        for index in [i for i, hold in holds.items() if hold.expires_at <= now]:
+            del holds[index]
+        return holds
+
+    def free_mask(self, resource: str, day: date, owner: Optional[str] = None, now: Optional[float] = None) -> int:
+        """Bitmap of slots on ``day`` that ``owner`` could take (its own holds count as free)."""
+        if day.weekday() not in self.weekdays:
+            return 0
+        now = time.monotonic() if now is None else now
+        key = (resource, day)
+        mask = self._open_mask & ~self._booked.get(key, 0)
+        for index, hold in self._live_holds(key, now).items():
+            if hold.owner != owner:
+                mask &= ~(1 << index)
+        return mask
+
+    def is_free(self, slot: Slot, owner: Optional[str] = None) -> bool:
+        index = self.slot_index(slot.start)
+        if index is None:
+            return False
+        return bool(self.free_mask(slot.resource, slot.start.date(), owner) >> index & 1)
+
+    # ── Lookups ────────────────────────────────────────────────────────
+
+    def nearest(
+        self,
+        when: datetime,
+        limit: int = 3,
+        owner: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Slot]:
+        """Up to ``limit`` free slots: ``when``'s day first, then later days; closest in time first."""
+        started = time.perf_counter()
+        now = now or datetime.now()
+        clock = time.monotonic()
+        target = datetime.combine(when.date(), self.open_time)
+        # Fractional slot position of the requested time (may fall outside the grid)
+        position = (when - target) / self.slot
+        found: List[Slot] = []
+        first_day = max(when.date(), now.date())
+        for offset in range(self.horizon_days + 1):
+            day = first_day + timedelta(days=offset)
+            if day > now.date() + timedelta(days=self.horizon_days):
+                break
+            candidates = []
+            for resource in self.resources:
+                mask = self.free_mask(resource, day, owner, clock)
+                index = 0
+                while mask:
+                    if mask & 1:
+                        start = self.slot_start(day, index)
+                        if start >= now:
+                            candidates.append((abs(index - position), start, resource))
+                    mask >>= 1
+                    index += 1
+            for _, start, resource in sorted(candidates)[: limit - len(found)]:
+                found.append(Slot(resource, start))
+            if len(found) >= limit:
+                break
+        metrics.observe("availability.lookup_ms", (time.perf_counter() - started) * 1000)
+        return found
+
+    # ── Holds and bookings ─────────────────────────────────────────────
+
+    def hold(self, slot: Slot, owner: str, seconds: Optional[float] = None) -> Hold:
+        """Claim ``slot`` for ``owner`` or raise ``SlotUnavailableError`` (atomic on the loop)."""
+        index = self.slot_index(slot.start)
+        if index is None or slot.resource not in self.resources:
+            raise SlotUnavailableError(f"{slot.start} is outside opening hours")
+        if not self.is_free(slot, owner):
+            metrics.incr("availability.contention")
+            raise SlotUnavailableError(f"{slot.label} is taken")
+        hold = Hold(owner, time.monotonic() + (self.hold_seconds if seconds is None else seconds))
+        self._holds.setdefault((slot.resource, slot.start.date()), {})[index] = hold
+        return hold
+
+    def release(self, slot: Slot, owner: str) -> None:
+        index = self.slot_index(slot.start)
+        holds = self._holds.get((slot.resource, slot.start.date()), {})
+        if index is not None and index in holds and holds[index].owner == owner:
+            del holds[index]
+
+    def release_owner(self, owner: str) -> None:
+        """Drop every hold ``owner`` has (e.g. alternatives it was offered earlier)."""
+        for holds in self._holds.values():
+            for index in [i for i, hold in holds.items() if hold.owner == owner]:
+                del holds[index]
+
+    def hold_count(self) -> int:
+        now = time.monotonic()
+        return sum(len(self._live_holds(key, now)) for key in list(self._holds))
+
+    def mark_booked(self, slot: Slot, row_id: Optional[int] = None) -> None:
+        index = self.slot_index(slot.start)
+        if index is None:
+            return
+        key = (slot.resource, slot.start.date())
+        self._booked[key] = self._booked.get(key, 0) | 1 << index
+        if row_id is not None:
+            self._rows[row_id] = (key, index)
+
+    def apply(self, rows: Sequence[ChangedRow]) -> None:
+        """Apply appointment rows changed since the last refresh (idempotent)."""
+        for row_id, resource, start, status, updated_at in rows:
+            previous = self._rows.pop(row_id, None)
+            if previous is not None:
+                key, index = previous
+                self._booked[key] = self._booked.get(key, 0) & ~(1 << index)
+            if status == "confirmed":
+                self.mark_booked(Slot(resource, start), row_id)
+            if self.watermark is None or updated_at > self.watermark:
+                self.watermark = updated_at
+
+    def prune(self, today: date) -> None:
+        """Forget days that have passed."""
+        for key in [key for key in self._booked if key[1] < today]:
+            del self._booked[key]
+        for key in [key for key in self._holds if key[1] < today or not self._holds[key]]:
+            del self._holds[key]
+        for row_id in [row_id for row_id, (key, _) in self._rows.items() if key[1] < today]:
+            del self._rows[row_id]
+
+
+availability = AvailabilityIndex.from_settings()
+
+
+# ── Database side ────────────────────────────────────────────────────────
+
+
+def _fetch_changes(since: Optional[datetime], from_day: date) -> List[ChangedRow]:
+    session = SessionLocal()
+    try:
+        query = session.query(
+            Appointment.id, Appointment.resource, Appointment.start_time, Appointment.status, Appointment.updated_at
+        ).filter(Appointment.start_time >= datetime.combine(from_day, dtime.min))
+        if since is not None:
+            # >= so rows committed within the same timestamp are not missed; apply is idempotent
+            query = query.filter(Appointment.updated_at >= since)
+        return [tuple(row) for row in query.order_by(Appointment.updated_at).all()]
+    finally:
+        session.close()
+
+
+def _insert_appointment(slot: Slot, end: datetime, call_sid: Optional[str]) -> Optional[int]:
+    """Insert a confirmed appointment; None if another worker already booked the slot."""
+    session = SessionLocal()
+    try:
+        row = Appointment(
+            resource=slot.resource,
+            start_time=slot.start,
+            end_time=end,
+            call_sid=call_sid,
+            status="confirmed",
+            updated_at=datetime.utcnow(),
+        )
+        session.add(row)
+        session.commit()
+        return row.id
+    except IntegrityError:
+        session.rollback()
+        return None
+    finally:
+        session.close()
+
+
+async def refresh_availability(index: AvailabilityIndex = availability) -> int:
+    """Load (first run) or incrementally refresh ``index``; returns rows applied."""
+    started = time.monotonic()
+    today = datetime.now().date()
+    rows = await db_executor.run(_fetch_changes, index.watermark, today)
+    index.apply(rows)
+    index.prune(today)
+    index.loaded = True
+    metrics.observe("availability.refresh_ms", (time.monotonic() - started) * 1000)
+    metrics.set_gauge("availability.holds", index.hold_count())
+    return len(rows)
+
+
+async def availability_loop(index: AvailabilityIndex = availability) -> None:
+    """Load at startup, then refresh every ``APPOINTMENT_REFRESH_SECONDS`` until cancelled."""
+    while True:
+        try:
+            rows = await refresh_availability(index)
+            if rows:
+                logger.info("Availability index applied %d appointment changes", rows)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            metrics.incr("availability.refresh_errors")
+            logger.error("Availability refresh failed: %s", exc)
+        await asyncio.sleep(settings.appointment_refresh_seconds)
+
+
+async def reserve_slot(
+    start: datetime, owner: str, index: AvailabilityIndex = availability
+) -> Slot:
+    """Book the first resource free at ``start`` for ``owner``; raises ``SlotUnavailableError``."""
+    started = time.monotonic()
+    for resource in index.resources:
+        slot = Slot(resource, start)
+        try:
+            index.hold(slot, owner)
+        except SlotUnavailableError:
+            continue
+        try:
+            row_id = await db_executor.run(_insert_appointment, slot, start + index.slot, owner)
+        finally:
+            index.release(slot, owner)
+        if row_id is None:
+            # Booked by another worker since our last refresh
+            metrics.incr("availability.conflicts")
+            index.mark_booked(slot)
+            continue
+        index.mark_booked(slot, row_id)
+        index.release_owner(owner)
+        metrics.observe("availability.reserve_ms", (time.monotonic() - started) * 1000)
+        return slot
+    raise SlotUnavailableError(f"no resource free at {start}")
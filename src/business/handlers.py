@@ -1,10 +1,34 @@
 """Placeholder business logic implementations."""
 
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional
+
+from src.business.availability import (
+    AvailabilityIndex,
+    SlotUnavailableError,
+    availability,
+    parse_slot_time,
+    reserve_slot,
+)
+from src.business.tenants import DEFAULT_FAQS
+
+MAX_ALTERNATIVES = 3
 
 
 class BusinessHandlers:
-    """Mock business operations; replace with real integrations as needed."""
+    """Business operations; order lookups are still mocked."""
+
+    def __init__(
+        self,
+        faqs: Optional[Mapping[str, str]] = None,
+        call_sid: Optional[str] = None,
+        calendar: AvailabilityIndex = availability,
+    ):
+        # Per-tenant FAQ set
+        self.faqs = faqs if faqs is not None else DEFAULT_FAQS
+        # Holds on offered slots belong to the call
+        self.call_sid = call_sid or "anonymous"
+        self.calendar = calendar
 
     async def check_order_status(self, order_number: str) -> Dict[str, Any]:
         return {
@@ -15,20 +39,47 @@ class BusinessHandlers:
         }
 
     async def book_appointment(self, date: str, time: str) -> Dict[str, Any]:
+        start = parse_slot_time(date, time)
+        if start is None:
+            return {
+                "confirmed": False,
+                "date": date,
+                "time": time,
+                "message": "I couldn't tell which day and time you meant. When would you like to come in?",
+            }
+        try:
+            slot = await reserve_slot(start, self.call_sid, self.calendar)
+        except SlotUnavailableError:
+            return self._offer_alternatives(start, date, time)
         return {
             "confirmed": True,
+            **slot.as_dict(),
+            "message": f"Appointment booked for {slot.label}.",
+        }
+
+    def _offer_alternatives(self, start: datetime, date: str, time: str) -> Dict[str, Any]:
+        """Hold the nearest free slots for this call so they are still free when the caller picks."""
+        self.calendar.release_owner(self.call_sid)
+        alternatives = []
+        for slot in self.calendar.nearest(start, limit=MAX_ALTERNATIVES, owner=self.call_sid):
+            self.calendar.hold(slot, self.call_sid)
+            alternatives.append(slot)
+        if not alternatives:
+            message = "I'm sorry, there are no open appointments in the next few weeks."
+        else:
+            message = "That time isn't available. The closest open times are " + ", or ".join(
+                slot.label for slot in alternatives
+            ) + "."
+        return {
+            "confirmed": False,
             "date": date,
             "time": time,
-            "message": f"Appointment booked for {date} at {time}.",
+            "alternatives": [slot.as_dict() for slot in alternatives],
+            "message": message,
         }
 
     async def get_faq_answer(self, question: str) -> str:
-        faqs = {
-            "hours": "We're open 9 AM to 5 PM Monday to Friday.",
-            "returns": "Returns are accepted within 30 days with receipt.",
-            "shipping": "Free shipping on orders over fifty dollars.",
-        }
-        for key, answer in faqs.items():
+        for key, answer in self.faqs.items():
             if key in question.lower():
                 return answer
         return "I can help with that. Let me transfer you to a teammate."
@@ -0,0 +1,124 @@
+"""Per-tenant bot profiles keyed by the called Twilio number.
+
+One deployment serves several phone numbers. Each number maps to a
+``TenantProfile`` with its own system prompt, greeting, TTS voice, tool subset
+and FAQ set. Profiles are read from the JSON file at ``TENANT_PROFILES_PATH``::
+
+    {
+      "+15551230001": {
+        "name": "acme-dental",
+        "system_prompt": "You are the receptionist for Acme Dental...",
+        "greeting": "Thanks for calling Acme Dental!",
+        "voice": {"name": "en-US-Neural2-F", "language_code": "en-US"},
+        "tools": ["book_appointment", "get_faq_answer"],
+        "faqs": {"hours": "We're open 8 to 6 on weekdays."}
+      }
+    }
+
+Omitted fields fall back to ``DEFAULT_PROFILE``; numbers without a profile get
+the default profile itself.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from config.prompts import GREETING, SYSTEM_PROMPT
+from config.settings import settings
+from src.business.tools import AVAILABLE_TOOLS
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FAQS: Dict[str, str] = {
+    "hours": "We're open 9 AM to 5 PM Monday to Friday.",
+    "returns": "Returns are accepted within 30 days with receipt.",
+    "shipping": "Free shipping on orders over fifty dollars.",
+}
+
+ALL_TOOLS: Tuple[str, ...] = tuple(tool["name"] for tool in AVAILABLE_TOOLS)
+
+_NUMBER_RE = re.compile(r"[^\d+]")
+
+
+def normalize_number(number: Optional[str]) -> str:
+    """"+1 (555) 123-0001" -> "+15551230001"."""
+    return _NUMBER_RE.sub("", number or "")
+
+
+@dataclass(frozen=True)
+class VoiceProfile:
+    language_code: str = "en-US"
+    # A specific voice ("en-US-Neural2-F"); None lets Google pick by gender
+    name: Optional[str] = None
+    gender: str = "NEUTRAL"
+
+
+@dataclass(frozen=True)
+class TenantProfile:
+    key: str
+    system_prompt: str = SYSTEM_PROMPT
+    greeting: str = GREETING
+    voice: VoiceProfile = field(default_factory=VoiceProfile)
+    tools: Tuple[str, ...] = ALL_TOOLS
+    faqs: Mapping[str, str] = field(default_factory=lambda: dict(DEFAULT_FAQS))
+
+    @property
+    def tool_declarations(self) -> List[dict]:
+        return [tool for tool in AVAILABLE_TOOLS if tool["name"] in self.tools]
+
+    def allows_tool(self, tool_name: str) -> bool:
+        return tool_name in self.tools
+
+
+DEFAULT_PROFILE = TenantProfile(key="default")
+
+
+def profile_from_dict(number: str, data: Mapping[str, Any]) -> TenantProfile:
+    unknown = [name for name in data.get("tools", ()) if name not in ALL_TOOLS]
+    if unknown:
+        raise ValueError(f"unknown tools for {number}: {', '.join(unknown)}")
+    overrides: Dict[str, Any] = {"key": data.get("name") or normalize_number(number)}
+    if "system_prompt" in data:
+        overrides["system_prompt"] = data["system_prompt"]
+    if "greeting" in data:
+        overrides["greeting"] = data["greeting"]
+    if "voice" in data:
+        overrides["voice"] = VoiceProfile(**data["voice"])
+    if "tools" in data:
+        overrides["tools"] = tuple(data["tools"])
+    if "faqs" in data:
+        overrides["faqs"] = dict(data["faqs"])
+    return replace(DEFAULT_PROFILE, **overrides)
+
+
+class TenantRegistry:
+    """Resolve called numbers to profiles."""
+
+    def __init__(self, profiles: Optional[Dict[str, TenantProfile]] = None, default: TenantProfile = DEFAULT_PROFILE):
+        self.default = default
+        self._profiles = {normalize_number(number): profile for number, profile in (profiles or {}).items()}
+
+    @classmethod
+    def from_file(cls, path: Optional[str]) -> "TenantRegistry":
+        if not path:
+            return cls()
+        try:
+            raw = json.loads(Path(path).expanduser().read_text())
+            profiles = {number: profile_from_dict(number, data) for number, data in raw.items()}
+        except Exception as exc:
+            logger.error("Failed to load tenant profiles from %s: %s", path, exc)
+            return cls()
+        logger.info("Loaded %d tenant profiles", len(profiles))
+        return cls(profiles)
+
+    def resolve(self, called_number: Optional[str]) -> TenantProfile:
+        return self._profiles.get(normalize_number(called_number), self.default)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+tenants = TenantRegistry.from_file(settings.tenant_profiles_path)
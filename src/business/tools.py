@@ -17,14 +17,31 @@ AVAILABLE_TOOLS = [
     },
     {
         "name": "book_appointment",
-        "description": "Book an appointment for a customer",
+        "description": (
+            "Book an appointment for a customer. If the time is not available the result "
+            "lists the nearest open times to offer instead"
+        ),
         "parameters": {
             "type": "object",
             "properties": {
-                "date": {"type": "string", "description": "Requested appointment date"},
-                "time": {"type": "string", "description": "Requested appointment time"},
+                "date": {"type": "string", "description": "Requested date, e.g. tomorrow, Friday or March 5"},
+                "time": {"type": "string", "description": "Requested time, e.g. 3 PM or 15:30"},
             },
             "required": ["date", "time"],
         },
     },
+    {
+        "name": "get_faq_answer",
+        "description": "Answer a common question such as opening hours, returns or shipping",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "question": {"type": "string", "description": "The customer's question"},
+            },
+            "required": ["question"],
+        },
+    },
 ]
+
+# Tools that only read state and are safe to run speculatively before the model asks
+SIDE_EFFECT_FREE_TOOLS = frozenset({"check_order_status", "get_faq_answer"})
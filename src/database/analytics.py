@@ -0,0 +1,252 @@
+"""Read path over call logs: latency percentiles, slowest calls, call detail.
+
+Window percentiles come from ``latency_rollups``, a per-minute histogram
+updated in the same transaction as each ``call_metrics`` insert, so their
+cost depends on the window length rather than on table size. Percentiles are
+reported as the upper bound of the histogram bucket they fall in, or as
+``">60000"`` when they fall past the last bound. Slowest
+calls and call detail read ``call_metrics``/``conversations`` through the
+``(created_at)`` and ``(call_sid, created_at)`` indexes.
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import desc, func
+
+from src.database.db import SessionLocal
+from src.database.models import Call, CallMetrics, Conversation, LatencyRollup
+from src.utils.executors import db_executor
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Histogram bucket upper bounds; anything slower lands in the overflow bucket
+LATENCY_BUCKETS_MS = (
+    50, 100, 150, 200, 300, 400, 500, 750, 1000, 1250, 1500, 2000,
+    2500, 3000, 4000, 5000, 7500, 10000, 15000, 30000, 60000,
+)
+OVERFLOW_BUCKET_MS = LATENCY_BUCKETS_MS[-1] + 1
+# llm_<tier>: first LLM call of a turn, per model tier (see src.ai.router)
+ROLLUP_METRICS = ("stt", "llm", "tts", "total", "llm_small", "llm_capable")
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+
+def bucket_for(latency_ms: int) -> int:
+    index = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+    return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else OVERFLOW_BUCKET_MS
+
+
+def bucket_label(bucket: int) -> Union[int, str]:
+    """The overflow bucket has no upper bound to report."""
+    return f">{LATENCY_BUCKETS_MS[-1]}" if bucket >= OVERFLOW_BUCKET_MS else bucket
+
+
+def minute_of(moment: datetime) -> datetime:
+    return moment.replace(second=0, microsecond=0)
+
+
+# ── Incremental rollups ──────────────────────────────────────────────────
+
+
+def _upsert_statement(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
+
+
+def record_rollups(session, created_at: datetime, latencies: Dict[str, Optional[int]]) -> None:
+    """Add one observation per metric to the minute's histogram (caller commits)."""
+    minute = minute_of(created_at)
+    table = LatencyRollup.__table__
+    insert = _upsert_statement(session.get_bind().dialect.name)
+    for metric, value in latencies.items():
+        if value is None:
+            continue
+        key = {"minute": minute, "metric": metric, "bucket": bucket_for(value)}
+        if insert is not None:
+            statement = insert(table).values(count=1, sum_ms=value, **key)
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["minute", "metric", "bucket"],
+                    set_={"count": table.c.count + 1, "sum_ms": table.c.sum_ms + value},
+                )
+            )
+            continue
+        updated = (
+            session.query(LatencyRollup)
+            .filter_by(**key)
+            .update(
+                {LatencyRollup.count: LatencyRollup.count + 1, LatencyRollup.sum_ms: LatencyRollup.sum_ms + value},
+                synchronize_session=False,
+            )
+        )
+        if not updated:
+            session.add(LatencyRollup(count=1, sum_ms=value, **key))
+
+
+# ── Queries ──────────────────────────────────────────────────────────────
+
+
+def _percentile_from_histogram(histogram: Dict[int, int], pct: float) -> Optional[Union[int, str]]:
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = pct / 100.0 * total
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= rank:
+            return bucket_label(bucket)
+    return bucket_label(max(histogram))
+
+
+def _summarize(histogram: Dict[int, int], sum_ms: int) -> Dict[str, Any]:
+    count = sum(histogram.values())
+    summary: Dict[str, Any] = {"count": count, "mean_ms": round(sum_ms / count, 1) if count else None}
+    for pct in REPORTED_PERCENTILES:
+        summary[f"p{pct}_ms"] = _percentile_from_histogram(histogram, pct)
+    return summary
+
+
+def _accumulate(rows: Iterable[Tuple[int, int, int]]) -> Tuple[Dict[int, int], int]:
+    histogram: Dict[int, int] = {}
+    total = 0
+    for bucket, count, sum_ms in rows:
+        histogram[bucket] = histogram.get(bucket, 0) + count
+        total += sum_ms
+    return histogram, total
+
+
+def _latency_summary_sync(
+    start: datetime, end: datetime, metric: str = "total", window_minutes: Optional[int] = None
+) -> Dict[str, Any]:
+    session = SessionLocal()
+    try:
+        rows = (
+            session.query(LatencyRollup.minute, LatencyRollup.bucket, LatencyRollup.count, LatencyRollup.sum_ms)
+            .filter(
+                LatencyRollup.metric == metric,
+                LatencyRollup.minute >= minute_of(start),
+                LatencyRollup.minute < end,
+            )
+            .all()
+        )
+    finally:
+        session.close()
+
+    result: Dict[str, Any] = {
+        "metric": metric,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "overall": _summarize(*_accumulate((bucket, count, sum_ms) for _, bucket, count, sum_ms in rows)),
+    }
+    if window_minutes:
+        width = timedelta(minutes=window_minutes)
+        grouped: Dict[datetime, List[Tuple[int, int, int]]] = {}
+        origin = minute_of(start)
+        for minute, bucket, count, sum_ms in rows:
+            window_start = origin + width * ((minute - origin) // width)
+            grouped.setdefault(window_start, []).append((bucket, count, sum_ms))
+        result["windows"] = [
+            {"start": window_start.isoformat(), **_summarize(*_accumulate(grouped[window_start]))}
+            for window_start in sorted(grouped)
+        ]
+    return result
+
+
+def _slowest_calls_sync(start: datetime, end: datetime, limit: int = 10) -> List[Dict[str, Any]]:
+    session = SessionLocal()
+    try:
+        worst = func.max(CallMetrics.total_latency).label("max_total_ms")
+        rows = (
+            session.query(
+                CallMetrics.call_sid,
+                worst,
+                func.avg(CallMetrics.total_latency).label("avg_total_ms"),
+                func.count(CallMetrics.id).label("turns"),
+            )
+            .filter(CallMetrics.created_at >= start, CallMetrics.created_at < end)
+            .group_by(CallMetrics.call_sid)
+            .order_by(desc(worst))
+            .limit(limit)
+            .all()
+        )
+    finally:
+        session.close()
+    return [
+        {
+            "call_sid": row.call_sid,
+            "max_total_ms": row.max_total_ms,
+            "avg_total_ms": round(float(row.avg_total_ms), 1) if row.avg_total_ms is not None else None,
+            "turns": row.turns,
+        }
+        for row in rows
+    ]
+
+
+def _call_detail_sync(call_sid: str) -> Optional[Dict[str, Any]]:
+    session = SessionLocal()
+    try:
+        call = session.query(Call).filter(Call.call_sid == call_sid).first()
+        if call is None:
+            return None
+        messages = (
+            session.query(Conversation)
+            .filter(Conversation.call_sid == call_sid)
+            .order_by(Conversation.timestamp)
+            .all()
+        )
+        turns = (
+            session.query(CallMetrics)
+            .filter(CallMetrics.call_sid == call_sid)
+            .order_by(CallMetrics.created_at)
+            .all()
+        )
+        return {
+            "call_sid": call.call_sid,
+            "start_time": call.start_time.isoformat() if call.start_time else None,
+            "end_time": call.end_time.isoformat() if call.end_time else None,
+            "duration": call.duration,
+            "status": call.status,
+            "recording_path": call.recording_path,
+            "transcript": [
+                {"timestamp": m.timestamp.isoformat() if m.timestamp else None, "role": m.role, "message": m.message}
+                for m in messages
+            ],
+            "metrics": [
+                {
+                    "created_at": t.created_at.isoformat() if t.created_at else None,
+                    "stt_ms": t.stt_latency,
+                    "llm_ms": t.llm_latency,
+                    "tts_ms": t.tts_latency,
+                    "total_ms": t.total_latency,
+                    "payload": t.payload,
+                }
+                for t in turns
+            ],
+        }
+    finally:
+        session.close()
+
+
+# ── Async wrappers ───────────────────────────────────────────────────────
+
+
+async def latency_summary(
+    start: datetime, end: datetime, metric: str = "total", window_minutes: Optional[int] = None
+) -> Dict[str, Any]:
+    return await db_executor.run(_latency_summary_sync, start, end, metric, window_minutes)
+
+
+async def slowest_calls(start: datetime, end: datetime, limit: int = 10) -> List[Dict[str, Any]]:
+    return await db_executor.run(_slowest_calls_sync, start, end, limit)
+
+
+async def call_detail(call_sid: str) -> Optional[Dict[str, Any]]:
+    return await db_executor.run(_call_detail_sync, call_sid)
@@ -1,11 +1,12 @@
 """Async-safe database logging helpers for call lifecycle and metrics."""
 
-import asyncio
 from datetime import datetime
 from typing import Optional
 
+from src.database.analytics import record_rollups
 from src.database.db import SessionLocal
 from src.database.models import Call, CallMetrics, Conversation
+from src.utils.executors import db_executor
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +46,22 @@ def _log_call_end_sync(call_sid: str) -> None:
         session.close()
 
 
+def _log_recording_sync(call_sid: str, path: str) -> None:
+    session = SessionLocal()
+    try:
+        call = session.query(Call).filter(Call.call_sid == call_sid).first()
+        if call:
+            call.recording_path = path
+            session.commit()
+        else:
+            logger.warning("No call row found for %s; recording %s not linked", call_sid, path)
+    except Exception as exc:
+        session.rollback()
+        logger.error("DB log_recording failed: %s", exc)
+    finally:
+        session.close()
+
+
 def _log_message_sync(
     call_sid: str, role: str, message: str, intent: Optional[str] = None
 ) -> None:
@@ -73,8 +90,10 @@ def _log_metrics_sync(
     llm_latency: Optional[int] = None,
     tts_latency: Optional[int] = None,
     total_latency: Optional[int] = None,
+    payload: Optional[dict] = None,
 ) -> None:
     session = SessionLocal()
+    created_at = datetime.utcnow()
     try:
         session.add(
             CallMetrics(
@@ -83,9 +102,14 @@ def _log_metrics_sync(
                 llm_latency=llm_latency,
                 tts_latency=tts_latency,
                 total_latency=total_latency,
-                created_at=datetime.utcnow(),
+                payload=payload,
+                created_at=created_at,
             )
         )
+        latencies = {"stt": stt_latency, "llm": llm_latency, "tts": tts_latency, "total": total_latency}
+        if payload and payload.get("llm_tier"):
+            latencies[f"llm_{payload['llm_tier']}"] = payload.get("llm_tier_ms")
+        record_rollups(session, created_at, latencies)
         session.commit()
     except Exception as exc:
         session.rollback()
@@ -98,17 +122,21 @@ def _log_metrics_sync(
 
 
 async def log_call_start(call_sid: str) -> None:
-    await asyncio.to_thread(_log_call_start_sync, call_sid)
+    await db_executor.run(_log_call_start_sync, call_sid)
 
 
 async def log_call_end(call_sid: str) -> None:
-    await asyncio.to_thread(_log_call_end_sync, call_sid)
+    await db_executor.run(_log_call_end_sync, call_sid)
+
+
+async def log_recording(call_sid: str, path: str) -> None:
+    await db_executor.run(_log_recording_sync, call_sid, path)
 
 
 async def log_message(
     call_sid: str, role: str, message: str, intent: Optional[str] = None
 ) -> None:
-    await asyncio.to_thread(_log_message_sync, call_sid, role, message, intent)
+    await db_executor.run(_log_message_sync, call_sid, role, message, intent)
 
 
 async def log_metrics(
@@ -117,7 +145,8 @@ async def log_metrics(
     llm_latency: Optional[int] = None,
     tts_latency: Optional[int] = None,
     total_latency: Optional[int] = None,
+    payload: Optional[dict] = None,
 ) -> None:
-    await asyncio.to_thread(
-        _log_metrics_sync, call_sid, stt_latency, llm_latency, tts_latency, total_latency
+    await db_executor.run(
+        _log_metrics_sync, call_sid, stt_latency, llm_latency, tts_latency, total_latency, payload
     )
@@ -1,6 +1,6 @@
 """Database session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
 from config.settings import settings
@@ -19,6 +19,32 @@ def get_db():
         db.close()
 
 
-def init_db() -> None:
+def _add_missing_columns(bind) -> None:
+    """Add nullable columns introduced since a table was created.
+
+    ``create_all`` never alters existing tables. Only nullable columns are
+    added; anything else needs a real migration.
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=bind.dialect)
+            with bind.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+
+def init_db(bind=None) -> None:
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    _add_missing_columns(bind)
+    # create_all skips tables that already exist; add indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -10,6 +10,7 @@ Base = declarative_base()
 
 class Call(Base):
     __tablename__ = "calls"
+    __table_args__ = (Index("ix_calls_start_time", "start_time"),)
 
     id = Column(Integer, primary_key=True, index=True)
     call_sid = Column(String, unique=True, index=True)
@@ -18,10 +19,15 @@ class Call(Base):
     end_time = Column(DateTime, nullable=True)
     duration = Column(Integer, nullable=True)  # seconds
     status = Column(String, default="active")
+    recording_path = Column(String, nullable=True)
 
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index("ix_conversations_call_sid_timestamp", "call_sid", "timestamp"),
+        Index("ix_conversations_timestamp", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     call_sid = Column(String, index=True)
@@ -33,6 +39,10 @@ class Conversation(Base):
 
 class CallMetrics(Base):
     __tablename__ = "call_metrics"
+    __table_args__ = (
+        Index("ix_call_metrics_call_sid_created_at", "call_sid", "created_at"),
+        Index("ix_call_metrics_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     call_sid = Column(String, index=True)
@@ -42,3 +52,52 @@ class CallMetrics(Base):
     total_latency = Column(Integer, nullable=True)
     payload = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class LatencyRollup(Base):
+    """Per-minute latency histogram: one row per (minute, metric, bucket).
+
+    Maintained incrementally as metrics are logged, so window percentiles
+    read a few hundred rows instead of scanning ``call_metrics``.
+    """
+
+    __tablename__ = "latency_rollups"
+    __table_args__ = (
+        UniqueConstraint("minute", "metric", "bucket", name="uq_latency_rollups_minute_metric_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    minute = Column(DateTime, nullable=False)
+    metric = Column(String, nullable=False)  # stt, llm, tts or total
+    bucket = Column(Integer, nullable=False)  # upper bound in ms (see analytics.LATENCY_BUCKETS_MS)
+    count = Column(Integer, nullable=False, default=0)
+    sum_ms = Column(Integer, nullable=False, default=0)
+
+
+class Appointment(Base):
+    """A booked slot; at most one confirmed row per resource and start time.
+
+    The partial unique index is what stops two workers double booking a slot.
+    """
+
+    __tablename__ = "appointments"
+    __table_args__ = (
+        Index(
+            "uq_appointments_resource_start_confirmed",
+            "resource",
+            "start_time",
+            unique=True,
+            sqlite_where=text("status = 'confirmed'"),
+            postgresql_where=text("status = 'confirmed'"),
+        ),
+        Index("ix_appointments_updated_at", "updated_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    resource = Column(String, nullable=False)
+    start_time = Column(DateTime, nullable=False)  # business-local time
+    end_time = Column(DateTime, nullable=False)
+    call_sid = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="confirmed")  # confirmed or cancelled
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,185 @@
+"""Retention: move old log rows into compressed, date-partitioned archive files.
+
+Rows older than ``RETENTION_DAYS`` are archived oldest first, one small batch
+per transaction: the batch is appended to
+``<RETENTION_ARCHIVE_DIR>/<table>/<YYYY-MM-DD>.jsonl.gz`` (one gzip member
+per batch) and fsynced, then deleted by primary key. Short transactions keep
+the hot-path inserts from ``call_logger`` from waiting on long locks. If the
+job dies between the write and the delete, the batch is archived again on the
+next run, so archives may hold duplicates but never lose rows.
+
+Per-minute latency rollups are not archived; they are small and keep the
+analytics endpoints working for archived periods.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, select
+
+from config.settings import settings
+from src.database.db import SessionLocal
+from src.database.export import row_to_dict
+from src.database.models import Call, CallMetrics, Conversation
+from src.utils.executors import db_executor
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+# table name -> (table, timestamp column that decides age)
+ARCHIVED_TABLES = {
+    "conversations": (Conversation.__table__, Conversation.__table__.c.timestamp),
+    "call_metrics": (CallMetrics.__table__, CallMetrics.__table__.c.created_at),
+    "calls": (Call.__table__, Call.__table__.c.start_time),
+}
+
+
+@dataclass
+class RetentionReport:
+    cutoff: datetime
+    rows: Dict[str, int] = field(default_factory=dict)
+    files: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(self.rows.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "cutoff": self.cutoff.isoformat(),
+            "rows": dict(self.rows),
+            "total": self.total,
+            "files": sorted(self.files),
+            "seconds": round(self.seconds, 2),
+        }
+
+
+def _write_partitions(archive_dir: Path, table_name: str, partitions: Dict[str, List[dict]]) -> List[str]:
+    written = []
+    for day, records in partitions.items():
+        path = archive_dir / table_name / f"{day}.jsonl.gz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as archive:
+                archive.write("".join(json.dumps(record) + "\n" for record in records).encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        written.append(os.fspath(path))
+    return written
+
+
+def archive_batch(
+    table_name: str, cutoff: datetime, batch_size: int, archive_dir: Path
+) -> Tuple[int, List[str]]:
+    """Archive and delete up to ``batch_size`` of the oldest expired rows."""
+    table, timestamp = ARCHIVED_TABLES[table_name]
+    columns = [column.name for column in table.columns]
+    query = select(table).where(timestamp < cutoff)
+    if table_name == "calls":
+        query = query.where(table.c.status != "active")
+    session = SessionLocal()
+    try:
+        rows = session.execute(query.order_by(timestamp, table.c.id).limit(batch_size)).all()
+        if not rows:
+            return 0, []
+        partitions: Dict[str, List[dict]] = {}
+        for row in rows:
+            moment = row._mapping[timestamp.name]
+            day = moment.strftime("%Y-%m-%d") if moment else "undated"
+            partitions.setdefault(day, []).append(row_to_dict(columns, row))
+        files = _write_partitions(archive_dir, table_name, partitions)
+        session.execute(delete(table).where(table.c.id.in_([row.id for row in rows])))
+        session.commit()
+        return len(rows), files
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _settings_or(
+    max_age_days: Optional[int], batch_size: Optional[int], archive_dir: Optional[str]
+) -> Tuple[datetime, int, Path]:
+    days = settings.retention_days if max_age_days is None else max_age_days
+    return (
+        datetime.utcnow() - timedelta(days=days),
+        batch_size or settings.retention_batch_size,
+        Path(archive_dir or settings.retention_archive_dir),
+    )
+
+
+def _finish(report: RetentionReport, started: float) -> RetentionReport:
+    report.seconds = time.monotonic() - started
+    for table_name, count in report.rows.items():
+        metrics.incr(f"retention.{table_name}.rows_archived", count)
+    metrics.set_gauge("retention.last_run_rows", report.total)
+    logger.info("Retention archived %d rows in %.1fs: %s", report.total, report.seconds, report.rows)
+    return report
+
+
+def run_retention_sync(
+    max_age_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+    tables: Sequence[str] = tuple(ARCHIVED_TABLES),
+    pause: Optional[float] = None,
+) -> RetentionReport:
+    """Archive every expired row of ``tables`` (blocking; for scripts)."""
+    cutoff, batch_size, directory = _settings_or(max_age_days, batch_size, archive_dir)
+    pause = settings.retention_batch_pause if pause is None else pause
+    report, started = RetentionReport(cutoff=cutoff), time.monotonic()
+    for table_name in tables:
+        report.rows[table_name] = 0
+        while True:
+            moved, files = archive_batch(table_name, cutoff, batch_size, directory)
+            report.rows[table_name] += moved
+            report.files.extend(f for f in files if f not in report.files)
+            if moved < batch_size:
+                break
+            time.sleep(pause)
+    return _finish(report, started)
+
+
+async def run_retention(
+    max_age_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+    tables: Sequence[str] = tuple(ARCHIVED_TABLES),
+) -> RetentionReport:
+    """Same as ``run_retention_sync`` with each batch as its own db executor job,
+    so call logging interleaves with the archival instead of queueing behind it."""
+    cutoff, batch_size, directory = _settings_or(max_age_days, batch_size, archive_dir)
+    report, started = RetentionReport(cutoff=cutoff), time.monotonic()
+    for table_name in tables:
+        report.rows[table_name] = 0
+        while True:
+            moved, files = await db_executor.run(archive_batch, table_name, cutoff, batch_size, directory)
+            report.rows[table_name] += moved
+            report.files.extend(f for f in files if f not in report.files)
+            if moved < batch_size:
+                break
+            await asyncio.sleep(settings.retention_batch_pause)
+    return _finish(report, started)
+
+
+async def retention_loop() -> None:
+    """Run retention every ``RETENTION_INTERVAL_HOURS`` until cancelled."""
+    while True:
+        try:
+            await run_retention()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            metrics.incr("retention.errors")
+            logger.error("Retention run failed: %s", exc)
+        await asyncio.sleep(settings.retention_interval_hours * 3600)
@@ -1,7 +1,8 @@
 """Audio utility helpers."""
 
 import base64
-from typing import Optional
+
+from src.speech.dsp import mulaw_to_pcm16, normalize_gain, pcm16_to_mulaw, resample
 
 
 def decode_base64_audio(payload: str) -> bytes:
@@ -14,6 +15,18 @@ def encode_base64_audio(audio: bytes) -> str:
     return base64.b64encode(audio).decode()
 
 
-def normalize_audio(audio: bytes, expected_rate: int = 8000) -> bytes:
-    """Placeholder for audio normalization/conversion."""
-    return audio
+def normalize_audio(
+    audio: bytes,
+    expected_rate: int = 8000,
+    source_rate: int = 8000,
+    source_encoding: str = "mulaw",
+) -> bytes:
+    """Convert MULAW or LINEAR16 audio to gain-normalized MULAW at ``expected_rate``."""
+    if not audio:
+        return b""
+    if source_encoding == "mulaw":
+        pcm = mulaw_to_pcm16(audio)
+    else:
+        pcm = audio[: len(audio) // 2 * 2]
+    pcm = resample(pcm, source_rate, expected_rate)
+    return pcm16_to_mulaw(normalize_gain(pcm))
@@ -0,0 +1,201 @@
+"""Vectorized audio DSP: G.711 mu-law codec, polyphase resampling, gain control.
+
+All functions work on whole buffers with NumPy; there are no per-sample
+Python loops. PCM audio is mono signed 16-bit little-endian (``np.int16``).
+"""
+
+from functools import lru_cache
+from math import gcd
+from typing import Tuple, Union
+
+import numpy as np
+
+PCMLike = Union[bytes, bytearray, memoryview, np.ndarray]
+
+_MULAW_BIAS = 0x84
+_MULAW_CLIP = 32635
+_INT16_MAX = 32767
+_MULAW_SEGMENT_ENDS = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+
+
+def _build_decode_table() -> np.ndarray:
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    sign = codes & 0x80
+    exponent = (codes >> 4) & 0x07
+    mantissa = codes & 0x0F
+    magnitude = (((mantissa << 3) + _MULAW_BIAS) << exponent) - _MULAW_BIAS
+    return np.where(sign, -magnitude, magnitude).astype(np.int16)
+
+
+def _build_encode_table() -> np.ndarray:
+    """Map every int16 value (indexed via its uint16 bit pattern) to a mu-law byte.
+
+    Follows the reference G.711 encoder, which works on 14-bit magnitudes.
+    """
+    samples = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(samples), _MULAW_CLIP >> 2) + (_MULAW_BIAS >> 2)
+    segment = np.searchsorted(_MULAW_SEGMENT_ENDS, magnitude, side="left")
+    code = (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+    code = np.where(segment >= 8, 0x7F, code)  # beyond the last segment: clip to max
+    return (code ^ mask).astype(np.uint8)
+
+
+MULAW_DECODE_TABLE = _build_decode_table()
+MULAW_ENCODE_TABLE = _build_encode_table()
+
+
+def as_pcm16(audio: PCMLike) -> np.ndarray:
+    """View raw little-endian PCM16 bytes (or an array) as ``np.int16``."""
+    if isinstance(audio, np.ndarray):
+        return audio.astype(np.int16, copy=False)
+    return np.frombuffer(audio, dtype="<i2")
+
+
+def mulaw_to_pcm16(audio: bytes) -> np.ndarray:
+    """Decode G.711 mu-law bytes to PCM16 samples."""
+    return MULAW_DECODE_TABLE[np.frombuffer(audio, dtype=np.uint8)]
+
+
+def pcm16_to_mulaw(pcm: PCMLike) -> bytes:
+    """Encode PCM16 samples to G.711 mu-law bytes."""
+    return MULAW_ENCODE_TABLE[as_pcm16(pcm).view(np.uint16)].tobytes()
+
+
+def strip_wav_header(audio: bytes) -> Tuple[bytes, int]:
+    """Return ``(pcm_bytes, sample_rate)`` for RIFF/WAV input; ``(audio, 0)`` otherwise.
+
+    Google TTS wraps LINEAR16 output in a WAV container.
+    """
+    if len(audio) < 12 or audio[:4] != b"RIFF" or audio[8:12] != b"WAVE":
+        return audio, 0
+    offset, rate = 12, 0
+    while offset + 8 <= len(audio):
+        chunk_id = audio[offset : offset + 4]
+        size = int.from_bytes(audio[offset + 4 : offset + 8], "little")
+        if chunk_id == b"fmt ":
+            rate = int.from_bytes(audio[offset + 12 : offset + 16], "little")
+        elif chunk_id == b"data":
+            return audio[offset + 8 : offset + 8 + size], rate
+        offset += 8 + size + (size & 1)
+    return b"", rate
+
+
+# ── Resampling ───────────────────────────────────────────────────────────
+
+
+_HALF_WIDTH = 8  # filter half-length in zero crossings
+
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into ``up`` phases, shape ``(up, taps)``."""
+    factor = max(up, down)
+    length = 2 * _HALF_WIDTH * factor + 1
+    n = np.arange(length) - (length - 1) / 2
+    taps = np.sinc(n / factor) * np.kaiser(length, 6.0)
+    taps *= up / taps.sum()  # zero-stuffing by ``up`` divides the DC level by ``up``
+    taps_per_phase = -(-length // up)
+    padded = np.zeros(up * taps_per_phase)
+    padded[:length] = taps
+    # phases[p, k] = h[p + k * up]
+    return padded.reshape(taps_per_phase, up).T.copy()
+
+
+def _ratio(from_rate: int, to_rate: int) -> Tuple[int, int]:
+    g = gcd(from_rate, to_rate)
+    return to_rate // g, from_rate // g
+
+
+def _apply_polyphase(
+    padded: np.ndarray, phases: np.ndarray, up: int, down: int, start: int, count: int
+) -> np.ndarray:
+    """Compute ``count`` outputs at upsampled positions ``start, start+down, ...``."""
+    positions = start + np.arange(count) * down
+    base = positions // up
+    windows = padded[base[:, None] - np.arange(phases.shape[1])[None, :]]
+    return np.einsum("ij,ij->i", windows, phases[positions % up])
+
+
+def _to_int16(samples: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(samples), -_INT16_MAX - 1, _INT16_MAX).astype(np.int16)
+
+
+def resample(pcm: PCMLike, from_rate: int, to_rate: int) -> np.ndarray:
+    """Resample a complete PCM16 buffer (zero-phase; output aligned with input)."""
+    samples = as_pcm16(pcm)
+    if from_rate == to_rate or samples.size == 0:
+        return samples.copy()
+    up, down = _ratio(from_rate, to_rate)
+    phases = _polyphase_filter(up, down)
+    taps = phases.shape[1]
+    padded = np.concatenate(
+        (np.zeros(taps - 1), samples.astype(np.float64), np.zeros(taps))
+    )
+    delay = _HALF_WIDTH * max(up, down)  # centre of the filter, in upsampled units
+    count = -(-samples.size * up // down)
+    return _to_int16(_apply_polyphase(padded, phases, up, down, (taps - 1) * up + delay, count))
+
+
+class Resampler:
+    """Streaming polyphase resampler that carries filter state across chunks.
+
+    Output is delayed by half the filter length (well under a millisecond at
+    telephony rates), which lets 20 ms frames be converted one at a time
+    without edge artifacts.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int):
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        self.up, self.down = _ratio(from_rate, to_rate)
+        self._phases = _polyphase_filter(self.up, self.down)
+        taps = self._phases.shape[1]
+        self._history = np.zeros(taps - 1)
+        self._position = (taps - 1) * self.up
+
+    def process(self, pcm: PCMLike) -> np.ndarray:
+        samples = as_pcm16(pcm)
+        if self.up == self.down:
+            return samples.copy()
+        padded = np.concatenate((self._history, samples.astype(np.float64)))
+        last = padded.size - 1
+        count = max(0, (last * self.up - self._position) // self.down + 1)
+        out = _apply_polyphase(padded, self._phases, self.up, self.down, self._position, count)
+        keep = self._history.size
+        consumed = padded.size - keep
+        self._history = padded[consumed:] if keep else padded[:0]
+        self._position += count * self.down - consumed * self.up
+        return _to_int16(out)
+
+
+# ── Gain ─────────────────────────────────────────────────────────────────
+
+
+def normalize_gain(
+    pcm: PCMLike,
+    target_dbfs: float = -20.0,
+    max_gain_db: float = 12.0,
+    peak_ceiling: float = 0.95,
+) -> np.ndarray:
+    """Scale toward a target RMS level with a gain cap and peak-based clipping protection."""
+    samples = as_pcm16(pcm).astype(np.float64)
+    if samples.size == 0:
+        return samples.astype(np.int16)
+    rms = np.sqrt(np.mean(samples * samples))
+    if rms < 1.0:  # digital silence; nothing to normalize
+        return samples.astype(np.int16)
+    gain = min(_INT16_MAX * 10 ** (target_dbfs / 20) / rms, 10 ** (max_gain_db / 20))
+    peak = np.max(np.abs(samples))
+    gain = min(gain, peak_ceiling * _INT16_MAX / peak)
+    return _to_int16(samples * gain)
+
+
+# ── Twilio convenience ───────────────────────────────────────────────────
+
+
+def linear16_to_twilio(audio: bytes, sample_rate: int, twilio_rate: int = 8000) -> bytes:
+    """Convert LINEAR16 (raw or WAV) TTS output to 8 kHz mu-law for Twilio."""
+    pcm, wav_rate = strip_wav_header(audio)
+    pcm16 = resample(as_pcm16(pcm[: len(pcm) // 2 * 2]), wav_rate or sample_rate, twilio_rate)
+    return pcm16_to_mulaw(normalize_gain(pcm16))
@@ -0,0 +1,203 @@
+"""End-of-utterance detection ahead of the STT final result.
+
+Google marks a result final well after the caller stops talking. The
+``Endpointer`` declares the end of a turn earlier, once all of these hold:
+
+- local VAD has heard silence for at least the caller's pause threshold;
+- the interim transcript has not changed for ``stable_ms``;
+- no earlier declaration is still waiting for its final.
+
+The pause threshold comes from a per-call ``PauseModel``. It learns from the
+pauses after which this caller kept talking, so slow speakers get more room.
+
+The STT final confirms an early declaration. If the final repeats the
+declared text it is dropped. If the caller kept talking, only the new
+words are delivered, as the next turn. If the final disagrees with what was
+declared, it is delivered as a corrective turn. A declaration whose final never comes
+(stream restart, lost response) is abandoned after ``DECLARATION_TIMEOUT_S``
+or by ``reset_pending``, so later utterances are not compared against it.
+The decision latency (last speech frame to turn start) travels with the
+transcript as an ``Utterance``.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.speech.dsp import mulaw_to_pcm16
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+NOISE_FLOOR_ALPHA = 0.05
+SPEECH_TO_NOISE_RATIO = 3.0
+MIN_COUNTED_PAUSE_MS = 150.0  # shorter gaps are between words, not pauses
+DECLARATION_TIMEOUT_S = 5.0  # finals normally follow a declaration within ~1-2 s
+
+
+@dataclass(frozen=True)
+class EndpointDecision:
+    source: str  # "endpoint" (declared before the final), "final" or "revised"
+    decision_ms: float  # last speech frame -> transcript released
+    pause_threshold_ms: float
+
+
+class Utterance(str):
+    """A transcript plus how its end was detected."""
+
+    endpoint: Optional[EndpointDecision] = None
+
+    def __new__(cls, text: str, endpoint: Optional[EndpointDecision] = None):
+        utterance = super().__new__(cls, text)
+        utterance.endpoint = endpoint
+        return utterance
+
+
+def _words(text: str) -> list:
+    return "".join(ch for ch in text.lower() if ch.isalnum() or ch.isspace()).split()
+
+
+class PauseModel:
+    """Running mean/deviation of one caller's mid-utterance pauses."""
+
+    def __init__(self, initial_ms: float, min_ms: float, max_ms: float, alpha: float = 0.3):
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.alpha = alpha
+        # Start so that mean + 2 * deviation equals the initial threshold
+        self.mean_ms = initial_ms / 2
+        self.dev_ms = initial_ms / 4
+        self.samples = 0
+
+    def observe(self, pause_ms: float) -> None:
+        self.samples += 1
+        error = pause_ms - self.mean_ms
+        self.mean_ms += self.alpha * error
+        self.dev_ms += self.alpha * (abs(error) - self.dev_ms)
+
+    @property
+    def threshold_ms(self) -> float:
+        return min(self.max_ms, max(self.min_ms, self.mean_ms + 2 * self.dev_ms))
+
+
+class Endpointer:
+    """Per-call endpoint state; fed 8 kHz MULAW frames, interim and final transcripts."""
+
+    def __init__(
+        self,
+        initial_pause_ms: float = 700.0,
+        min_pause_ms: float = 300.0,
+        max_pause_ms: float = 1500.0,
+        stable_ms: float = 200.0,
+        min_speech_rms: float = 300.0,
+    ):
+        self.pauses = PauseModel(initial_pause_ms, min_pause_ms, max_pause_ms)
+        self.stable_ms = stable_ms
+        self.min_speech_rms = min_speech_rms
+        self._noise_rms = 0.0
+        self._speaking = False
+        self._last_speech: Optional[float] = None
+        self._interim = ""
+        self._interim_changed = 0.0
+        # Text declared early, waiting for the STT final to confirm it
+        self._declared: Optional[str] = None
+        self._declared_at = 0.0
+
+    # ── Inputs ─────────────────────────────────────────────────────────
+
+    def is_speech(self, audio: bytes) -> bool:
+        """Energy VAD against a slowly tracked noise floor."""
+        pcm = mulaw_to_pcm16(audio).astype(np.float32)
+        if pcm.size == 0:
+            return False
+        rms = float(np.sqrt(np.mean(pcm * pcm)))
+        if rms >= max(self.min_speech_rms, self._noise_rms * SPEECH_TO_NOISE_RATIO):
+            return True
+        self._noise_rms += NOISE_FLOOR_ALPHA * (rms - self._noise_rms)
+        return False
+
+    def on_audio(self, audio: bytes, now: Optional[float] = None) -> Optional[Utterance]:
+        """Track speech and silence; returns an utterance when the turn is over."""
+        now = time.monotonic() if now is None else now
+        if self.is_speech(audio):
+            if not self._speaking and self._last_speech is not None:
+                pause_ms = (now - self._last_speech) * 1000
+                if MIN_COUNTED_PAUSE_MS <= pause_ms <= self.pauses.max_ms * 2:
+                    # The caller paused this long and carried on
+                    self.pauses.observe(pause_ms)
+            self._speaking = True
+            self._last_speech = now
+            return None
+        self._speaking = False
+        return self._check(now)
+
+    def on_interim(self, text: str, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        text = text.strip()
+        if text != self._interim:
+            self._interim = text
+            self._interim_changed = now
+
+    def on_final(self, text: str, now: Optional[float] = None) -> Optional[Utterance]:
+        """Confirm an early declaration, or release the final as the turn."""
+        now = time.monotonic() if now is None else now
+        self._expire_declaration(now)
+        declared, self._declared = self._declared, None
+        self._interim = ""
+        if declared is None:
+            return self._decide(text, "final", now)
+        metrics.observe("endpoint.ahead_of_final_ms", (now - self._declared_at) * 1000)
+        declared_words, final_words = _words(declared), _words(text)
+        if final_words == declared_words:
+            metrics.incr("endpoint.confirmed")
+            return None
+        if final_words[: len(declared_words)] == declared_words:
+            # Caller kept talking after the declaration: the rest is a new turn
+            metrics.incr("endpoint.premature")
+            return self._decide(" ".join(final_words[len(declared_words):]), "final", now)
+        # Recognized differently than the interim we answered: answer the real words
+        logger.info("STT final %r revised early transcript %r", text, declared)
+        return self._decide(text, "revised", now)
+
+    def reset_pending(self) -> None:
+        """The STT stream restarted: finals for earlier audio will not arrive."""
+        if self._declared is not None:
+            metrics.incr("endpoint.abandoned")
+        self._declared = None
+        self._interim = ""
+
+    # ── Decisions ──────────────────────────────────────────────────────
+
+    def _expire_declaration(self, now: float) -> None:
+        if self._declared is not None and now - self._declared_at >= DECLARATION_TIMEOUT_S:
+            logger.info("No STT final for early transcript %r; giving up on it", self._declared)
+            metrics.incr("endpoint.abandoned")
+            if self._interim == self._declared:
+                self._interim = ""  # already answered; don't declare it again
+            self._declared = None
+
+    def _check(self, now: float) -> Optional[Utterance]:
+        self._expire_declaration(now)
+        if self._declared is not None or not self._interim or self._last_speech is None:
+            return None
+        silence_ms = (now - self._last_speech) * 1000
+        if silence_ms < self.pauses.threshold_ms:
+            return None
+        if (now - self._interim_changed) * 1000 < self.stable_ms:
+            return None
+        self._declared, self._declared_at = self._interim, now
+        return self._decide(self._interim, "endpoint", now)
+
+    def _decide(self, text: str, source: str, now: float) -> Utterance:
+        decision_ms = (now - self._last_speech) * 1000 if self._last_speech is not None else 0.0
+        decision = EndpointDecision(
+            source=source,
+            decision_ms=round(decision_ms, 1),
+            pause_threshold_ms=round(self.pauses.threshold_ms, 1),
+        )
+        metrics.incr(f"endpoint.{source}")
+        metrics.observe("endpoint.decision_ms", decision.decision_ms)
+        return Utterance(text, decision)
@@ -0,0 +1,143 @@
+"""Pre-synthesized filler audio that masks slow turns.
+
+A ``PhraseCache`` holds audio for fixed lines such as the greeting, so they
+play without a TTS round trip. A ``FillerBank`` synthesizes a handful of
+short phrases once at startup and keeps the audio in memory. A
+``LatencyMask`` plays one of them when a turn runs past a threshold or a tool
+call starts, and makes sure the real response only starts after the filler
+has been sent, so the two never overlap.
+"""
+
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+from config.prompts import FILLER_PHRASES
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class PhraseCache:
+    """Audio for fixed phrases, synthesized once during warm-up."""
+
+    def __init__(self):
+        self._audio: Dict[str, bytes] = {}
+
+    async def preload(self, tts, texts: List[str]) -> None:
+        audio = await asyncio.gather(*(tts.synthesize(text) for text in texts), return_exceptions=True)
+        for text, clip in zip(texts, audio):
+            if isinstance(clip, bytes) and clip:
+                self._audio[text] = clip
+            else:
+                logger.warning("Could not pre-synthesize phrase: %s", text)
+
+    def get(self, text: str) -> Optional[bytes]:
+        return self._audio.get(text)
+
+
+class FillerBank:
+    """In-memory filler clips keyed by situation ("lookup", "thinking")."""
+
+    def __init__(self, phrases: Optional[Dict[str, List[str]]] = None):
+        self.phrases = phrases or FILLER_PHRASES
+        self._clips: Dict[str, List[bytes]] = {}
+        self._cursors: Dict[str, Iterator[bytes]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._clips)
+
+    async def load(self, tts) -> None:
+        """Synthesize every phrase once; phrases that fail are skipped."""
+        texts = [(kind, text) for kind, items in self.phrases.items() for text in items]
+        audio = await asyncio.gather(*(tts.synthesize(text) for _, text in texts), return_exceptions=True)
+        clips: Dict[str, List[bytes]] = {}
+        for (kind, text), clip in zip(texts, audio):
+            if isinstance(clip, bytes) and clip:
+                clips.setdefault(kind, []).append(clip)
+            else:
+                logger.warning("Filler phrase not available: %s", text)
+        self._clips = clips
+        self._cursors = {kind: itertools.cycle(items) for kind, items in clips.items()}
+        logger.info("Loaded %d filler clips", sum(len(items) for items in clips.values()))
+
+    def pick(self, kind: str) -> Optional[bytes]:
+        """Next clip for ``kind`` (rotating), falling back to any loaded clip."""
+        cursor = self._cursors.get(kind) or next(iter(self._cursors.values()), None)
+        return next(cursor) if cursor else None
+
+
+class LatencyMask:
+    """Per-turn filler controller; plays at most one clip per turn."""
+
+    def __init__(
+        self,
+        play: Callable[[bytes], Awaitable[None]],
+        bank: FillerBank,
+        threshold_ms: int,
+    ):
+        self._play = play
+        self._bank = bank
+        self._threshold = threshold_ms / 1000
+        self._task: Optional[asyncio.Task] = None
+        self.played = False
+        self.active = False
+
+    def start(self) -> None:
+        """Arm the threshold timer at the start of a turn."""
+        self.active = True
+        self._task = asyncio.create_task(self._after_threshold())
+
+    async def _after_threshold(self) -> None:
+        await asyncio.sleep(self._threshold)
+        await self._play_filler("thinking")
+
+    def on_tool_call(self) -> None:
+        """A tool round trip is about to start; fill the gap right away."""
+        if self.played or not self.active:
+            return
+        audio = self._claim("lookup")
+        if audio:
+            if self._task and not self._task.done():
+                self._task.cancel()
+            self._task = asyncio.create_task(self._play(audio))
+
+    async def _play_filler(self, kind: str) -> None:
+        audio = self._claim(kind)
+        if audio:
+            await self._play(audio)
+
+    def _claim(self, kind: str) -> Optional[bytes]:
+        """Pick a clip and mark this turn as filled; None if nothing to play."""
+        if self.played:
+            return None
+        audio = self._bank.pick(kind)
+        if audio:
+            self.played = True
+            metrics.incr(f"filler.played.{kind}")
+        return audio
+
+    async def finish(self) -> None:
+        """Call before sending the real response: drop a pending timer or wait out the clip."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        if not self.played:
+            task.cancel()
+            return
+        try:
+            await task
+        except Exception as exc:
+            logger.debug("Filler playback failed: %s", exc)
+
+    def cancel(self) -> None:
+        self.active = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+
+filler_bank = FillerBank()
+phrase_cache = PhraseCache()
@@ -1,51 +1,215 @@
-"""Streaming Speech-to-Text using Google Cloud Speech API."""
+"""Streaming Speech-to-Text using Google Cloud Speech API.
+
+Two backends share the same ``start_stream`` / ``process_audio_chunk`` /
+``get_transcript`` / ``close`` interface:
+
+- ``AsyncGoogleSTT`` drives the async Speech client as a task on the event
+  loop, so concurrent calls cost no extra OS threads.
+- ``GoogleSTT`` runs the blocking ``streaming_recognize`` iterator in a
+  dedicated thread per call; kept as a fallback.
+
+``create_stt`` picks one based on the ``STT_BACKEND`` setting.
+
+With ``ENDPOINTING_ENABLED`` both also request interim results and let an
+``Endpointer`` (see ``src.speech.endpointer``) release a transcript before
+Google's final result.
+"""
 
 import asyncio
 import threading
-from typing import Optional
-
-from google.cloud import speech
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Iterator, Optional
 
+from config.settings import settings
+from src.speech.dsp import Resampler, mulaw_to_pcm16
+from src.speech.endpointer import Endpointer
+from src.utils.call_context import bind_thread, current_call_sid, unbind_thread
+from src.utils.circuit_breaker import stt_breaker
+from src.utils.executors import stt_threads
+from src.utils.helpers import put_drop_oldest
+from src.utils.lazy import lazy_import
 from src.utils.logger import get_logger
+from src.utils.metrics import metrics
 
 logger = get_logger(__name__)
 
+speech = lazy_import("google.cloud.speech")
+
+STREAM_RESTART_BACKOFF = (0.1, 0.5, 1.0, 2.0)
+THREAD_JOIN_TIMEOUT = 3.0
+THREAD_JOIN_POLL = 0.05
 
-class GoogleSTT:
-    """Google Cloud STT with streaming recognition via a background thread."""
+
+class BaseGoogleSTT(ABC):
+    """Queues and recognition config shared by both STT backends."""
+
+    threads = 0  # OS threads held by this stream
 
     def __init__(self, sample_rate: int = 8000):
         self.sample_rate = sample_rate
-        self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
-        self._transcripts: asyncio.Queue[str] = asyncio.Queue()
+        # Twilio sends 8 kHz MULAW; other rates are fed to STT as upsampled LINEAR16
+        self._upsampler = Resampler(8000, sample_rate) if sample_rate != 8000 else None
+        # Bounded per call; when full the oldest item is dropped (see process_audio_chunk)
+        self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=settings.stt_audio_queue_size)
+        self._transcripts: asyncio.Queue[str] = asyncio.Queue(maxsize=settings.stt_transcript_queue_size)
         self._running = False
-        self._thread: Optional[threading.Thread] = None
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-
-        try:
-            self._client = speech.SpeechClient()
-        except Exception as exc:
-            logger.error("Failed to create STT client: %s", exc)
-            self._client = None
+        self.endpointer: Optional[Endpointer] = (
+            Endpointer(
+                initial_pause_ms=settings.endpoint_initial_pause_ms,
+                min_pause_ms=settings.endpoint_min_pause_ms,
+                max_pause_ms=settings.endpoint_max_pause_ms,
+                stable_ms=settings.endpoint_stable_ms,
+                min_speech_rms=settings.vad_min_speech_rms,
+            )
+            if settings.endpointing_enabled
+            else None
+        )
 
+        encoding = (
+            speech.RecognitionConfig.AudioEncoding.LINEAR16
+            if self._upsampler
+            else speech.RecognitionConfig.AudioEncoding.MULAW
+        )
         self._config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.MULAW,
+            encoding=encoding,
             sample_rate_hertz=self.sample_rate,
             language_code="en-US",
         )
         self._streaming_config = speech.StreamingRecognitionConfig(
             config=self._config,
             single_utterance=False,
+            interim_results=self.endpointer is not None,
         )
 
+    @staticmethod
+    def _final_transcripts(response) -> Iterator[str]:
+        for result in response.results:
+            if result.is_final and result.alternatives:
+                transcript = result.alternatives[0].transcript.strip()
+                if transcript:
+                    logger.info("STT transcript: %s", transcript)
+                    yield transcript
+
+    @staticmethod
+    def _interim_transcript(response) -> str:
+        """Current guess for the utterance in progress (all non-final results)."""
+        return "".join(
+            result.alternatives[0].transcript
+            for result in response.results
+            if not result.is_final and result.alternatives
+        )
+
+    def _handle_response(self, response) -> None:
+        """Route one streaming response; runs on the event loop."""
+        if self.endpointer:
+            interim = self._interim_transcript(response)
+            if interim:
+                self.endpointer.on_interim(interim)
+        for transcript in self._final_transcripts(response):
+            if self.endpointer:
+                utterance = self.endpointer.on_final(transcript)
+                if utterance:
+                    self._enqueue_transcript(utterance)
+            else:
+                self._enqueue_transcript(transcript)
+
+    def _stream_opened(self) -> None:
+        """A new recognition stream starts; runs on the event loop."""
+        if self.endpointer:
+            self.endpointer.reset_pending()
+
+    def _enqueue_transcript(self, transcript: str) -> None:
+        if put_drop_oldest(self._transcripts, transcript):
+            metrics.incr("stt.transcripts_dropped")
+
+    async def process_audio_chunk(self, audio_data: bytes) -> None:
+        """Accept raw MULAW audio bytes from Twilio.
+
+        If recognition falls behind, the oldest buffered audio is dropped so
+        the stream stays close to real time instead of growing without bound.
+        """
+        if self.endpointer:
+            utterance = self.endpointer.on_audio(audio_data)
+            if utterance:
+                logger.info("Endpoint detected: %s", utterance)
+                self._enqueue_transcript(utterance)
+        if self._upsampler:
+            audio_data = self._upsampler.process(mulaw_to_pcm16(audio_data)).tobytes()
+        if put_drop_oldest(self._audio_queue, audio_data):
+            metrics.incr("stt.audio_dropped")
+
+    def resources(self) -> Dict[str, int]:
+        """Threads and buffered items/bytes held by this stream, for per-call accounting."""
+        return {
+            "threads": self.threads,
+            "audio_queue": self._audio_queue.qsize(),
+            "audio_bytes": sum(len(chunk) for chunk in self._audio_queue._queue),
+            "transcript_queue": self._transcripts.qsize(),
+        }
+
+    async def get_transcript(self, timeout: float = 0.0) -> Optional[str]:
+        """Return the next final transcript if available."""
+        try:
+            if timeout:
+                return await asyncio.wait_for(self._transcripts.get(), timeout=timeout)
+            return self._transcripts.get_nowait()
+        except Exception:
+            return None
+
+    @abstractmethod
+    async def start_stream(self) -> None:
+        """Start recognizing queued audio."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop recognition without blocking the loop."""
+
+
+class GoogleSTT(BaseGoogleSTT):
+    """Google Cloud STT with streaming recognition via a background thread."""
+
+    # Created once by ``warm_up`` at startup and reused by every call
+    _shared_client = None
+
+    def __init__(self, sample_rate: int = 8000):
+        super().__init__(sample_rate)
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._call_sid: Optional[str] = None
+
+        self._client = GoogleSTT._shared_client
+        if self._client is None:
+            try:
+                self._client = speech.SpeechClient()
+            except Exception as exc:
+                logger.error("Failed to create STT client: %s", exc)
+
+    @property
+    def threads(self) -> int:
+        return int(bool(self._thread and self._thread.is_alive()))
+
+    @classmethod
+    def warm_up(cls, credentials=None) -> None:
+        """Create the shared client and wait for its gRPC channel to connect."""
+        import grpc
+
+        client = speech.SpeechClient(credentials=credentials)
+        grpc.channel_ready_future(client.transport.grpc_channel).result(timeout=10.0)
+        cls._shared_client = client
+
     async def start_stream(self) -> None:
         """Start the background recognition thread."""
         if not self._client:
             logger.warning("STT client not available; stream not started")
             return
+        if not stt_threads.try_acquire():
+            logger.error("STT thread cap (%d) reached; stream not started", stt_threads.limit)
+            return
         self._loop = asyncio.get_running_loop()
+        self._call_sid = current_call_sid.get()
         self._running = True
-        self._thread = threading.Thread(target=self._recognition_loop, daemon=True)
+        self._thread = threading.Thread(target=self._run_recognition, name="stt-stream", daemon=True)
         self._thread.start()
         logger.info("STT stream started at %s Hz", self.sample_rate)
 
@@ -72,51 +236,176 @@ class GoogleSTT:
         except asyncio.TimeoutError:
             return None
 
+    def _run_recognition(self) -> None:
+        """Thread entry point; returns the STT thread slot when recognition ends."""
+        bind_thread(self._call_sid)
+        try:
+            self._recognition_loop()
+        finally:
+            unbind_thread()
+            stt_threads.release()
+
     def _recognition_loop(self) -> None:
         """Run streaming recognition in a background thread.
 
-        TODO: Production hardening — Google has a ~5min streaming limit.
-        Add automatic restart with backoff for long-running calls.
+        Google closes streams after ~5 minutes; the loop opens a new one,
+        backing off while consecutive streams fail before any response.
         """
+        failures = 0
         while self._running:
+            admitted, probe = stt_breaker.admit()
+            if not admitted:
+                time.sleep(STREAM_RESTART_BACKOFF[-1])
+                continue
+            healthy = failed = False
+            self._loop.call_soon_threadsafe(self._stream_opened)
             try:
                 requests = self._audio_generator()
                 responses = self._client.streaming_recognize(
                     self._streaming_config, requests
                 )
                 for response in responses:
+                    if not healthy:
+                        healthy = True
+                        failures = 0
+                        stt_breaker.record_success()
                     if not self._running:
                         break
-                    for result in response.results:
-                        if result.is_final and result.alternatives:
-                            transcript = result.alternatives[0].transcript.strip()
-                            if transcript:
-                                logger.info("STT transcript: %s", transcript)
-                                asyncio.run_coroutine_threadsafe(
-                                    self._transcripts.put(transcript), self._loop
-                                )
+                    self._loop.call_soon_threadsafe(self._handle_response, response)
             except Exception as exc:
-                if self._running:
-                    logger.warning("STT stream error (will restart): %s", exc)
-                else:
+                if not self._running:
                     break
+                if not healthy:
+                    failed = True
+                    stt_breaker.record_failure()
+                delay = STREAM_RESTART_BACKOFF[min(failures, len(STREAM_RESTART_BACKOFF) - 1)]
+                failures += 1
+                metrics.incr("stt.stream_restarts")
+                logger.warning("STT stream error (restarting in %.1fs): %s", delay, exc)
+                time.sleep(delay)
+            finally:
+                if probe and not (healthy or failed):
+                    # Closed before any response: no verdict on the backend
+                    stt_breaker.release()
 
-    async def process_audio_chunk(self, audio_data: bytes) -> None:
-        """Accept raw MULAW audio bytes from Twilio."""
-        await self._audio_queue.put(audio_data)
+    async def close(self) -> None:
+        """Shut down the recognition thread without blocking the loop.
 
-    async def get_transcript(self, timeout: float = 0.0) -> Optional[str]:
-        """Return the next final transcript if available."""
-        try:
-            if timeout:
-                return await asyncio.wait_for(self._transcripts.get(), timeout=timeout)
-            return self._transcripts.get_nowait()
-        except Exception:
-            return None
+        The thread notices ``_running`` within about a second (its audio
+        wait times out); poll for it rather than ``join`` on the loop.
+        """
+        self._running = False
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + THREAD_JOIN_TIMEOUT
+        while self._thread and self._thread.is_alive() and loop.time() < deadline:
+            await asyncio.sleep(THREAD_JOIN_POLL)
+        if self._thread and self._thread.is_alive():
+            metrics.incr("stt.close_timeouts")
+            logger.warning("STT thread still running %.0fs after close", THREAD_JOIN_TIMEOUT)
+        logger.info("STT stream closed")
+
+
+class AsyncGoogleSTT(BaseGoogleSTT):
+    """Google Cloud STT driven by the async Speech client on the event loop."""
+
+    # Created once by ``warm_up`` at startup and reused by every call
+    _shared_client = None
+
+    def __init__(self, sample_rate: int = 8000, client=None):
+        super().__init__(sample_rate)
+        self._task: Optional[asyncio.Task] = None
+        if client is None:
+            client = AsyncGoogleSTT._shared_client
+        if client is None:
+            try:
+                client = speech.SpeechAsyncClient()
+            except Exception as exc:
+                logger.error("Failed to create async STT client: %s", exc)
+        self._client = client
+
+    @classmethod
+    async def warm_up(cls, credentials=None) -> None:
+        """Create the shared client on the running loop and connect its channel."""
+        client = speech.SpeechAsyncClient(credentials=credentials)
+        await asyncio.wait_for(client.transport.grpc_channel.channel_ready(), timeout=10.0)
+        cls._shared_client = client
+
+    async def start_stream(self) -> None:
+        """Start the recognition task."""
+        if not self._client:
+            logger.warning("STT client not available; stream not started")
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._recognition_loop())
+        logger.info("Async STT stream started at %s Hz", self.sample_rate)
+
+    async def _request_stream(self) -> AsyncIterator:
+        """Config first, then audio as it arrives; ends when the stream is closed."""
+        yield speech.StreamingRecognizeRequest(streaming_config=self._streaming_config)
+        while self._running:
+            try:
+                chunk = await asyncio.wait_for(self._audio_queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+    async def _recognition_loop(self) -> None:
+        """Run streaming recognition, reopening the stream when it ends or fails.
+
+        Google closes streams after ~5 minutes; the loop simply opens a new one.
+        """
+        failures = 0
+        while self._running:
+            admitted, probe = stt_breaker.admit()
+            if not admitted:
+                await asyncio.sleep(STREAM_RESTART_BACKOFF[-1])
+                continue
+            healthy = failed = False
+            self._stream_opened()
+            try:
+                responses = await self._client.streaming_recognize(requests=self._request_stream())
+                async for response in responses:
+                    if not healthy:
+                        healthy = True
+                        failures = 0
+                        stt_breaker.record_success()
+                    self._handle_response(response)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if not self._running:
+                    break
+                if not healthy:
+                    failed = True
+                    stt_breaker.record_failure()
+                delay = STREAM_RESTART_BACKOFF[min(failures, len(STREAM_RESTART_BACKOFF) - 1)]
+                failures += 1
+                metrics.incr("stt.stream_restarts")
+                logger.warning("STT stream error (restarting in %.1fs): %s", delay, exc)
+                await asyncio.sleep(delay)
+            finally:
+                if probe and not (healthy or failed):
+                    # Cancelled or closed before any response: no verdict on the backend
+                    stt_breaker.release()
 
     async def close(self) -> None:
-        """Shut down the recognition thread."""
+        """Stop the recognition task without blocking the loop."""
         self._running = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=3.0)
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
         logger.info("STT stream closed")
+
+
+def create_stt(sample_rate: Optional[int] = None) -> BaseGoogleSTT:
+    """Build the configured STT backend, falling back to the threaded one."""
+    sample_rate = sample_rate or settings.stt_sample_rate
+    if settings.stt_backend == "async":
+        stt = AsyncGoogleSTT(sample_rate)
+        if stt._client is not None:
+            return stt
+        logger.warning("Async STT backend unavailable; falling back to threaded backend")
+    return GoogleSTT(sample_rate)
@@ -1,59 +1,101 @@
-"""Text-to-Speech using Google Cloud TTS with MULAW 8kHz output."""
+"""Text-to-Speech using Google Cloud TTS, delivered as MULAW 8kHz for Twilio."""
 
-import asyncio
-from typing import Optional
-
-from google.cloud import texttospeech
+from typing import Any, Optional
 
+from config.settings import settings
+from src.business.tenants import VoiceProfile
+from src.speech.dsp import linear16_to_twilio
+from src.utils.circuit_breaker import CircuitOpenError, tts_breaker
+from src.utils.executors import tts_executor
+from src.utils.lazy import lazy_import
 from src.utils.logger import get_logger
+from src.utils.lru import LRUCache
 
 logger = get_logger(__name__)
 
+texttospeech = lazy_import("google.cloud.texttospeech")
+
+# VoiceSelectionParams per tenant voice, built once
+tenant_voices: LRUCache[Any] = LRUCache("tenant_voices", settings.tenant_cache_size)
+
+
+def _voice_params(voice: VoiceProfile):
+    return texttospeech.VoiceSelectionParams(
+        language_code=voice.language_code,
+        name=voice.name or "",
+        ssml_gender=getattr(texttospeech.SsmlVoiceGender, voice.gender),
+    )
+
 
 class GoogleTTS:
-    """Google Cloud Text-to-Speech with MULAW 8kHz for Twilio."""
+    """Google Cloud Text-to-Speech with MULAW 8kHz for Twilio.
+
+    With ``TTS_AUDIO_ENCODING=linear16`` the voice is synthesized as LINEAR16 at
+    ``TTS_SYNTHESIS_RATE`` and converted to MULAW 8kHz locally.
+    """
+
+    # Created once by ``warm_up`` at startup and reused by every call
+    _shared_client = None
 
-    def __init__(self, sample_rate: int = 8000):
+    def __init__(self, sample_rate: int = 8000, voice: VoiceProfile = VoiceProfile()):
         self.sample_rate = sample_rate
-        try:
-            self._client = texttospeech.TextToSpeechClient()
-        except Exception as exc:
-            logger.error("Failed to create TTS client: %s", exc)
-            self._client = None
+        self._linear16 = settings.tts_audio_encoding == "linear16"
+        self._client = GoogleTTS._shared_client
+        if self._client is None:
+            try:
+                self._client = texttospeech.TextToSpeechClient()
+            except Exception as exc:
+                logger.error("Failed to create TTS client: %s", exc)
 
-        self._voice = texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL,
-        )
-        self._audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MULAW,
-            sample_rate_hertz=self.sample_rate,
-        )
+        self._voice = tenant_voices.get_or_create(voice, lambda: _voice_params(voice))
+        if self._linear16:
+            self._audio_config = texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+                sample_rate_hertz=settings.tts_synthesis_rate,
+            )
+        else:
+            self._audio_config = texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.MULAW,
+                sample_rate_hertz=self.sample_rate,
+            )
+
+    @classmethod
+    def warm_up(cls, credentials=None) -> None:
+        """Create the shared client and open its channel with a cheap RPC."""
+        client = texttospeech.TextToSpeechClient(credentials=credentials)
+        client.list_voices(language_code="en-US")
+        cls._shared_client = client
 
     def _synthesize_sync(self, text: str) -> bytes:
-        """Synchronous TTS call — run via asyncio.to_thread()."""
+        """Synchronous TTS call — run on the TTS executor; raises on API errors."""
+        input_text = texttospeech.SynthesisInput(text=text)
+        response = self._client.synthesize_speech(
+            input=input_text,
+            voice=self._voice,
+            audio_config=self._audio_config,
+        )
+        if self._linear16:
+            return linear16_to_twilio(
+                response.audio_content, settings.tts_synthesis_rate, self.sample_rate
+            )
+        return response.audio_content
+
+    async def synthesize(self, text: str) -> bytes:
+        """Return synthesized MULAW 8kHz audio bytes; empty when TTS is unavailable."""
+        if not text or not text.strip():
+            return b""
         if not self._client:
             logger.warning("TTS client not available")
             return b""
+        logger.info("Synthesizing TTS for text: %s", text[:80])
         try:
-            input_text = texttospeech.SynthesisInput(text=text)
-            response = self._client.synthesize_speech(
-                input=input_text,
-                voice=self._voice,
-                audio_config=self._audio_config,
-            )
-            return response.audio_content
+            return await tts_breaker.call(lambda: tts_executor.run(self._synthesize_sync, text))
+        except CircuitOpenError:
+            return b""
         except Exception as exc:
             logger.error("TTS synthesis failed: %s", exc)
             return b""
 
-    async def synthesize(self, text: str) -> bytes:
-        """Return synthesized MULAW 8kHz audio bytes."""
-        if not text or not text.strip():
-            return b""
-        logger.info("Synthesizing TTS for text: %s", text[:80])
-        return await asyncio.to_thread(self._synthesize_sync, text)
-
     def audio_format(self) -> dict[str, Optional[int]]:
         """Return playback config for downstream streaming."""
         return {"sample_rate": self.sample_rate}
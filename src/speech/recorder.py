@@ -0,0 +1,258 @@
+"""Per-call audio recording for QA.
+
+Both legs are kept as raw 8 kHz MULAW. Appending a frame only copies bytes
+into a preallocated chunk; full chunks are handed to a background writer that
+appends them to per-leg spool files on the recording executor, and the chunks
+are reused afterwards. When the call ends the spools are turned into a single
+MULAW WAV file: stereo (caller left, bot right) or mixed mono.
+
+Outbound audio is placed on the inbound timeline: the bot's audio starts no
+earlier than "now" (the amount of caller audio received so far) and no earlier
+than the end of the previous bot audio, which is how Twilio plays queued
+media.
+"""
+
+import asyncio
+import os
+import struct
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import settings
+from src.speech.dsp import mulaw_to_pcm16, pcm16_to_mulaw
+from src.utils.executors import recording_executor
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+SAMPLE_RATE = 8000
+MULAW_SILENCE = 0xFF
+WAVE_FORMAT_MULAW = 7
+_WAV_BLOCK = 64 * 1024  # samples per leg converted at a time when finishing
+
+
+class ChunkedTrack:
+    """Append-only MULAW track stored in fixed-size, recyclable chunks.
+
+    Not thread-safe: appends, ``drain`` and ``recycle`` all happen on the
+    event loop; only the drained chunks travel to the writer thread.
+    """
+
+    def __init__(self, chunk_size: int, prealloc: int):
+        self.chunk_size = chunk_size
+        self._free: Deque[bytearray] = deque(bytearray(chunk_size) for _ in range(prealloc))
+        self._full: Deque[bytearray] = deque()
+        self._current = self._take()
+        self._fill = 0
+        self._silence = bytes([MULAW_SILENCE]) * chunk_size
+        self.length = 0  # samples (bytes) appended so far
+
+    def _take(self) -> bytearray:
+        if self._free:
+            return self._free.popleft()
+        metrics.incr("recording.chunk_allocs")
+        return bytearray(self.chunk_size)
+
+    def append(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            count = min(len(view), self.chunk_size - self._fill)
+            self._current[self._fill : self._fill + count] = view[:count]
+            self._fill += count
+            self.length += count
+            view = view[count:]
+            if self._fill == self.chunk_size:
+                self._full.append(self._current)
+                self._current = self._take()
+                self._fill = 0
+
+    def pad_to(self, length: int) -> None:
+        """Append silence until the track is ``length`` samples long."""
+        while self.length < length:
+            self.append(memoryview(self._silence)[: min(self.chunk_size, length - self.length)])
+
+    def drain(self) -> List[bytearray]:
+        """Hand over all full chunks; give them back with ``recycle`` once written."""
+        chunks = list(self._full)
+        self._full.clear()
+        return chunks
+
+    def tail(self) -> bytes:
+        """Copy of the partially filled chunk."""
+        return bytes(self._current[: self._fill])
+
+    def recycle(self, chunks: List[bytearray]) -> None:
+        self._free.extend(chunks)
+
+    @property
+    def allocated_bytes(self) -> int:
+        """Chunk memory held by this track (chunks out with the writer excluded)."""
+        return (len(self._free) + len(self._full) + 1) * self.chunk_size
+
+
+def mulaw_wav_header(samples: int, channels: int, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """RIFF header for 8-bit G.711 mu-law audio (WAVE_FORMAT_MULAW)."""
+    data_size = samples * channels
+    fmt = struct.pack(
+        "<HHIIHHH", WAVE_FORMAT_MULAW, channels, sample_rate, sample_rate * channels, channels, 8, 0
+    )
+    fact = struct.pack("<I", samples)
+    riff_size = 4 + (8 + len(fmt)) + (8 + len(fact)) + (8 + data_size + (data_size & 1))
+    return b"".join(
+        (
+            b"RIFF", struct.pack("<I", riff_size), b"WAVE",
+            b"fmt ", struct.pack("<I", len(fmt)), fmt,
+            b"fact", struct.pack("<I", len(fact)), fact,
+            b"data", struct.pack("<I", data_size),
+        )
+    )
+
+
+def _create_spools(directory: Path, spools: Tuple[Path, ...]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for spool in spools:
+        spool.write_bytes(b"")
+
+
+def _append_chunks(path: Path, chunks: List[bytes]) -> None:
+    with open(path, "ab") as spool:
+        for chunk in chunks:
+            spool.write(chunk)
+
+
+def _read_block(spool, count: int) -> np.ndarray:
+    block = np.full(count, MULAW_SILENCE, dtype=np.uint8)
+    data = spool.read(count)
+    block[: len(data)] = np.frombuffer(data, dtype=np.uint8)
+    return block
+
+
+def _write_wav(inbound: Path, outbound: Path, target: Path, samples: int, channels: int) -> None:
+    """Combine the two spool files into one WAV, block by block, then delete them."""
+    with open(inbound, "rb") as caller, open(outbound, "rb") as bot, open(target, "wb") as wav:
+        wav.write(mulaw_wav_header(samples, channels))
+        remaining = samples
+        while remaining:
+            count = min(_WAV_BLOCK, remaining)
+            left, right = _read_block(caller, count), _read_block(bot, count)
+            if channels == 2:
+                frames = np.empty(count * 2, dtype=np.uint8)
+                frames[0::2], frames[1::2] = left, right
+                wav.write(frames.tobytes())
+            else:
+                mixed = mulaw_to_pcm16(left.tobytes()).astype(np.int32) + mulaw_to_pcm16(right.tobytes())
+                wav.write(pcm16_to_mulaw(np.clip(mixed, -32768, 32767).astype(np.int16)))
+            remaining -= count
+        if (samples * channels) & 1:
+            wav.write(b"\x00")
+    for spool in (inbound, outbound):
+        spool.unlink(missing_ok=True)
+
+
+class CallRecorder:
+    """Records both legs of one call; ``close`` returns the WAV path."""
+
+    def __init__(
+        self,
+        call_sid: str,
+        directory: Optional[str] = None,
+        channels: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        prealloc: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self.call_sid = call_sid
+        self.directory = Path(directory or settings.recording_dir)
+        self.channels = 2 if (channels or settings.recording_channels) == 2 else 1
+        chunk_size = chunk_size or settings.recording_chunk_bytes
+        prealloc = settings.recording_prealloc_chunks if prealloc is None else prealloc
+        self.flush_interval = flush_interval or settings.recording_flush_interval
+        self.inbound = ChunkedTrack(chunk_size, prealloc)
+        self.outbound = ChunkedTrack(chunk_size, prealloc)
+        self.path = self.directory / f"{call_sid}.wav"
+        self._spools = (
+            self.directory / f".{call_sid}.in.ulaw",
+            self.directory / f".{call_sid}.out.ulaw",
+        )
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def start(self) -> None:
+        """Prepare the spool files and start the periodic background flush.
+
+        Audio recorded meanwhile is buffered in memory and flushed later.
+        """
+        await recording_executor.run(_create_spools, self.directory, self._spools)
+        if not self._closed:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    def record_inbound(self, audio: bytes) -> None:
+        if not self._closed:
+            self.inbound.append(audio)
+
+    def record_outbound(self, audio: bytes) -> None:
+        if not self._closed and audio:
+            self.outbound.pad_to(self.inbound.length)
+            self.outbound.append(audio)
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self.inbound.allocated_bytes + self.outbound.allocated_bytes
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self._flush()
+            except Exception as exc:
+                metrics.incr("recording.flush_errors")
+                logger.warning("Recording flush failed for %s: %s", self.call_sid, exc)
+
+    async def _flush(self, final: bool = False) -> None:
+        async with self._flush_lock:
+            for track, spool in zip((self.inbound, self.outbound), self._spools):
+                chunks = track.drain()
+                pending: List[bytes] = list(chunks)
+                if final:
+                    pending.append(track.tail())
+                if not pending:
+                    continue
+                started = time.monotonic()
+                try:
+                    await recording_executor.run(_append_chunks, spool, pending)
+                finally:
+                    track.recycle(chunks)
+                metrics.observe("recording.flush_ms", (time.monotonic() - started) * 1000)
+
+    async def close(self) -> Optional[str]:
+        """Stop recording, write the WAV file and return its path (None on failure)."""
+        if self._closed:
+            return None
+        self._closed = True
+        if self._task is None:
+            return None
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        samples = max(self.inbound.length, self.outbound.length)
+        try:
+            await self._flush(final=True)
+            await recording_executor.run(
+                _write_wav, self._spools[0], self._spools[1], self.path, samples, self.channels
+            )
+        except Exception as exc:
+            metrics.incr("recording.errors")
+            logger.error("Could not write recording for %s: %s", self.call_sid, exc)
+            return None
+        metrics.incr("recording.files")
+        metrics.observe("recording.seconds", samples / SAMPLE_RATE)
+        logger.info("Recorded %s (%.1f s) to %s", self.call_sid, samples / SAMPLE_RATE, self.path)
+        return os.fspath(self.path)
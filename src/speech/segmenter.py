@@ -0,0 +1,82 @@
+"""Sentence segmentation and concurrent, in-order TTS synthesis.
+
+Long replies are split into sentences that are synthesized concurrently
+(bounded), then yielded strictly in order as soon as the head segment is
+ready. The caller hears the same words, but playback starts after the first
+sentence is synthesized instead of the whole reply.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List
+
+from src.utils.metrics import metrics
+
+# Split after sentence punctuation followed by whitespace, but not after common abbreviations
+_SENTENCE_END_RE = re.compile(r"(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)(?<=[.!?])\s+")
+
+MIN_SEGMENT_CHARS = 24
+
+
+@dataclass
+class SegmentAudio:
+    """Synthesized audio for one segment plus its timing."""
+
+    index: int
+    text: str
+    audio: bytes
+    synth_ms: int  # time spent in the TTS request
+    ready_ms: int  # time from start of synthesis until this segment could play
+
+
+def split_sentences(text: str, min_chars: int = MIN_SEGMENT_CHARS) -> List[str]:
+    """Split text into sentences, merging fragments shorter than ``min_chars``."""
+    segments: List[str] = []
+    for sentence in _SENTENCE_END_RE.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if segments and len(segments[-1]) < min_chars:
+            segments[-1] = f"{segments[-1]} {sentence}"
+        else:
+            segments.append(sentence)
+    # A short trailing fragment rides along with the previous sentence
+    if len(segments) > 1 and len(segments[-1]) < min_chars:
+        segments[-2:] = [f"{segments[-2]} {segments[-1]}"]
+    return segments
+
+
+async def synthesize_segments(
+    synthesize: Callable[[str], Awaitable[bytes]],
+    text: str,
+    max_parallel: int = 3,
+) -> AsyncIterator[SegmentAudio]:
+    """Synthesize sentences concurrently and yield them in order."""
+    segments = split_sentences(text)
+    if not segments:
+        return
+    semaphore = asyncio.Semaphore(max_parallel)
+    started = time.monotonic()
+
+    async def _synthesize(index: int, segment: str) -> SegmentAudio:
+        async with semaphore:
+            synth_start = time.monotonic()
+            audio = await synthesize(segment)
+            synth_ms = int((time.monotonic() - synth_start) * 1000)
+        metrics.observe("tts.segment_synth_ms", synth_ms)
+        return SegmentAudio(index, segment, audio, synth_ms, 0)
+
+    tasks = [asyncio.create_task(_synthesize(i, segment)) for i, segment in enumerate(segments)]
+    try:
+        for task in tasks:
+            result = await task
+            result.ready_ms = int((time.monotonic() - started) * 1000)
+            if result.index == 0:
+                metrics.observe("tts.first_segment_ms", result.ready_ms)
+            yield result
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
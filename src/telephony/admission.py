@@ -0,0 +1,120 @@
+"""Admission control for incoming calls.
+
+``/voice`` asks the controller before handing Twilio a media stream. Calls are
+turned away when the worker is at its concurrent-call limit or when the event
+loop is already lagging, so admitted calls keep their latency.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Set
+
+from config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class AdmissionDecision:
+    admitted: bool
+    reason: str = "ok"
+
+
+class LoopLagProbe:
+    """Measure event-loop scheduling lag with a periodic sleep."""
+
+    def __init__(self, interval: float = 0.25, smoothing: float = 0.3):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - scheduled - self.interval) * 1000)
+            metrics.observe("loop.lag_ms", lag_ms)
+            self.lag_ms = self.smoothing * lag_ms + (1 - self.smoothing) * self.lag_ms
+            metrics.set_gauge("loop.lag_ms", round(self.lag_ms, 2))
+
+
+class AdmissionController:
+    """Track admitted calls and decide whether a new one fits."""
+
+    def __init__(
+        self,
+        max_concurrent_calls: int,
+        max_loop_lag_ms: float,
+        reservation_ttl: float = 20.0,
+        lag_probe: Optional[LoopLagProbe] = None,
+    ):
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.reservation_ttl = reservation_ttl
+        self.lag_probe = lag_probe or LoopLagProbe()
+        # Admitted at /voice but media stream not connected yet
+        self._reservations: Deque[float] = deque()
+        self._active: Set[str] = set()
+
+    def _expire_reservations(self) -> None:
+        cutoff = time.monotonic() - self.reservation_ttl
+        while self._reservations and self._reservations[0] < cutoff:
+            self._reservations.popleft()
+
+    @property
+    def load(self) -> int:
+        self._expire_reservations()
+        return len(self._active) + len(self._reservations)
+
+    def try_admit(self) -> AdmissionDecision:
+        """Reserve capacity for a new call or explain why it was rejected."""
+        if self.load >= self.max_concurrent_calls:
+            decision = AdmissionDecision(False, "capacity")
+        elif self.lag_probe.lag_ms > self.max_loop_lag_ms:
+            decision = AdmissionDecision(False, "loop_lag")
+        else:
+            self._reservations.append(time.monotonic())
+            decision = AdmissionDecision(True)
+        metrics.incr("admission.accepted" if decision.admitted else f"admission.rejected.{decision.reason}")
+        self._publish()
+        return decision
+
+    def claim(self, call_sid: str) -> None:
+        """Convert a reservation into an active call once its stream connects."""
+        if call_sid in self._active:
+            return
+        self._expire_reservations()
+        if self._reservations:
+            self._reservations.popleft()
+        self._active.add(call_sid)
+        self._publish()
+
+    def release(self, call_sid: str) -> None:
+        self._active.discard(call_sid)
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge("calls.active", len(self._active))
+        metrics.set_gauge("calls.reserved", len(self._reservations))
+
+
+admission = AdmissionController(
+    max_concurrent_calls=settings.max_concurrent_calls,
+    max_loop_lag_ms=settings.max_loop_lag_ms,
+    reservation_ttl=settings.admission_reservation_ttl,
+)
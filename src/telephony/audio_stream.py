@@ -1,12 +1,15 @@
 """WebSocket handler for Twilio media streams."""
 
+import asyncio
 import json
+import time
 
 from fastapi import WebSocket
 
 from src.ai.conversation import ConversationOrchestrator
 from src.telephony.call_manager import get_or_create_conversation
 from src.speech.audio_utils import decode_base64_audio
+from src.utils.call_context import bind_call
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,13 +18,19 @@ logger = get_logger(__name__)
 async def handle_audio_stream(websocket: WebSocket, call_sid: str) -> None:
     """Process Twilio Media Stream messages."""
     await websocket.accept()
+    bind_call(call_sid)
     orchestrator: ConversationOrchestrator = get_or_create_conversation(call_sid, websocket)
+    # Lets the call supervisor cancel a stream that stopped sending
+    orchestrator.stream_task = asyncio.current_task()
     logger.info("WebSocket connected for call %s", call_sid)
     try:
         while True:
             raw_message = await websocket.receive_text()
+            orchestrator.last_activity = time.monotonic()
             message = json.loads(raw_message)
             event = message.get("event")
+            if orchestrator.capture:
+                orchestrator.capture.record_message(raw_message, event)
 
             if event == "connected":
                 await orchestrator.on_call_connected(message)
@@ -31,7 +40,13 @@ async def handle_audio_stream(websocket: WebSocket, call_sid: str) -> None:
                 payload = message.get("media", {}).get("payload")
                 if payload:
                     audio_bytes = decode_base64_audio(payload)
+                    if orchestrator.recorder:
+                        orchestrator.recorder.record_inbound(audio_bytes)
                     await orchestrator.on_audio_chunk(audio_bytes)
+            elif event == "dtmf":
+                await orchestrator.on_dtmf(message)
+            elif event == "mark":
+                await orchestrator.on_mark(message)
             elif event == "stop":
                 await orchestrator.on_call_stopped(message)
                 break
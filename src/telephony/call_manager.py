@@ -1,10 +1,11 @@
 """Manage conversations keyed by Twilio call SID."""
 
-from typing import Dict
+from typing import Dict, List
 
 from fastapi import WebSocket
 
 from src.ai.conversation import ConversationOrchestrator
+from src.telephony.admission import admission
 
 _conversations: Dict[str, ConversationOrchestrator] = {}
 
@@ -12,14 +13,33 @@ _conversations: Dict[str, ConversationOrchestrator] = {}
 def get_or_create_conversation(call_sid: str, websocket: WebSocket) -> ConversationOrchestrator:
     """Return an existing orchestrator or create a new one."""
     if call_sid not in _conversations:
-        _conversations[call_sid] = ConversationOrchestrator(
-            call_sid=call_sid,
-            websocket=websocket,
-            on_cleanup=lambda: end_conversation(call_sid),
+        register_conversation(
+            ConversationOrchestrator(
+                call_sid=call_sid,
+                websocket=websocket,
+                on_cleanup=lambda: end_conversation(call_sid),
+            )
         )
     return _conversations[call_sid]
 
 
+def register_conversation(orchestrator: ConversationOrchestrator) -> None:
+    """Track a prebuilt orchestrator (e.g. one with replay components) for its call."""
+    _conversations[orchestrator.call_sid] = orchestrator
+    admission.claim(orchestrator.call_sid)
+
+
 def end_conversation(call_sid: str) -> None:
     """Remove conversation from registry."""
     _conversations.pop(call_sid, None)
+    admission.release(call_sid)
+
+
+def active_conversations() -> List[ConversationOrchestrator]:
+    return list(_conversations.values())
+
+
+def discard_conversation(orchestrator: ConversationOrchestrator) -> None:
+    """End ``orchestrator``'s registration unless its call SID now belongs to another one."""
+    if _conversations.get(orchestrator.call_sid) is orchestrator:
+        end_conversation(orchestrator.call_sid)
@@ -0,0 +1,116 @@
+"""Capture of raw Twilio media sessions for deterministic replay.
+
+Each call with ``CAPTURE_ENABLED`` produces ``<call_sid>.jsonl.gz`` with one
+entry per line, timestamped in seconds since the websocket connected:
+
+- ``{"t": .., "kind": "twilio", "raw": "<message text>"}`` — every inbound
+  message exactly as received
+- ``{"t": .., "kind": "transcript", "frame": n, "text": ..}`` — a final
+  transcript, delivered after the ``n``-th media frame
+- ``{"t": .., "kind": "llm", "text": .., "function_call": .., "function_args": ..}``
+  — each Gemini response in order
+
+The transcript and LLM entries let ``src.telephony.replay`` rerun the session
+without calling Google. Lines are buffered and appended to the gzip file on
+the recording executor.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from config.settings import settings
+from src.utils.executors import recording_executor
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+def _append_lines(path: Path, lines: List[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Each append adds a gzip member; readers see one continuous stream
+    with gzip.open(path, "at", encoding="utf-8") as capture:
+        capture.writelines(lines)
+
+
+def read_capture(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield capture entries in order (plain or gzipped JSONL)."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as capture:
+        for line in capture:
+            if line.strip():
+                yield json.loads(line)
+
+
+class SessionCapture:
+    """Buffers one call's entries and writes them out in the background."""
+
+    def __init__(self, call_sid: str, directory: Optional[str] = None, flush_every: Optional[int] = None):
+        self.call_sid = call_sid
+        self.directory = Path(directory or settings.capture_dir)
+        self.path = self.directory / f"{call_sid}.jsonl.gz"
+        self.flush_every = flush_every or settings.capture_flush_every
+        self.frames = 0
+        self._started = time.monotonic()
+        self._lines: List[str] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        if self._closed:
+            return
+        entry["t"] = round(time.monotonic() - self._started, 4)
+        self._lines.append(json.dumps(entry, default=str) + "\n")
+        if len(self._lines) >= self.flush_every and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flush())
+
+    def record_message(self, raw: str, event: Optional[str]) -> None:
+        if event == "media":
+            self.frames += 1
+        self._add({"kind": "twilio", "raw": raw})
+
+    def record_transcript(self, text: str) -> None:
+        self._add({"kind": "transcript", "frame": self.frames, "text": text})
+
+    def record_llm(self, response) -> None:
+        self._add(
+            {
+                "kind": "llm",
+                "text": response.text,
+                "function_call": response.function_call,
+                "function_args": dict(response.function_args or {}),
+            }
+        )
+
+    @property
+    def buffered_bytes(self) -> int:
+        return sum(len(line) for line in self._lines)
+
+    async def _flush(self) -> None:
+        async with self._flush_lock:
+            lines, self._lines = self._lines, []
+            if not lines:
+                return
+            try:
+                await recording_executor.run(_append_lines, self.path, lines)
+            except Exception as exc:
+                metrics.incr("capture.flush_errors")
+                logger.warning("Capture flush failed for %s: %s", self.call_sid, exc)
+
+    async def close(self) -> Optional[str]:
+        """Write any buffered entries and return the capture path."""
+        if self._closed:
+            return None
+        self._closed = True
+        await self._flush()
+        if not self.path.exists():
+            return None
+        metrics.incr("capture.sessions")
+        logger.info("Captured %d media frames for %s to %s", self.frames, self.call_sid, self.path)
+        return os.fspath(self.path)
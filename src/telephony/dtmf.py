@@ -0,0 +1,113 @@
+"""Collect keypad (DTMF) digits from Twilio ``dtmf`` stream events.
+
+Twilio sends one event per key press. ``DtmfCollector`` groups them into a
+sequence that is complete when the caller presses the terminator (``#``),
+reaches ``max_digits``, or stops pressing keys for ``inter_digit_timeout``
+seconds. ``*`` clears what has been typed so far.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+DIGITS = set("0123456789")
+CLEAR_KEY = "*"
+KEYPAD_PREFIX = "[keypad]"
+
+
+def keypad_transcript(digits: str) -> str:
+    """How keyed-in digits appear in the conversation (see SYSTEM_PROMPT)."""
+    return f"{KEYPAD_PREFIX} {digits}"
+
+
+@dataclass(frozen=True)
+class KeypadInput:
+    digits: str
+    reason: str  # "terminator", "max_digits" or "timeout"
+    elapsed_ms: float  # first key press to completion
+
+
+class DtmfCollector:
+    """Per-call digit buffer; calls ``on_complete`` once per finished sequence.
+
+    After an inter-digit timeout ``on_complete`` runs in the collector's timer
+    task, which ``close`` cancels, so it should hand the sequence off rather
+    than run a whole turn.
+    """
+
+    def __init__(
+        self,
+        on_complete: Callable[[KeypadInput], Awaitable[None]],
+        inter_digit_timeout: float = 3.0,
+        terminator: str = "#",
+        max_digits: int = 12,
+    ):
+        self._on_complete = on_complete
+        self.inter_digit_timeout = inter_digit_timeout
+        self.terminator = terminator
+        self.max_digits = max_digits
+        self._digits: List[str] = []
+        self._first_press: Optional[float] = None
+        self._timer: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> str:
+        return "".join(self._digits)
+
+    async def press(self, key: str) -> None:
+        """Handle one key; completes the sequence inline on terminator or length."""
+        metrics.incr("dtmf.keys")
+        self._cancel_timer()
+        if key == self.terminator:
+            if self._digits:
+                await self._complete("terminator")
+            return
+        if key == CLEAR_KEY:
+            self._reset()
+            return
+        if key not in DIGITS:
+            logger.debug("Ignoring keypad key %r", key)
+            return
+        if self._first_press is None:
+            self._first_press = time.monotonic()
+        self._digits.append(key)
+        if len(self._digits) >= self.max_digits:
+            await self._complete("max_digits")
+            return
+        self._timer = asyncio.create_task(self._after_timeout())
+
+    async def _after_timeout(self) -> None:
+        await asyncio.sleep(self.inter_digit_timeout)
+        # Detach first: a key pressed now starts a new sequence and must not cancel this one
+        self._timer = None
+        await self._complete("timeout")
+
+    async def _complete(self, reason: str) -> None:
+        keyed = KeypadInput(
+            digits=self.pending,
+            reason=reason,
+            elapsed_ms=(time.monotonic() - self._first_press) * 1000,
+        )
+        self._reset()
+        metrics.incr(f"dtmf.sequences.{reason}")
+        await self._on_complete(keyed)
+
+    def _cancel_timer(self) -> None:
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+
+    def _reset(self) -> None:
+        self._digits = []
+        self._first_press = None
+
+    def close(self) -> None:
+        """Drop any partial sequence (call ended)."""
+        self._cancel_timer()
+        self._reset()
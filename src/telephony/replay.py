@@ -0,0 +1,230 @@
+"""Deterministic replay of captured Twilio media sessions.
+
+A capture (see ``src.telephony.capture``) is fed back through
+``handle_audio_stream`` by a fake websocket, either on its original schedule
+(scaled by ``speed``) or as fast as possible (``speed=0``). STT and Gemini
+are replaced by the transcripts and responses recorded in the capture, TTS
+by silence after a fixed latency, and bookings go to a private in-memory
+calendar, so reruns differ only where the code under test does and never
+touch real appointments. Each turn's timing is reported as one JSON line, which makes
+reports from two versions easy to diff.
+"""
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import WebSocketDisconnect
+
+from src.ai.conversation import ConversationOrchestrator
+from src.ai.gemini_client import GeminiResponse
+from src.business.availability import AvailabilityIndex, Slot, parse_slot_time
+from src.business.handlers import BusinessHandlers
+from src.telephony.audio_stream import handle_audio_stream
+from src.telephony.call_manager import end_conversation, register_conversation
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FRAME_MS = 20  # Twilio media frames carry 20 ms of audio
+MULAW_SILENCE = b"\xff"
+
+
+@dataclass
+class TurnTiming:
+    """Timing of one replayed turn, measured from the moment the transcript arrived."""
+
+    turn: int
+    transcript: str
+    audio_ms: int  # position in the caller's audio when the transcript was delivered
+    first_audio_ms: Optional[int]  # until the response (not filler) started streaming
+    complete_ms: int  # until the turn handler returned
+    llm_calls: int
+    filler: bool
+
+
+class ReplayWebSocket:
+    """Serves captured messages to ``handle_audio_stream`` and records what it sends."""
+
+    def __init__(self, messages: List[Tuple[float, str]], speed: float = 1.0):
+        self._messages = deque(messages)
+        self.speed = speed
+        self.sent: List[Tuple[float, Dict[str, Any]]] = []
+        self._start: Optional[float] = None
+
+    async def accept(self) -> None:
+        self._start = asyncio.get_running_loop().time()
+
+    async def receive_text(self) -> str:
+        if not self._messages:
+            raise WebSocketDisconnect(code=1000)
+        offset, raw = self._messages.popleft()
+        if self.speed > 0:
+            loop = asyncio.get_running_loop()
+            delay = self._start + offset / self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return raw
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        self.sent.append((asyncio.get_running_loop().time(), data))
+
+    async def close(self) -> None:
+        pass
+
+
+class ReplaySTT:
+    """Delivers recorded transcripts after the same media frame as in the capture."""
+
+    def __init__(self, transcripts: Iterable[Tuple[int, str]]):
+        self._pending = deque(transcripts)
+        self.frames = 0
+
+    async def start_stream(self) -> None:
+        pass
+
+    async def process_audio_chunk(self, audio_data: bytes) -> None:
+        self.frames += 1
+
+    async def get_transcript(self, timeout: float = 0.0) -> Optional[str]:
+        if self._pending and self._pending[0][0] <= self.frames:
+            return self._pending.popleft()[1]
+        return None
+
+    async def close(self) -> None:
+        pass
+
+
+class ReplayGemini:
+    """Returns recorded Gemini responses in order after a fixed latency."""
+
+    def __init__(self, responses: Iterable[GeminiResponse], latency_ms: int = 0):
+        self._responses = deque(responses)
+        self.latency = latency_ms / 1000
+        self.calls = 0
+
+    async def _next(self) -> GeminiResponse:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self._responses:
+            return self._responses.popleft()
+        return GeminiResponse(text="Okay.")
+
+    async def generate_response(self, history, user_message, tier=None) -> GeminiResponse:
+        return await self._next()
+
+    async def send_function_result(self, history, function_name, result, tier=None) -> GeminiResponse:
+        return await self._next()
+
+    async def summarize(self, text: str) -> str:
+        return ""
+
+
+class FakeTTS:
+    """Silence roughly as long as the text would take to say, after a fixed latency."""
+
+    def __init__(self, latency_ms: int = 0, bytes_per_char: int = 500):
+        self.latency = latency_ms / 1000
+        self.bytes_per_char = bytes_per_char
+
+    async def synthesize(self, text: str) -> bytes:
+        await asyncio.sleep(self.latency)
+        return MULAW_SILENCE * (len(text) * self.bytes_per_char)
+
+
+class ReplayHandlers(BusinessHandlers):
+    """Business tools against a fresh in-memory calendar; no appointment rows are written."""
+
+    def __init__(self, faqs=None, call_sid: Optional[str] = None):
+        super().__init__(faqs=faqs, call_sid=call_sid, calendar=AvailabilityIndex.from_settings())
+
+    async def book_appointment(self, date: str, time: str) -> Dict[str, Any]:
+        start = parse_slot_time(date, time)
+        if start is None:
+            return await super().book_appointment(date, time)
+        for resource in self.calendar.resources:
+            slot = Slot(resource, start)
+            if self.calendar.is_free(slot, self.call_sid):
+                self.calendar.mark_booked(slot)
+                return {"confirmed": True, **slot.as_dict(), "message": f"Appointment booked for {slot.label}."}
+        return self._offer_alternatives(start, date, time)
+
+
+def _call_sid(messages: List[Tuple[float, str]]) -> str:
+    for _, raw in messages:
+        message = json.loads(raw)
+        if message.get("event") == "start":
+            return message.get("start", {}).get("callSid") or "replay"
+    return "replay"
+
+
+async def replay_session(
+    entries: Iterable[Dict[str, Any]],
+    speed: float = 1.0,
+    llm_latency_ms: int = 0,
+    tts_latency_ms: int = 0,
+) -> List[TurnTiming]:
+    """Replay one captured session and return per-turn timings."""
+    entries = list(entries)
+    messages = [(entry["t"], entry["raw"]) for entry in entries if entry["kind"] == "twilio"]
+    stt = ReplaySTT((entry["frame"], entry["text"]) for entry in entries if entry["kind"] == "transcript")
+    gemini = ReplayGemini(
+        (
+            GeminiResponse(
+                text=entry.get("text"),
+                function_call=entry.get("function_call"),
+                function_args=entry.get("function_args") or {},
+            )
+            for entry in entries
+            if entry["kind"] == "llm"
+        ),
+        latency_ms=llm_latency_ms,
+    )
+    call_sid = _call_sid(messages)
+    websocket = ReplayWebSocket(messages, speed)
+    orchestrator = ConversationOrchestrator(
+        call_sid,
+        websocket,
+        on_cleanup=lambda: end_conversation(call_sid),
+        stt=stt,
+        gemini=gemini,
+        tts=FakeTTS(tts_latency_ms),
+        handlers_factory=ReplayHandlers,
+    )
+    # Never re-record a replay
+    orchestrator.capture = None
+    orchestrator.recorder = None
+
+    turns: List[TurnTiming] = []
+    handle_user_input = orchestrator.handle_user_input
+
+    async def timed_handle_user_input(transcript: str) -> None:
+        loop = asyncio.get_running_loop()
+        started, sent_before, calls_before = loop.time(), len(websocket.sent), gemini.calls
+        await handle_user_input(transcript)
+        sent = [data for _, data in websocket.sent[sent_before:]]
+        times = [ts for ts, _ in websocket.sent[sent_before:]]
+        mark = next((i for i, data in enumerate(sent) if data.get("event") == "mark"), None)
+        turns.append(
+            TurnTiming(
+                turn=len(turns) + 1,
+                transcript=transcript,
+                audio_ms=stt.frames * FRAME_MS,
+                first_audio_ms=round((times[mark] - started) * 1000) if mark is not None else None,
+                complete_ms=round((loop.time() - started) * 1000),
+                llm_calls=gemini.calls - calls_before,
+                filler=mark is not None and any(data.get("event") == "media" for data in sent[:mark]),
+            )
+        )
+
+    orchestrator.handle_user_input = timed_handle_user_input
+    register_conversation(orchestrator)
+    await handle_audio_stream(websocket, call_sid)
+    return turns
+
+
+def format_report(turns: List[TurnTiming]) -> str:
+    """One JSON object per turn with stable key order, for diffing between runs."""
+    return "".join(json.dumps(asdict(turn), sort_keys=True) + "\n" for turn in turns)
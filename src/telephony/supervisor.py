@@ -0,0 +1,187 @@
+"""Call supervisor: per-call resource accounting and stale call reaping.
+
+A call normally ends with Twilio's ``stop`` event. If that never arrives (a
+half-open socket, a crashed stream handler) its orchestrator, STT thread or
+task and buffers would stay registered for the life of the worker. Every
+``CALL_SUPERVISOR_INTERVAL`` seconds the supervisor measures each registered
+call and reaps it when:
+
+- ``orphaned``: no stream handler is running for it;
+- ``idle``: no message from Twilio for ``CALL_IDLE_TIMEOUT`` (Twilio sends
+  media every 20 ms, silence included, for as long as the call is up);
+- ``max_age``: older than ``CALL_MAX_SECONDS``.
+
+Teardown runs in its own task and never blocks the loop: the stream handler
+is cancelled so its usual ``finally`` cleanup runs, bounded by
+``CALL_TEARDOWN_TIMEOUT``. The registration is dropped either way.
+
+Memory estimates count what a call buffers (queued STT audio, recording
+chunks, unflushed capture lines, conversation history), not interpreter
+overhead; they are published as gauges and on ``/debug/calls``.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Set
+
+from config.settings import settings
+from src.ai.context import CHARS_PER_TOKEN
+from src.database.call_logger import log_call_end
+from src.telephony.call_manager import active_conversations, discard_conversation
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CallResources:
+    call_sid: str
+    age_s: float
+    idle_s: float
+    stream: str  # "running", "done" or "none"
+    threads: int
+    audio_queue: int
+    audio_bytes: int
+    transcript_queue: int
+    recording_bytes: int
+    capture_bytes: int
+    context_bytes: int
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.audio_bytes + self.recording_bytes + self.capture_bytes + self.context_bytes
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "memory_bytes": self.memory_bytes}
+
+
+def measure(orchestrator, now: Optional[float] = None) -> CallResources:
+    """Snapshot one call's resources (cheap; safe to run every sweep)."""
+    now = time.monotonic() if now is None else now
+    task = orchestrator.stream_task
+    stt_resources = getattr(orchestrator.stt, "resources", None)
+    stt: Dict[str, int] = stt_resources() if stt_resources else {}
+    return CallResources(
+        call_sid=orchestrator.call_sid,
+        age_s=round(now - orchestrator.started_at, 1),
+        idle_s=round(now - orchestrator.last_activity, 1),
+        stream="none" if task is None else ("done" if task.done() else "running"),
+        threads=stt.get("threads", 0),
+        audio_queue=stt.get("audio_queue", 0),
+        audio_bytes=stt.get("audio_bytes", 0),
+        transcript_queue=stt.get("transcript_queue", 0),
+        recording_bytes=orchestrator.recorder.buffered_bytes if orchestrator.recorder else 0,
+        capture_bytes=orchestrator.capture.buffered_bytes if orchestrator.capture else 0,
+        context_bytes=orchestrator.context.prompt_tokens() * CHARS_PER_TOKEN,
+    )
+
+
+class CallSupervisor:
+    """Periodic sweep over the registered calls."""
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        idle_timeout: float = 60.0,
+        max_age: float = 4 * 3600,
+        teardown_timeout: float = 5.0,
+    ):
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.teardown_timeout = teardown_timeout
+        self._task: Optional[asyncio.Task] = None
+        self._reaping: Set[str] = set()
+        self._teardowns: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.sweep()
+            except Exception as exc:
+                logger.error("Call supervisor sweep failed: %s", exc)
+
+    def snapshot(self) -> List[CallResources]:
+        now = time.monotonic()
+        return [measure(orchestrator, now) for orchestrator in active_conversations()]
+
+    def _stale_reason(self, resources: CallResources) -> Optional[str]:
+        if resources.stream != "running":
+            return "orphaned"
+        if resources.idle_s >= self.idle_timeout:
+            return "idle"
+        if resources.age_s >= self.max_age:
+            return "max_age"
+        return None
+
+    def sweep(self) -> List[str]:
+        """Publish per-call accounting and start teardown of stale calls; returns reaped SIDs."""
+        now = time.monotonic()
+        reaped = []
+        totals = {"threads": 0, "audio_bytes": 0, "memory_bytes": 0}
+        conversations = active_conversations()
+        for orchestrator in conversations:
+            resources = measure(orchestrator, now)
+            totals["threads"] += resources.threads
+            totals["audio_bytes"] += resources.audio_bytes
+            totals["memory_bytes"] += resources.memory_bytes
+            metrics.observe("calls.memory_bytes", resources.memory_bytes)
+            reason = self._stale_reason(resources)
+            if reason and orchestrator.call_sid not in self._reaping:
+                reaped.append(orchestrator.call_sid)
+                self._reap(orchestrator, reason, resources)
+        metrics.set_gauge("calls.active", len(conversations))
+        metrics.set_gauge("calls.stt_threads", totals["threads"])
+        metrics.set_gauge("calls.buffered_audio_bytes", totals["audio_bytes"])
+        metrics.set_gauge("calls.memory_bytes", totals["memory_bytes"])
+        return reaped
+
+    def _reap(self, orchestrator, reason: str, resources: CallResources) -> None:
+        logger.warning(
+            "Reaping %s call %s (age %.0fs, idle %.0fs, stream %s)",
+            reason, orchestrator.call_sid, resources.age_s, resources.idle_s, resources.stream,
+        )
+        metrics.incr(f"calls.reaped.{reason}")
+        self._reaping.add(orchestrator.call_sid)
+        task = asyncio.create_task(self._teardown(orchestrator))
+        self._teardowns.add(task)
+        task.add_done_callback(self._teardowns.discard)
+
+    async def _teardown(self, orchestrator) -> None:
+        started = time.monotonic()
+        try:
+            task = orchestrator.stream_task
+            if task is not None and not task.done():
+                # The handler's finally block runs cleanup and closes the socket
+                task.cancel()
+                await asyncio.wait({task}, timeout=self.teardown_timeout)
+            elif task is None:
+                await asyncio.wait_for(orchestrator.cleanup(), self.teardown_timeout)
+            if not orchestrator.stopped:
+                await log_call_end(orchestrator.call_sid)
+        except Exception as exc:
+            logger.error("Teardown of call %s failed: %s", orchestrator.call_sid, exc)
+        finally:
+            discard_conversation(orchestrator)
+            self._reaping.discard(orchestrator.call_sid)
+            metrics.observe("calls.teardown_ms", (time.monotonic() - started) * 1000)
+
+
+call_supervisor = CallSupervisor(
+    interval=settings.call_supervisor_interval,
+    idle_timeout=settings.call_idle_timeout,
+    max_age=settings.call_max_seconds,
+    teardown_timeout=settings.call_teardown_timeout,
+)
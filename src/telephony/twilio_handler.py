@@ -1,16 +1,51 @@
 """Twilio webhook utilities."""
 
-from twilio.twiml.voice_response import Connect, Stream, VoiceResponse
+from typing import Optional
 
 from config.settings import settings
+from src.utils.lazy import lazy_import
 
+voice_response = lazy_import("twilio.twiml.voice_response")
+twilio_rest = lazy_import("twilio.rest")
 
-def handle_incoming_call() -> str:
+
+def _connect_stream(response, called_number: Optional[str]) -> None:
+    connect = voice_response.Connect()
+    stream = connect.stream(url=settings.websocket_stream_url)
+    if called_number:
+        # Arrives as start.customParameters.To; selects the tenant profile
+        stream.parameter(name="To", value=called_number)
+    response.append(connect)
+
+
+def handle_incoming_call(called_number: Optional[str] = None) -> str:
     """Return TwiML that connects the caller to a media stream."""
-    response = VoiceResponse()
+    response = voice_response.VoiceResponse()
     # Fallback greeting while stream connects
     response.say("Connecting you to our AI assistant. Please hold a moment.")
-    connect = Connect()
-    connect.stream(url=settings.websocket_stream_url)
-    response.append(connect)
+    _connect_stream(response, called_number)
     return str(response)
+
+
+def handle_busy_call() -> str:
+    """Return TwiML that politely turns the caller away when we are overloaded."""
+    response = voice_response.VoiceResponse()
+    response.say(
+        "Sorry, all of our lines are busy right now. Please call back in a few minutes."
+    )
+    response.hangup()
+    return str(response)
+
+
+def handle_say_and_reconnect(text: str, called_number: Optional[str] = None) -> str:
+    """Return TwiML that speaks ``text`` with Twilio's own TTS, then reopens the stream."""
+    response = voice_response.VoiceResponse()
+    response.say(text)
+    _connect_stream(response, called_number)
+    return str(response)
+
+
+def redirect_call(call_sid: str, twiml: str) -> None:
+    """Replace the live call's TwiML via the REST API (blocking)."""
+    client = twilio_rest.Client(settings.twilio_account_sid, settings.twilio_auth_token)
+    client.calls(call_sid).update(twiml=twiml)
@@ -0,0 +1,70 @@
+"""Which call is the current task or thread working for.
+
+``bind_call`` is called once per media stream; the call SID then follows the
+work through ``current_call_sid`` (tasks copy the context they are created
+in) and through STT threads, which bind themselves with ``bind_thread``.
+
+Samplers running on another thread cannot read a task's context, so bound
+tasks and threads are also recorded in plain dicts keyed by id; see
+``call_for_task`` / ``call_for_thread``. Child tasks are recorded only while
+``install_task_factory`` is active (the profiler turns it on), keeping the
+per-task cost at zero otherwise.
+"""
+
+import asyncio
+import threading
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+current_call_sid: ContextVar[Optional[str]] = ContextVar("current_call_sid", default=None)
+
+_task_calls: Dict[int, str] = {}
+_thread_calls: Dict[int, str] = {}
+
+
+def _tag_task(task: asyncio.Task, call_sid: str) -> None:
+    key = id(task)
+    _task_calls[key] = call_sid
+    task.add_done_callback(lambda _: _task_calls.pop(key, None))
+
+
+def bind_call(call_sid: str) -> None:
+    """Mark the current task (and everything it spawns) as working for ``call_sid``."""
+    current_call_sid.set(call_sid)
+    task = asyncio.current_task()
+    if task is not None:
+        _tag_task(task, call_sid)
+
+
+def bind_thread(call_sid: Optional[str]) -> None:
+    if call_sid:
+        _thread_calls[threading.get_ident()] = call_sid
+
+
+def unbind_thread() -> None:
+    _thread_calls.pop(threading.get_ident(), None)
+
+
+def call_for_task(task: Optional[asyncio.Task]) -> Optional[str]:
+    return _task_calls.get(id(task)) if task is not None else None
+
+
+def call_for_thread(ident: int) -> Optional[str]:
+    return _thread_calls.get(ident)
+
+
+def install_task_factory(loop: asyncio.AbstractEventLoop) -> None:
+    """Record tasks created under a bound call so samplers can attribute them."""
+    previous = loop.get_task_factory()
+
+    def factory(loop, coro, **kwargs):
+        if previous is not None:
+            task = previous(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        call_sid = current_call_sid.get()
+        if call_sid:
+            _tag_task(task, call_sid)
+        return task
+
+    loop.set_task_factory(factory)
@@ -0,0 +1,212 @@
+"""Per-backend circuit breakers.
+
+A breaker watches the last ``window`` calls to a backend. Once at least
+``min_calls`` have been seen and either the failure rate reaches
+``error_rate`` or the share of calls slower than ``slow_call_ms`` reaches
+``slow_rate``, it opens: calls fail fast with ``CircuitOpenError`` instead
+of paying the backend's timeout. After ``reset_timeout`` seconds one probe
+call is let through (half-open); its outcome closes or re-opens the breaker.
+A probe that ends without an outcome (cancelled, or a stream that closed
+before answering) is released so the next call can probe instead. A probe
+that never reports back is given up on after another ``reset_timeout``.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe: outcomes are recorded from the loop and from worker threads."""
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        error_rate: float = 0.5,
+        slow_call_ms: Optional[float] = None,
+        slow_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_ms = slow_call_ms
+        self.slow_rate = slow_rate
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._publish()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; counts rejections."""
+        return self.admit()[0]
+
+    def admit(self) -> Tuple[bool, bool]:
+        """Like ``allow``; also says whether the admitted call is the half-open probe.
+
+        The probe's owner must report an outcome or call ``release``.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+                self._publish()
+            if self._state == CLOSED:
+                return True, False
+            if self._state == HALF_OPEN:
+                stale = self.reset_timeout and now - self._probe_started >= self.reset_timeout
+                if self._probe_in_flight and stale:
+                    logger.warning("Circuit %s probe never reported back; probing again", self.name)
+                    metrics.incr(f"breaker.{self.name}.stale_probes")
+                    self._probe_in_flight = False
+                if not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    self._probe_started = now
+                    return True, True
+        metrics.incr(f"breaker.{self.name}.rejected")
+        return False, False
+
+    def release(self) -> None:
+        """The probe ended without an outcome; let the next call probe instead."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self, latency_ms: Optional[float] = None) -> None:
+        slow = bool(self.slow_call_ms and latency_ms is not None and latency_ms >= self.slow_call_ms)
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        self._record(failed=True, slow=False)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                if failed or slow:
+                    self._trip("probe failed")
+                else:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                    logger.info("Circuit %s closed", self.name)
+                    self._publish()
+                return
+            self._outcomes.append((failed, slow))
+            if self._state != CLOSED or len(self._outcomes) < self.min_calls:
+                return
+            total = len(self._outcomes)
+            failures = sum(1 for f, _ in self._outcomes if f)
+            slow_calls = sum(1 for _, s in self._outcomes if s)
+            if failures / total >= self.error_rate:
+                self._trip(f"{failures}/{total} calls failed")
+            elif self.slow_call_ms and slow_calls / total >= self.slow_rate:
+                self._trip(f"{slow_calls}/{total} calls slower than {self.slow_call_ms:.0f} ms")
+
+    def _trip(self, reason: str) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        metrics.incr(f"breaker.{self.name}.opened")
+        logger.warning("Circuit %s opened: %s", self.name, reason)
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge(f"breaker.{self.name}.state", _STATE_GAUGE[self._state])
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` through the breaker, raising ``CircuitOpenError`` when open."""
+        admitted, probe = self.admit()
+        if not admitted:
+            raise CircuitOpenError(self.name)
+        started = time.monotonic()
+        recorded = False
+        try:
+            result = await func()
+        except Exception:
+            recorded = True
+            self.record_failure()
+            raise
+        else:
+            recorded = True
+            self.record_success((time.monotonic() - started) * 1000)
+            return result
+        finally:
+            if probe and not recorded:
+                # Cancelled: no verdict on the backend, so let the next call probe it
+                self.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes = list(self._outcomes)
+        total = len(outcomes)
+        return {
+            "state": self.state,
+            "calls": total,
+            "failure_rate": round(sum(1 for f, _ in outcomes if f) / total, 3) if total else 0.0,
+            "slow_rate": round(sum(1 for _, s in outcomes if s) / total, 3) if total else 0.0,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self._state = CLOSED
+            self._probe_in_flight = False
+            self._publish()
+
+
+def _breaker(name: str, slow_call_ms: Optional[float]) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        window=settings.breaker_window,
+        min_calls=settings.breaker_min_calls,
+        error_rate=settings.breaker_error_rate,
+        slow_call_ms=slow_call_ms,
+        slow_rate=settings.breaker_slow_rate,
+        reset_timeout=settings.breaker_reset_seconds,
+    )
+
+
+stt_breaker = _breaker("stt", None)
+tts_breaker = _breaker("tts", settings.tts_slow_call_ms)
+llm_breaker = _breaker("llm", settings.llm_slow_call_ms)
+
+_BREAKERS = (stt_breaker, tts_breaker, llm_breaker)
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    return {breaker.name: breaker.snapshot() for breaker in _BREAKERS}
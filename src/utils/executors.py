@@ -0,0 +1,140 @@
+"""Named, sized thread pools per subsystem.
+
+Blocking client calls (Gemini, TTS, database) each get their own pool instead
+of sharing the loop's default executor, so a slow database cannot starve TTS.
+Every pool reports queue wait time and saturation to the metrics registry.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class InstrumentedExecutor:
+    """ThreadPoolExecutor wrapper with queue-wait and saturation metrics."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-worker")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+    def _publish(self) -> None:
+        metrics.set_gauge(f"executor.{self.name}.queued", self._queued)
+        metrics.set_gauge(f"executor.{self.name}.active", self._active)
+        metrics.set_gauge(f"executor.{self.name}.saturation", round(self._active / self.max_workers, 3))
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` in this pool; contextvars propagate like ``asyncio.to_thread``."""
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        with self._lock:
+            self._queued += 1
+            self._publish()
+
+        started = False
+
+        def _call() -> T:
+            nonlocal started
+            metrics.observe(f"executor.{self.name}.queue_wait_ms", (time.monotonic() - submitted) * 1000)
+            with self._lock:
+                started = True
+                self._queued -= 1
+                self._active += 1
+                self._publish()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._publish()
+
+        def _done(future: Future) -> None:
+            # Cancelled (caller gave up, or shutdown) before a worker picked it up
+            with self._lock:
+                if not started:
+                    self._queued -= 1
+                    self._publish()
+
+        ctx = contextvars.copy_context()
+        future = self._pool.submit(ctx.run, _call)
+        future.add_done_callback(_done)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            queued, active = self._queued, self._active
+        return {
+            "max_workers": self.max_workers,
+            "active": active,
+            "queued": queued,
+            "queue_wait_ms_p95": metrics.quantile(f"executor.{self.name}.queue_wait_ms", 95),
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ThreadBudget:
+    """Global cap on dedicated (unpooled) threads such as per-call STT streams."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_use >= self.limit:
+                metrics.incr(f"threads.{self.name}.rejected")
+                return False
+            self._in_use += 1
+            metrics.set_gauge(f"threads.{self.name}.active", self._in_use)
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_use = max(0, self._in_use - 1)
+            metrics.set_gauge(f"threads.{self.name}.active", self._in_use)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"limit": self.limit, "active": self._in_use}
+
+
+llm_executor = InstrumentedExecutor("llm", settings.llm_executor_workers)
+tts_executor = InstrumentedExecutor("tts", settings.tts_executor_workers)
+db_executor = InstrumentedExecutor("db", settings.db_executor_workers)
+recording_executor = InstrumentedExecutor("recording", settings.recording_writer_workers)
+export_executor = InstrumentedExecutor("export", settings.export_executor_workers)
+stt_threads = ThreadBudget("stt", settings.stt_max_threads)
+
+_EXECUTORS = (llm_executor, tts_executor, db_executor, recording_executor, export_executor)
+
+
+def executor_stats() -> Dict[str, Any]:
+    stats = {executor.name: executor.stats() for executor in _EXECUTORS}
+    stats["stt_threads"] = stt_threads.stats()
+    return stats
+
+
+def shutdown_executors() -> None:
+    for executor in _EXECUTORS:
+        executor.shutdown()
@@ -1,14 +1,26 @@
 """Helper utilities for retries and safe operations."""
 
 import asyncio
+import random
 from functools import wraps
-from typing import Any, Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
 
-def retry_async(max_attempts: int = 3, delay: float = 1.0) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    """Retry an async function with backoff."""
+def retry_async(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    jitter: float = 0.0,
+    on_retry: Optional[Callable[[int, Exception], None]] = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Retry an async function with backoff.
+
+    The wait before retry ``n`` is ``delay * n``, scaled by a random factor in
+    ``[1 - jitter, 1 + jitter]`` so callers that failed together do not retry
+    in lockstep. ``on_retry(attempt, exc)`` is called before each wait.
+    Cancellation is never retried.
+    """
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
@@ -16,16 +28,36 @@ def retry_async(max_attempts: int = 3, delay: float = 1.0) -> Callable[[Callable
             for attempt in range(max_attempts):
                 try:
                     return await func(*args, **kwargs)
-                except Exception:
+                except Exception as exc:
                     if attempt == max_attempts - 1:
                         raise
-                    await asyncio.sleep(delay * (attempt + 1))
+                    if on_retry:
+                        on_retry(attempt + 1, exc)
+                    wait = delay * (attempt + 1)
+                    if jitter:
+                        wait *= random.uniform(1 - jitter, 1 + jitter)
+                    await asyncio.sleep(wait)
 
         return wrapper
 
     return decorator
 
 
+def put_drop_oldest(queue: "asyncio.Queue[T]", item: T) -> bool:
+    """Put without blocking, evicting the oldest item if full; True if one was dropped."""
+    dropped = False
+    while True:
+        try:
+            queue.put_nowait(item)
+            return dropped
+        except asyncio.QueueFull:
+            try:
+                queue.get_nowait()
+                dropped = True
+            except asyncio.QueueEmpty:
+                pass
+
+
 def chunk_bytes(data: bytes, size: int = 3200) -> list[bytes]:
     """Split bytes into chunks; useful for streaming audio."""
     return [data[i : i + size] for i in range(0, len(data), size)]
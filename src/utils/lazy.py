@@ -0,0 +1,51 @@
+"""Deferred imports for heavy client libraries."""
+
+import importlib
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the real module on first attribute access.
+
+    Lets ``google.cloud.speech``, ``google.generativeai`` and friends stay out
+    of the import path of ``src.api.main``; the warm-up phase (or the first
+    real use) pays for the import instead.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_module: Optional[ModuleType] = None
+        self._lazy_lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        if self._lazy_module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    started = time.monotonic()
+                    module = importlib.import_module(self.__name__)
+                    import_times[self.__name__] = round((time.monotonic() - started) * 1000, 1)
+                    logger.debug("Imported %s in %.1f ms", self.__name__, import_times[self.__name__])
+                    self._lazy_module = module
+        return self._lazy_module
+
+    @property
+    def loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+
+# module name -> import time in ms, for startup reporting
+import_times: Dict[str, float] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
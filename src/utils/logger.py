@@ -1,18 +1,167 @@
-"""Simple logger wrapper honoring configured log level."""
+"""Logging pipeline that never blocks the event loop.
 
+Records are enqueued by a non-blocking ``QueueHandler`` and written to stdout
+by a ``QueueListener`` thread, so a slow stdout consumer delays the writer,
+not audio. On the way in each record gets:
+
+- ``call_sid`` from ``src.utils.call_context`` (read in the producing task
+  or thread, where the context is still right);
+- a rate limit: INFO and below are allowed ``LOG_RATE_LIMIT`` records per
+  second per message template, then one in ``LOG_SAMPLE_EVERY``. The next
+  record let through carries the number suppressed.
+
+Records dropped by the limiter or because the queue is full are counted as
+``logging.dropped.rate_limited`` / ``logging.dropped.queue_full``.
+``LOG_FORMAT=json`` (default) writes one JSON object per line.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 from config.settings import settings
+from src.utils.call_context import current_call_sid
+from src.utils.metrics import metrics
+
+MAX_RATE_LIMIT_KEYS = 4096
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class CallContextFilter(logging.Filter):
+    """Stamp records with the call SID of the task or thread that logged them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "call_sid"):
+            record.call_sid = current_call_sid.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Per-template rate limit with sampling beyond it; WARNING and above always pass."""
+
+    def __init__(self, per_second: int, sample_every: int):
+        super().__init__()
+        self.per_second = per_second
+        self.sample_every = max(1, sample_every)
+        self._lock = threading.Lock()
+        # (logger, template) -> [window start, count in window, suppressed since last pass]
+        self._windows: Dict[tuple, List[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.per_second <= 0:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if len(self._windows) > MAX_RATE_LIMIT_KEYS:
+                # Unique messages (pre-formatted strings) would grow this forever
+                self._windows = {k: w for k, w in self._windows.items() if now - w[0] < 1.0}
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= 1.0:
+                suppressed = window[2] if window else 0
+                window = self._windows[key] = [now, 0, suppressed]
+            window[1] += 1
+            over = window[1] - self.per_second
+            if over > 0 and over % self.sample_every:
+                window[2] += 1
+                metrics.incr("logging.dropped.rate_limited")
+                return False
+            if window[2]:
+                record.suppressed = int(window[2])
+                window[2] = 0
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Drop (and count) records instead of waiting when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve args and tracebacks now (they may change or die later), but
+        # leave formatting to the writer thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.incr("logging.dropped.queue_full")
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        call_sid = getattr(record, "call_sid", None)
+        if call_sid:
+            entry["call_sid"] = call_sid
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s [%(levelname)s] %(name)s%(call)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        call_sid = getattr(record, "call_sid", None)
+        record.call = f" [{call_sid}]" if call_sid else ""
+        return super().format(record)
+
+
+def _formatter() -> logging.Formatter:
+    return JsonFormatter() if settings.log_format == "json" else TextFormatter()
 
 
 def _configure_logging() -> None:
-    """Configure root logger once."""
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    """Configure the root logger once."""
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(_formatter())
+    if settings.log_async:
+        handler: logging.Handler = NonBlockingQueueHandler(queue.Queue(maxsize=settings.log_queue_size))
+        _listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        handler = output
+    handler.addFilter(CallContextFilter())
+    handler.addFilter(RateLimitFilter(settings.log_rate_limit, settings.log_sample_every))
+    root.handlers = [handler]
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 _configure_logging()
@@ -0,0 +1,220 @@
+"""Event-loop health: slow callbacks and coroutine steps, with stack samples.
+
+Everything (media ingestion, STT bridging, WebSocket sends, DB wrappers)
+shares one asyncio loop, so a single blocking callback delays audio on every
+call. ``LoopMonitor`` finds those callbacks with two cooperating parts:
+
+- ``Handle._run`` is wrapped to time every callback the loop executes. Task
+  steps are callbacks too, so a coroutine that blocks between two awaits is
+  reported under its coroutine name (recent entries also carry the task name).
+- A watchdog thread expects a heartbeat from the loop every half threshold.
+  When the heartbeat is a full threshold late, the loop thread is stuck inside
+  some callback right now. The watchdog samples its stack with
+  ``sys._current_frames`` and attaches the sample to that callback's report.
+
+Scheduling lag percentiles come from ``LoopLagProbe`` (``loop.lag_ms``).
+"""
+
+import asyncio
+import functools
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from config.settings import settings
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+STACK_LIMIT = 30
+
+
+@dataclass
+class SlowCallback:
+    at: datetime
+    duration_ms: float
+    callback: str
+    stacks: List[List[str]] = field(default_factory=list)
+    task: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "at": self.at.isoformat(),
+            "duration_ms": round(self.duration_ms, 1),
+            "callback": self.callback,
+            "task": self.task,
+            "stacks": self.stacks,
+        }
+
+
+def _qualname(obj: Any) -> str:
+    return getattr(obj, "__qualname__", None) or type(obj).__qualname__
+
+
+def _owning_task(handle: asyncio.Handle) -> Optional[asyncio.Task]:
+    owner = getattr(getattr(handle, "_callback", None), "__self__", None)
+    return owner if isinstance(owner, asyncio.Task) else None
+
+
+def describe_callback(handle: asyncio.Handle) -> str:
+    """Stable name for what a handle runs; task steps name the task's coroutine.
+
+    This keys ``LoopMonitor.totals``, so it leaves out anything unique per
+    instance: task names (``Task-123``) and object addresses.
+    """
+    task = _owning_task(handle)
+    if task is not None:
+        return f"task {_qualname(task.get_coro())}"
+    callback = getattr(handle, "_callback", None)
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    name = _qualname(callback)
+    module = getattr(callback, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class LoopMonitor:
+    """Process-wide; ``start`` it on the loop to be watched."""
+
+    def __init__(self, threshold_ms: float = 100.0, max_offenders: int = 50, max_stacks: int = 3):
+        self.threshold = threshold_ms / 1000
+        self.max_stacks = max_stacks
+        self.recent: Deque[SlowCallback] = deque(maxlen=max_offenders)
+        # callback description -> count / total / max
+        self.totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = 0.0
+        self._stall_stacks: List[List[str]] = []
+        self._stall_started = 0.0
+        self._original_run = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._running = True
+        self._instrument()
+        self._beat()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("Loop monitor started (threshold %.0f ms)", self.threshold * 1000)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._original_run is not None:
+            asyncio.events.Handle._run = self._original_run
+            self._original_run = None
+        self._loop = None
+
+    def _instrument(self) -> None:
+        original = asyncio.events.Handle._run
+        monitor = self
+
+        def _timed_run(handle: asyncio.Handle) -> None:
+            started = time.perf_counter()
+            try:
+                original(handle)
+            finally:
+                elapsed = time.perf_counter() - started
+                if elapsed >= monitor.threshold and threading.get_ident() == monitor._loop_thread_id:
+                    monitor._record(handle, elapsed, started)
+
+        self._original_run = original
+        asyncio.events.Handle._run = _timed_run
+
+    # ── Heartbeat / watchdog ────────────────────────────────────────────
+
+    def _beat(self) -> None:
+        self._heartbeat = time.perf_counter()
+        if self._running and self._loop is not None:
+            self._loop.call_later(self.threshold / 2, self._beat)
+
+    def _watch(self) -> None:
+        while self._running:
+            time.sleep(self.threshold / 2)
+            late = time.perf_counter() - self._heartbeat
+            if late < self.threshold:
+                # Loop is healthy again; samples of a stall too short to report are dropped
+                if self._stall_stacks:
+                    with self._lock:
+                        self._stall_stacks = []
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = [line.rstrip() for line in traceback.format_stack(frame, limit=STACK_LIMIT)]
+            with self._lock:
+                if not self._stall_stacks:
+                    self._stall_started = time.perf_counter() - late
+                if len(self._stall_stacks) < self.max_stacks:
+                    self._stall_stacks.append(stack)
+            metrics.incr("loop.stall_samples")
+
+    # ── Recording ───────────────────────────────────────────────────────
+
+    def _record(self, handle: asyncio.Handle, elapsed: float, started: float) -> None:
+        with self._lock:
+            # Watchdog samples taken while this callback was running
+            stacks = self._stall_stacks if self._stall_started >= started - self.threshold else []
+            self._stall_stacks = []
+        description = describe_callback(handle)
+        task = _owning_task(handle)
+        duration_ms = elapsed * 1000
+        entry = SlowCallback(datetime.utcnow(), duration_ms, description, stacks, task.get_name() if task else None)
+        with self._lock:
+            self.recent.append(entry)
+            total = self.totals.setdefault(description, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            total["count"] += 1
+            total["total_ms"] += duration_ms
+            total["max_ms"] = max(total["max_ms"], duration_ms)
+        metrics.incr("loop.slow_callbacks")
+        metrics.observe("loop.slow_callback_ms", duration_ms)
+        logger.warning("Slow loop callback (%.0f ms): %s", duration_ms, description)
+
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        with self._lock:
+            recent = [entry.as_dict() for entry in reversed(self.recent)][:limit]
+            offenders = sorted(
+                ({"callback": name, **values} for name, values in self.totals.items()),
+                key=lambda item: item["total_ms"],
+                reverse=True,
+            )[:limit]
+        for offender in offenders:
+            offender["total_ms"] = round(offender["total_ms"], 1)
+            offender["max_ms"] = round(offender["max_ms"], 1)
+        return {
+            "running": self._running,
+            "threshold_ms": self.threshold * 1000,
+            "lag_ms": {f"p{pct}": metrics.quantile("loop.lag_ms", pct) for pct in (50, 95, 99)},
+            "offenders": offenders,
+            "recent": recent,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.recent.clear()
+            self.totals.clear()
+            self._stall_stacks = []
+
+
+loop_monitor = LoopMonitor(
+    threshold_ms=settings.loop_slow_callback_ms,
+    max_offenders=settings.loop_monitor_max_offenders,
+)
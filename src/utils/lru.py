@@ -0,0 +1,58 @@
+"""Bounded least-recently-used cache for objects that are costly to rebuild."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from src.utils.metrics import metrics
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU; reports ``lru.<name>.hits/misses/evictions`` and a size gauge."""
+
+    def __init__(self, name: str, maxsize: int = 32):
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, V]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """Return the cached value for ``key``, building it with ``factory`` on a miss.
+
+        The factory runs outside the lock; if two callers race on the same key,
+        the first stored value wins.
+        """
+        value = self.get(key)
+        if value is not None:
+            metrics.incr(f"lru.{self.name}.hits")
+            return value
+        metrics.incr(f"lru.{self.name}.misses")
+        created = factory()
+        with self._lock:
+            value = self._items.setdefault(key, created)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                metrics.incr(f"lru.{self.name}.evictions")
+            metrics.set_gauge(f"lru.{self.name}.size", len(self._items))
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+        metrics.set_gauge(f"lru.{self.name}.size", 0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
@@ -0,0 +1,94 @@
+"""In-process metrics registry for counters, gauges and latency samples."""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+DEFAULT_WINDOW = 1024
+
+
+def percentile(values: list[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank percentile of ``values`` (0-100), or None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+class MetricsRegistry:
+    """Thread-safe registry shared by the event loop and worker threads."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._window = window
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, float] = {}
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a sample (e.g. latency in ms) into a rolling window."""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._window)
+            samples.append(value)
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._gauges.get(name)
+
+    def quantile(self, name: str, pct: float) -> Optional[float]:
+        with self._lock:
+            values = list(self._samples.get(name, ()))
+        return percentile(values, pct)
+
+    def sample_count(self, name: str) -> int:
+        with self._lock:
+            return len(self._samples.get(name, ()))
+
+    def ratio(self, numerator: str, denominator: str) -> Optional[float]:
+        """Return counter ratio, or None when the denominator is zero."""
+        with self._lock:
+            total = self._counters.get(denominator, 0)
+            if not total:
+                return None
+            return self._counters.get(numerator, 0) / total
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable view of all metrics."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            samples = {name: list(values) for name, values in self._samples.items()}
+        summaries = {
+            name: {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+            }
+            for name, values in samples.items()
+        }
+        return {"counters": counters, "gauges": gauges, "samples": summaries}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._samples.clear()
+
+
+metrics = MetricsRegistry()
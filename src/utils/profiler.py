@@ -0,0 +1,186 @@
+"""On-demand statistical profiler for a live worker.
+
+``SamplingProfiler.run`` samples from the calling worker thread for the
+requested number of seconds; nothing runs between profiles. Every
+``interval`` it reads the Python stacks of the target threads (the
+event-loop thread and the STT recognition threads by default) with
+``sys._current_frames`` and the threads' CPU clocks with
+``time.pthread_getcpuclockid``:
+
+- A thread that used no CPU since the previous tick was idle (waiting in
+  ``select`` or on a queue); its stack is not counted unless ``wall=True``.
+- CPU used since the previous tick is attributed to the call that thread was
+  working for: the loop thread's current task, or the STT thread's call (see
+  ``src.utils.call_context``).
+
+Stacks come out in collapsed ("folded") form, ``root;caller;callee count``,
+ready for flamegraph.pl or speedscope. With ``by_call`` each stack is
+rooted at ``call:<sid>``.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from src.utils.call_context import call_for_task, call_for_thread
+from src.utils.logger import get_logger
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+MAX_DEPTH = 64
+UNATTRIBUTED = "-"
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+
+@dataclass
+class ProfileResult:
+    seconds: float
+    interval_ms: float
+    ticks: int = 0
+    threads: Dict[str, str] = field(default_factory=dict)  # ident -> label
+    stacks: Counter = field(default_factory=Counter)
+    cpu_ms_by_call: Dict[str, float] = field(default_factory=dict)
+    samples_by_call: Counter = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def as_dict(self) -> dict:
+        total_cpu = sum(self.cpu_ms_by_call.values())
+        calls = {
+            call_sid: {
+                "cpu_ms": round(cpu_ms, 1),
+                "cpu_share": round(cpu_ms / total_cpu, 3) if total_cpu else 0.0,
+                "samples": self.samples_by_call.get(call_sid, 0),
+            }
+            for call_sid, cpu_ms in sorted(self.cpu_ms_by_call.items(), key=lambda item: -item[1])
+        }
+        return {
+            "seconds": self.seconds,
+            "interval_ms": self.interval_ms,
+            "ticks": self.ticks,
+            "threads": self.threads,
+            "calls": calls,
+            "stacks": dict(self.stacks.most_common()),
+        }
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def fold_stack(frame) -> List[str]:
+    """Frames from outermost to innermost, at most ``MAX_DEPTH`` deep."""
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _thread_cpu_seconds(ident: int) -> Optional[float]:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class SamplingProfiler:
+    """One profile at a time per process."""
+
+    def __init__(self):
+        self._busy = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._busy.locked()
+
+    def select_threads(
+        self, loop_thread_id: Optional[int], prefixes: Sequence[str]
+    ) -> Dict[int, str]:
+        """Target threads: the loop thread plus threads whose name starts with a prefix."""
+        targets = {}
+        if loop_thread_id is not None:
+            targets[loop_thread_id] = "loop"
+        for thread in threading.enumerate():
+            if thread.ident in targets or thread.ident is None:
+                continue
+            if any(thread.name.startswith(prefix) for prefix in prefixes):
+                targets[thread.ident] = thread.name
+        return targets
+
+    def run(
+        self,
+        seconds: float,
+        interval: float = 0.005,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        loop_thread_id: Optional[int] = None,
+        thread_prefixes: Sequence[str] = ("stt-stream",),
+        by_call: bool = False,
+        wall: bool = False,
+    ) -> ProfileResult:
+        """Sample for ``seconds`` (blocking; call from a worker thread)."""
+        if not self._busy.acquire(blocking=False):
+            raise ProfilerBusyError("a profile is already running")
+        try:
+            return self._sample(seconds, interval, loop, loop_thread_id, thread_prefixes, by_call, wall)
+        finally:
+            self._busy.release()
+
+    def _call_for(self, ident: int, loop_thread_id: Optional[int], loop) -> str:
+        if ident == loop_thread_id and loop is not None:
+            return call_for_task(asyncio.current_task(loop)) or UNATTRIBUTED
+        return call_for_thread(ident) or UNATTRIBUTED
+
+    def _sample(self, seconds, interval, loop, loop_thread_id, thread_prefixes, by_call, wall) -> ProfileResult:
+        own_ident = threading.get_ident()
+        result = ProfileResult(seconds=seconds, interval_ms=interval * 1000)
+        last_cpu: Dict[int, Optional[float]] = {}
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            tick_started = time.perf_counter()
+            # Threads come and go (STT streams per call); refresh each tick
+            targets = self.select_threads(loop_thread_id, thread_prefixes)
+            targets.pop(own_ident, None)
+            frames = sys._current_frames()
+            for ident, label in targets.items():
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                result.threads[str(ident)] = label
+                cpu = _thread_cpu_seconds(ident)
+                previous = last_cpu.get(ident)
+                last_cpu[ident] = cpu
+                used_ms = None
+                if cpu is not None:
+                    if previous is not None:
+                        used_ms = (cpu - previous) * 1000
+                    if (used_ms is None or used_ms <= 0) and not wall:
+                        continue  # idle since the last tick (or first sighting)
+                call_sid = self._call_for(ident, loop_thread_id, loop)
+                if used_ms:
+                    result.cpu_ms_by_call[call_sid] = result.cpu_ms_by_call.get(call_sid, 0.0) + used_ms
+                result.samples_by_call[call_sid] += 1
+                root = [f"call:{call_sid}"] if by_call else []
+                result.stacks[";".join(root + [label] + fold_stack(frame))] += 1
+            del frames
+            result.ticks += 1
+            metrics.observe("profiler.tick_ms", (time.perf_counter() - tick_started) * 1000)
+            time.sleep(interval)
+        metrics.incr("profiler.runs")
+        logger.info("Profile finished: %d ticks, %d distinct stacks", result.ticks, len(result.stacks))
+        return result
+
+
+profiler = SamplingProfiler()
@@ -0,0 +1,53 @@
+"""Tests for call admission control and overload shedding."""
+
+from unittest.mock import patch
+
+from src.telephony.admission import AdmissionController, LoopLagProbe
+from src.utils.metrics import metrics
+
+
+def test_admits_until_capacity_then_rejects():
+    controller = AdmissionController(max_concurrent_calls=2, max_loop_lag_ms=1000)
+    assert controller.try_admit().admitted
+    assert controller.try_admit().admitted
+    decision = controller.try_admit()
+    assert not decision.admitted
+    assert decision.reason == "capacity"
+
+
+def test_released_call_frees_capacity():
+    controller = AdmissionController(max_concurrent_calls=1, max_loop_lag_ms=1000)
+    assert controller.try_admit().admitted
+    controller.claim("CA1")
+    assert not controller.try_admit().admitted
+    controller.release("CA1")
+    assert controller.try_admit().admitted
+
+
+def test_unclaimed_reservations_expire():
+    controller = AdmissionController(max_concurrent_calls=1, max_loop_lag_ms=1000, reservation_ttl=0.0)
+    assert controller.try_admit().admitted
+    assert controller.try_admit().admitted
+
+
+def test_rejects_when_loop_is_lagging():
+    probe = LoopLagProbe()
+    probe.lag_ms = 500.0
+    controller = AdmissionController(max_concurrent_calls=10, max_loop_lag_ms=100, lag_probe=probe)
+    before = metrics.counter("admission.rejected.loop_lag")
+    decision = controller.try_admit()
+    assert decision.reason == "loop_lag"
+    assert metrics.counter("admission.rejected.loop_lag") == before + 1
+
+
+def test_voice_webhook_returns_busy_twiml_when_full():
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+    from src.telephony.admission import admission
+
+    with patch.object(admission, "max_concurrent_calls", 0):
+        response = TestClient(app).post("/voice")
+    assert response.status_code == 200
+    assert "<Stream" not in response.text
+    assert "<Hangup" in response.text
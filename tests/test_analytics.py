@@ -0,0 +1,122 @@
+"""Tests for latency rollups and the analytics read path."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.analytics import (
+    _call_detail_sync,
+    _latency_summary_sync,
+    _slowest_calls_sync,
+    bucket_for,
+)
+from src.database.models import Base, LatencyRollup
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr("src.database.call_logger.SessionLocal", TestSession)
+    monkeypatch.setattr("src.database.analytics.SessionLocal", TestSession)
+    yield TestSession
+
+
+def _log_turn(call_sid, total, at):
+    from src.database.call_logger import _log_metrics_sync
+
+    with patch("src.database.call_logger.datetime") as fake_datetime:
+        fake_datetime.utcnow.return_value = at
+        _log_metrics_sync(call_sid, llm_latency=total // 2, tts_latency=total // 4, total_latency=total)
+
+
+def test_bucket_for_uses_upper_bounds():
+    assert bucket_for(0) == 50
+    assert bucket_for(50) == 50
+    assert bucket_for(51) == 100
+    assert bucket_for(60000) == 60000
+    assert bucket_for(10 ** 6) > 60000
+
+
+def test_rollups_are_incremented_per_minute(db):
+    at = datetime(2026, 1, 1, 9, 30, 15)
+    _log_turn("CA1", 900, at)
+    _log_turn("CA2", 950, at + timedelta(seconds=20))
+
+    session = db()
+    rows = session.query(LatencyRollup).filter_by(metric="total").all()
+    session.close()
+    assert len(rows) == 1
+    assert (rows[0].minute, rows[0].bucket, rows[0].count, rows[0].sum_ms) == (
+        datetime(2026, 1, 1, 9, 30), 1000, 2, 1850,
+    )
+
+
+def test_latency_summary_by_window(db):
+    base = datetime(2026, 1, 1, 9, 0)
+    for minute, total in enumerate([100, 200, 300, 2000, 4000, 400]):
+        _log_turn(f"CA{minute}", total, base + timedelta(minutes=minute))
+
+    summary = _latency_summary_sync(base, base + timedelta(minutes=6), window_minutes=3)
+    assert summary["overall"]["count"] == 6
+    assert summary["overall"]["p50_ms"] == 300
+    assert summary["overall"]["p99_ms"] == 4000
+    assert [w["count"] for w in summary["windows"]] == [3, 3]
+    assert summary["windows"][1]["p95_ms"] == 4000
+
+
+def test_percentiles_past_the_last_bucket_are_reported_as_overflow(db):
+    base = datetime(2026, 1, 1, 9, 0)
+    for minute, total in enumerate([500, 500, 90000]):
+        _log_turn(f"CA{minute}", total, base + timedelta(minutes=minute))
+
+    overall = _latency_summary_sync(base, base + timedelta(minutes=3))["overall"]
+    assert overall["p50_ms"] == 500
+    assert overall["p99_ms"] == ">60000"
+
+
+def test_slowest_calls_and_detail(db):
+    from src.database.call_logger import _log_call_start_sync, _log_message_sync
+
+    at = datetime.utcnow()
+    _log_call_start_sync("CA-fast")
+    _log_call_start_sync("CA-slow")
+    _log_message_sync("CA-slow", "user", "hello")
+    _log_turn("CA-fast", 300, at)
+    _log_turn("CA-slow", 5000, at)
+    _log_turn("CA-slow", 700, at)
+
+    calls = _slowest_calls_sync(at - timedelta(minutes=1), at + timedelta(minutes=1))
+    assert [c["call_sid"] for c in calls] == ["CA-slow", "CA-fast"]
+    assert calls[0]["turns"] == 2
+
+    detail = _call_detail_sync("CA-slow")
+    assert detail["transcript"][0]["message"] == "hello"
+    assert [m["total_ms"] for m in detail["metrics"]] == [5000, 700]
+    assert _call_detail_sync("missing") is None
+
+
+def test_analytics_routes(db):
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+
+    client = TestClient(app)
+    assert client.get("/analytics/latency").status_code == 404  # no ADMIN_TOKEN configured
+
+    with patch("src.api.auth.settings") as fake_settings:
+        fake_settings.admin_token = "s3cret"
+        assert client.get("/analytics/latency", headers={"Authorization": "Bearer nope"}).status_code == 401
+        client.headers["Authorization"] = "Bearer s3cret"
+        assert client.get("/analytics/latency", params={"metric": "bogus"}).status_code == 400
+        response = client.get("/analytics/latency", params={"window_minutes": 5})
+        assert response.status_code == 200
+        assert response.json()["overall"]["count"] == 0
+        assert client.get("/analytics/calls/none").status_code == 404
@@ -0,0 +1,201 @@
+"""Tests for the appointment availability index and slot reservation."""
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.business.availability import (
+    AvailabilityIndex,
+    Slot,
+    SlotUnavailableError,
+    parse_date,
+    parse_time,
+    refresh_availability,
+    reserve_slot,
+)
+from src.business.handlers import BusinessHandlers
+from src.database.models import Appointment, Base
+from src.utils.metrics import metrics
+
+MONDAY = date(2030, 6, 3)
+
+
+def at(day: date, hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(day, time(hour, minute))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr("src.business.availability.SessionLocal", TestSession)
+    metrics.reset()
+    yield TestSession
+    metrics.reset()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _add_row(session_factory, start, status="confirmed", resource="default"):
+    session = session_factory()
+    row = Appointment(resource=resource, start_time=start, end_time=start + timedelta(minutes=30), status=status)
+    session.add(row)
+    session.commit()
+    row_id = row.id
+    session.close()
+    return row_id
+
+
+def test_parses_spoken_dates_and_times():
+    today = date(2030, 6, 5)  # Wednesday
+    assert parse_date("tomorrow", today) == date(2030, 6, 6)
+    assert parse_date("Friday", today) == date(2030, 6, 7)
+    assert parse_date("next wednesday", today) == date(2030, 6, 12)
+    assert parse_date("March 5th", today) == date(2031, 3, 5)
+    assert parse_date("2030-07-01", today) == date(2030, 7, 1)
+    assert parse_date("sometime soon", today) is None
+    assert parse_time("3pm") == time(15, 0)
+    assert parse_time("3:30 p.m.") == time(15, 30)
+    assert parse_time("10:15") == time(10, 15)
+    assert parse_time("noon") == time(12, 0)
+    assert parse_time("at 3") == time(15, 0)
+
+
+def test_nearest_prefers_same_day_by_distance_then_same_time_later():
+    index = AvailabilityIndex(slot_minutes=60, open_time=time(9), close_time=time(13))  # 9, 10, 11, 12
+    for hour in (10, 11):
+        index.mark_booked(Slot("default", at(MONDAY, hour)))
+
+    slots = index.nearest(at(MONDAY, 11), limit=3, now=at(MONDAY, 8))
+
+    assert [slot.start for slot in slots] == [at(MONDAY, 12), at(MONDAY, 9), at(MONDAY + timedelta(days=1), 11)]
+    assert metrics.sample_count("availability.lookup_ms") >= 1
+
+
+def test_nearest_skips_closed_days_and_past_slots():
+    index = AvailabilityIndex(slot_minutes=60, open_time=time(9), close_time=time(11))
+    friday = MONDAY + timedelta(days=4)
+
+    slots = index.nearest(at(friday, 10), limit=2, now=at(friday, 9, 30))
+
+    assert [slot.start for slot in slots] == [at(friday, 10), at(friday + timedelta(days=3), 10)]
+
+
+def test_holds_block_other_calls_until_they_expire():
+    index = AvailabilityIndex()
+    slot = Slot("default", at(MONDAY, 14))
+    index.hold(slot, "CA-1", seconds=0.05)
+
+    assert index.is_free(slot, owner="CA-1")
+    with pytest.raises(SlotUnavailableError):
+        index.hold(slot, "CA-2")
+    assert metrics.counter("availability.contention") >= 1
+
+    _run(asyncio.sleep(0.06))
+    index.hold(slot, "CA-2")
+    with pytest.raises(SlotUnavailableError):
+        index.hold(Slot("default", at(MONDAY, 14, 10)), "CA-2")  # not a slot start
+
+
+def test_concurrent_reservations_book_a_slot_once(db):
+    index = AvailabilityIndex()
+
+    async def scenario():
+        return await asyncio.gather(
+            *(reserve_slot(at(MONDAY, 10), f"CA-{n}", index) for n in range(5)), return_exceptions=True
+        )
+
+    results = _run(scenario())
+
+    assert sum(isinstance(result, Slot) for result in results) == 1
+    assert sum(isinstance(result, SlotUnavailableError) for result in results) == 4
+    session = db()
+    assert session.query(Appointment).count() == 1
+    session.close()
+
+
+def test_booking_from_another_worker_is_a_conflict_then_indexed(db):
+    index = AvailabilityIndex(resources=("room-a", "room-b"))
+    _add_row(db, at(MONDAY, 10), resource="room-a")  # index has not seen it yet
+
+    slot = _run(reserve_slot(at(MONDAY, 10), "CA-1", index))
+
+    assert slot.resource == "room-b"
+    assert metrics.counter("availability.conflicts") == 1
+    assert not index.is_free(Slot("room-a", at(MONDAY, 10)))
+
+
+def test_refresh_loads_then_applies_changes(db):
+    index = AvailabilityIndex()
+    row_id = _add_row(db, at(MONDAY, 9))
+    _run(refresh_availability(index))
+    assert index.loaded and not index.is_free(Slot("default", at(MONDAY, 9)))
+
+    session = db()
+    row = session.get(Appointment, row_id)
+    row.status, row.updated_at = "cancelled", datetime.utcnow() + timedelta(seconds=1)
+    session.commit()
+    session.close()
+    _add_row(db, at(MONDAY, 11))
+
+    _run(refresh_availability(index))
+    assert index.is_free(Slot("default", at(MONDAY, 9)))
+    assert not index.is_free(Slot("default", at(MONDAY, 11)))
+
+
+def test_taken_time_offers_held_alternatives(db):
+    today = date.today()
+    monday = today + timedelta(days=7 - today.weekday())  # within the booking horizon
+    index = AvailabilityIndex()
+    index.mark_booked(Slot("default", at(monday, 15)))
+    caller = BusinessHandlers(call_sid="CA-1", calendar=index)
+    other = BusinessHandlers(call_sid="CA-2", calendar=index)
+
+    offer = _run(caller.book_appointment(monday.isoformat(), "3pm"))
+
+    assert offer["confirmed"] is False
+    assert [alt["time"] for alt in offer["alternatives"]] == ["14:30", "15:30", "14:00"]
+    assert "2:30 PM" in offer["message"]
+    # The offered slots are held for the caller, not for anyone else
+    assert _run(other.book_appointment(monday.isoformat(), "14:30"))["confirmed"] is False
+    booked = _run(caller.book_appointment(monday.isoformat(), "2:30 pm"))
+    assert booked["confirmed"] is True
+    assert booked["message"] == f"Appointment booked for Monday, {monday:%B} {monday.day} at 2:30 PM."
+    # Booking releases the caller's other offered slots
+    assert index.is_free(Slot("default", at(monday, 15, 30)), owner="CA-3")
+
+
+def test_unparseable_request_asks_again(db):
+    result = _run(BusinessHandlers(calendar=AvailabilityIndex()).book_appointment("soon", "whenever"))
+    assert result["confirmed"] is False
+    assert "which day and time" in result["message"]
+
+
+def test_call_cleanup_releases_offered_slots():
+    from unittest.mock import AsyncMock, patch
+
+    from src.business.availability import availability
+
+    today = date.today()
+    slot = Slot("default", at(today + timedelta(days=7 - today.weekday()), 11))
+    with patch("src.ai.conversation.create_stt") as create_stt, \
+         patch("src.ai.conversation.GoogleTTS"), \
+         patch("src.ai.conversation.GeminiClient"):
+        create_stt.return_value.close = AsyncMock()
+        from src.ai.conversation import ConversationOrchestrator
+
+        orchestrator = ConversationOrchestrator(call_sid="CA-hangup", websocket=AsyncMock())
+        availability.hold(slot, "CA-hangup")
+        assert not availability.is_free(slot, owner="CA-other")
+        _run(orchestrator.cleanup())
+
+    assert availability.is_free(slot, owner="CA-other")
@@ -84,7 +84,7 @@ def test_log_metrics(in_memory_db):
 
 
 def test_async_wrappers_delegate_to_sync(monkeypatch):
-    """Verify async wrappers call their sync counterparts via to_thread."""
+    """Verify async wrappers call their sync counterparts on the DB executor."""
     from unittest.mock import AsyncMock, patch
 
     import src.database.call_logger as mod
@@ -107,3 +107,28 @@ def test_async_wrappers_delegate_to_sync(monkeypatch):
 
     assert ("start", "call-async") in calls
     assert ("message", "call-async", "assistant", "Hi!") in calls
+
+
+def test_init_db_adds_columns_missing_from_older_databases(tmp_path):
+    from sqlalchemy import inspect, text
+
+    from src.database.db import init_db
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        # calls as created before recording_path existed
+        connection.execute(
+            text(
+                "CREATE TABLE calls (id INTEGER PRIMARY KEY, call_sid VARCHAR, phone_number VARCHAR, "
+                "start_time DATETIME, end_time DATETIME, duration INTEGER, status VARCHAR)"
+            )
+        )
+        connection.execute(text("INSERT INTO calls (call_sid, status) VALUES ('old-call', 'completed')"))
+
+    init_db(engine)
+    init_db(engine)  # idempotent
+
+    assert "recording_path" in {column["name"] for column in inspect(engine).get_columns("calls")}
+    session = sessionmaker(bind=engine)()
+    assert session.query(Call).filter(Call.call_sid == "old-call").one().recording_path is None
+    session.close()
@@ -0,0 +1,306 @@
+"""Tests for per-backend circuit breakers and the degraded fallbacks."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    llm_breaker,
+    stt_breaker,
+    tts_breaker,
+)
+from src.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_breakers():
+    for breaker in (stt_breaker, tts_breaker, llm_breaker):
+        breaker.reset()
+    metrics.reset()
+    yield
+    for breaker in (stt_breaker, tts_breaker, llm_breaker):
+        breaker.reset()
+    metrics.reset()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _trip(breaker):
+    for _ in range(breaker.min_calls):
+        breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_opens_on_error_rate():
+    breaker = CircuitBreaker("b1", window=10, min_calls=4, error_rate=0.5)
+    breaker.record_success(10)
+    breaker.record_failure()
+    breaker.record_success(10)
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert metrics.counter("breaker.b1.opened") == 1
+
+
+def test_opens_on_slow_calls():
+    breaker = CircuitBreaker("b2", min_calls=3, slow_call_ms=100, slow_rate=0.6)
+    breaker.record_success(50)
+    breaker.record_success(150)
+    breaker.record_success(200)
+    assert breaker.state == OPEN
+
+
+def test_half_open_lets_one_probe_through_then_closes():
+    breaker = CircuitBreaker("b3", min_calls=2, reset_timeout=0.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success(10)
+    assert breaker.state == CLOSED
+
+
+def _half_open(name, clock):
+    breaker = CircuitBreaker(name, min_calls=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 30
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+def test_cancelled_probe_lets_the_next_call_probe():
+    clock = [100.0]
+
+    async def hangs():
+        await asyncio.sleep(60)
+
+    async def scenario(breaker):
+        probe = asyncio.ensure_future(breaker.call(hangs))
+        await asyncio.sleep(0)
+        assert not breaker.allow()
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+    with patch("src.utils.circuit_breaker.time.monotonic", lambda: clock[0]):
+        breaker = _half_open("b5", clock)
+        _run(scenario(breaker))
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+
+
+def test_probe_that_never_reports_is_given_up_on():
+    clock = [100.0]
+    with patch("src.utils.circuit_breaker.time.monotonic", lambda: clock[0]):
+        breaker = _half_open("b6", clock)
+        assert breaker.admit() == (True, True)
+        clock[0] += 29
+        assert not breaker.allow()
+        clock[0] += 1
+        assert breaker.admit() == (True, True)
+    assert metrics.counter("breaker.b6.stale_probes") == 1
+
+
+def test_stt_probe_stream_closing_without_responses_releases_the_probe():
+    from src.speech.google_stt import AsyncGoogleSTT
+
+    class EmptyStream:
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            stt._running = False  # one stream only
+            raise StopAsyncIteration
+
+    client = MagicMock()
+    client.streaming_recognize = AsyncMock(return_value=EmptyStream())
+    with patch("src.speech.google_stt.speech"):
+        stt = AsyncGoogleSTT(client=client)
+    _trip(stt_breaker)
+    stt_breaker._opened_at -= stt_breaker.reset_timeout
+    stt._running = True
+
+    _run(stt._recognition_loop())
+
+    client.streaming_recognize.assert_awaited_once()
+    assert stt_breaker.state == HALF_OPEN
+    assert stt_breaker.allow()
+
+
+def test_open_breaker_fails_fast():
+    breaker = CircuitBreaker("b4", min_calls=1, reset_timeout=60)
+    breaker.record_failure()
+    func = AsyncMock()
+
+    with pytest.raises(CircuitOpenError):
+        _run(breaker.call(func))
+    func.assert_not_called()
+    assert metrics.counter("breaker.b4.rejected") == 1
+
+
+def test_tts_returns_empty_audio_while_open():
+    with patch("src.speech.google_tts.texttospeech"):
+        from src.speech.google_tts import GoogleTTS
+
+        tts = GoogleTTS()
+        _trip(tts_breaker)
+        assert _run(tts.synthesize("Hello")) == b""
+        tts._client.synthesize_speech.assert_not_called()
+
+
+def test_gemini_returns_apology_while_open():
+    from src.ai.gemini_client import TROUBLE_RESPONSE, GeminiClient, tenant_models
+
+    tenant_models.clear()
+    with patch("src.ai.gemini_client.genai"), \
+         patch("src.ai.gemini_client.settings") as fake_settings:
+        fake_settings.gemini_api_key = "key"
+        client = GeminiClient()
+        _trip(llm_breaker)
+        response = _run(client.generate_response([], "hello"))
+
+    assert response.text == TROUBLE_RESPONSE
+    client.model.start_chat.assert_not_called()
+
+
+@pytest.fixture
+def orchestrator():
+    with patch("src.ai.conversation.create_stt"), \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock):
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"\x00" * 100)
+        from src.ai.conversation import ConversationOrchestrator
+
+        orch = ConversationOrchestrator(call_sid="test-cb", websocket=AsyncMock())
+        orch.twilio_call_sid = "CA123"
+        yield orch
+
+
+def test_turn_hands_off_to_say_when_tts_is_open(orchestrator):
+    from src.ai.conversation import _resume_handoff
+    from src.ai.gemini_client import GeminiResponse
+
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="It ships today."))
+    _trip(tts_breaker)
+
+    with patch("src.ai.conversation.settings") as fake_settings, \
+         patch("src.ai.conversation.redirect_call") as redirect, \
+         patch("src.ai.conversation.handle_say_and_reconnect", return_value="<Response/>") as twiml:
+        fake_settings.filler_enabled = False
+        fake_settings.twilio_account_sid = "AC1"
+        fake_settings.twilio_auth_token = "token"
+        fake_settings.say_handoff_timeout = 60
+        _run(orchestrator.handle_user_input("Where is my order?"))
+
+    twiml.assert_called_once_with("It ships today.", None)
+    redirect.assert_called_once_with("CA123", "<Response/>")
+    orchestrator.tts.synthesize.assert_not_called()
+    assert _resume_handoff("CA123") is orchestrator.context
+    assert metrics.counter("tts.say_handoffs") == 1
+
+
+def test_parked_handoff_expires_and_ends_the_call():
+    from src.ai.conversation import _handed_off, _park_handoff, _resume_handoff
+
+    async def scenario():
+        with patch("src.ai.conversation.settings") as fake_settings, \
+             patch("src.ai.conversation.log_call_end", new_callable=AsyncMock) as log_end:
+            fake_settings.say_handoff_timeout = 0.01
+            _park_handoff("CA-gone", "stream-gone", MagicMock())
+            _park_handoff("CA-back", "stream-back", MagicMock())
+            _resume_handoff("CA-back")
+            await asyncio.sleep(0.05)
+        return log_end
+
+    log_end = _run(scenario())
+    assert "CA-gone" not in _handed_off
+    log_end.assert_awaited_once_with("stream-gone")
+    assert metrics.counter("tts.say_handoffs_expired") == 1
+
+
+def test_segments_are_synthesized_one_at_a_time_while_tts_recovers(orchestrator):
+    in_flight, peak = 0, 0
+
+    async def synthesize(text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return b"\x7f" * 160
+
+    orchestrator.tts.synthesize = synthesize
+    _trip(tts_breaker)
+    tts_breaker._opened_at -= tts_breaker.reset_timeout  # half-open
+    with patch("src.ai.conversation.settings") as fake_settings:
+        fake_settings.tts_segment_parallelism = 3
+        _run(orchestrator.send_text(
+            "Your order shipped this morning. It should arrive by Friday afternoon. Anything else I can help with?"
+        ))
+
+    assert peak == 1
+
+
+def test_rest_of_reply_falls_back_when_tts_fails_midway(orchestrator):
+    async def synthesize(text):
+        return b"" if "Friday" in text else b"\x7f" * 160
+
+    orchestrator.tts.synthesize = synthesize
+    orchestrator._send_audio_to_websocket = AsyncMock()
+    orchestrator._speak_degraded = AsyncMock()
+    with patch("src.ai.conversation.settings") as fake_settings:
+        fake_settings.tts_segment_parallelism = 3
+        _run(orchestrator._speak_response(
+            "Your order shipped this morning. It should arrive by Friday afternoon. Anything else I can help with?",
+            AsyncMock(played=False),
+        ))
+
+    orchestrator._send_audio_to_websocket.assert_awaited_once_with(b"\x7f" * 160)
+    orchestrator._speak_degraded.assert_awaited_once_with(
+        "It should arrive by Friday afternoon. Anything else I can help with?"
+    )
+    assert metrics.counter("tts.partial_responses") == 1
+
+
+def test_turn_plays_cached_apology_when_handoff_unavailable(orchestrator):
+    from src.ai.gemini_client import GeminiResponse
+
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="It ships today."))
+    orchestrator.tts.synthesize = AsyncMock(return_value=b"")
+    orchestrator._send_audio_to_websocket = AsyncMock()
+
+    with patch("src.ai.conversation.phrase_cache") as cache, \
+         patch("src.ai.conversation.settings") as fake_settings:
+        cache.get.side_effect = lambda text: b"\x7f" * 160 if text != "It ships today." else None
+        fake_settings.filler_enabled = False
+        fake_settings.tts_segment_parallelism = 2
+        fake_settings.twilio_account_sid = None
+        _run(orchestrator.handle_user_input("Where is my order?"))
+
+    orchestrator._send_audio_to_websocket.assert_any_call(b"\x7f" * 160)
+    assert metrics.counter("tts.degraded_responses") == 1
+
+
+def test_health_reports_breaker_state():
+    from src.api.main import app
+
+    client = TestClient(app)
+    body = client.get("/").json()
+    assert body["status"] == "ok"
+    assert body["breakers"]["tts"]["state"] == CLOSED
+
+    _trip(stt_breaker)
+    body = client.get("/").json()
+    assert body["status"] == "degraded"
+    assert body["breakers"]["stt"]["state"] == OPEN
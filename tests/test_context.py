@@ -0,0 +1,89 @@
+"""Tests for token-budgeted conversation context."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from src.ai.context import ConversationContext, estimate_tokens
+from src.ai.prefetch import EntityExtractor
+
+
+def _fill(ctx: ConversationContext, turns: int) -> None:
+    for i in range(turns):
+        ctx.add_message("user", f"This is caller message number {i} with a bit of padding text.")
+        ctx.add_message("model", f"This is agent reply number {i} with a bit of padding text too.")
+
+
+def test_short_conversation_kept_verbatim():
+    ctx = ConversationContext(token_budget=1000, summary_token_budget=200)
+    _fill(ctx, 2)
+    formatted = ctx.to_gemini_format()
+    assert len(formatted) == 4
+    assert formatted[0]["role"] == "user"
+    assert ctx.summary == ""
+
+
+def test_prompt_size_stays_bounded_on_long_calls():
+    ctx = ConversationContext(token_budget=200, summary_token_budget=60, min_recent_messages=2)
+    _fill(ctx, 50)
+    asyncio.get_event_loop().run_until_complete(ctx.compact())
+    assert ctx.prompt_tokens() <= 200 + estimate_tokens("Understood.") + 20
+    # Oldest turns are folded, most recent kept verbatim
+    assert "reply number 49" in ctx.get_history()[-1]["content"]
+    assert "number 0 " not in " ".join(m["content"] for m in ctx.get_history())
+
+
+def test_verbatim_window_starts_on_user_turn():
+    ctx = ConversationContext(token_budget=120, summary_token_budget=40, min_recent_messages=2)
+    _fill(ctx, 10)
+    assert ctx.get_history()[0]["role"] == "user"
+    formatted = ctx.to_gemini_format()
+    assert formatted[0]["role"] == "user"
+    assert formatted[1]["parts"] == ["Understood."]
+
+
+def test_pinned_facts_survive_folding():
+    ctx = ConversationContext(token_budget=120, summary_token_budget=40, min_recent_messages=2)
+    ctx.pin_entities(EntityExtractor().extract("my order number is 48213"))
+    _fill(ctx, 30)
+    asyncio.get_event_loop().run_until_complete(ctx.compact())
+    preface = ctx.to_gemini_format()[0]["parts"][0]
+    assert "order number: 48213" in preface
+
+
+def test_compact_uses_summarizer():
+    ctx = ConversationContext(token_budget=120, summary_token_budget=20, min_recent_messages=2)
+    _fill(ctx, 10)
+    assert ctx.needs_compaction()
+    summarizer = AsyncMock(return_value="Caller asked about several things.")
+    asyncio.get_event_loop().run_until_complete(ctx.compact(summarizer))
+    summarizer.assert_called_once()
+    assert ctx.summary == "Caller asked about several things."
+
+
+def test_compact_falls_back_when_summarizer_fails():
+    ctx = ConversationContext(token_budget=120, summary_token_budget=30, min_recent_messages=2)
+    _fill(ctx, 10)
+    summarizer = AsyncMock(side_effect=RuntimeError("quota"))
+    asyncio.get_event_loop().run_until_complete(ctx.compact(summarizer))
+    assert estimate_tokens(ctx.summary) <= 30
+
+
+def test_dates_pinned_only_for_booking_turns():
+    extractor = EntityExtractor()
+    ctx = ConversationContext()
+    ctx.pin_entities(extractor.extract("How are you today?"), "How are you today?")
+    assert "requested date" not in ctx.pinned
+
+    ctx.pin_entities(extractor.extract("Can I book an appointment tomorrow?"), "Can I book an appointment tomorrow?")
+    assert ctx.pinned["requested date"] == "tomorrow"
+    # Follow-ups refine the request without repeating the intent
+    ctx.pin_entities(extractor.extract("how about 4 pm"), "how about 4 pm")
+    assert ctx.pinned["requested time"] == "4 pm"
+
+
+def test_dates_pinned_when_agent_asked_for_a_slot():
+    ctx = ConversationContext()
+    ctx.add_message("model", "Sure, what day would you like the appointment?")
+    ctx.add_message("user", "Friday")
+    ctx.pin_entities(EntityExtractor().extract("Friday"), "Friday")
+    assert ctx.pinned["requested date"].lower() == "friday"
@@ -0,0 +1,87 @@
+"""Tests for the vectorized mu-law codec, resampling and gain control."""
+
+import numpy as np
+import pytest
+
+from src.speech import dsp
+from src.speech.audio_utils import normalize_audio
+
+
+def _tone(rate: int, seconds: float = 0.5, freq: float = 440.0, amplitude: float = 10000.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def test_mulaw_decode_encode_round_trip_is_exact():
+    codes = np.arange(256, dtype=np.uint8).tobytes()
+    pcm = dsp.mulaw_to_pcm16(codes)
+    assert np.array_equal(dsp.mulaw_to_pcm16(dsp.pcm16_to_mulaw(pcm)), pcm)
+
+
+def test_mulaw_known_values():
+    assert dsp.mulaw_to_pcm16(b"\xff\x7f\x00\x80").tolist() == [0, 0, -32124, 32124]
+    assert dsp.pcm16_to_mulaw(np.array([0, 32767, -32768], dtype=np.int16)) == b"\xff\x80\x00"
+
+
+def test_mulaw_quantization_error_is_small():
+    tone = _tone(8000)
+    decoded = dsp.mulaw_to_pcm16(dsp.pcm16_to_mulaw(tone)).astype(np.int32)
+    assert np.max(np.abs(decoded - tone)) < 400
+
+
+@pytest.mark.parametrize("from_rate,to_rate", [(8000, 16000), (16000, 8000), (8000, 24000), (24000, 8000), (24000, 16000)])
+def test_resample_preserves_tone(from_rate, to_rate):
+    out = dsp.resample(_tone(from_rate), from_rate, to_rate)
+    assert len(out) == to_rate // 2
+    expected = _tone(to_rate).astype(np.int32)
+    # Ignore filter edges
+    assert np.max(np.abs(out[100:-100] - expected[100:-100])) < 50
+
+
+def test_resample_rejects_content_above_target_nyquist():
+    out = dsp.resample(_tone(24000, freq=6000), 24000, 8000)
+    assert np.max(np.abs(out[100:-100])) < 200
+
+
+def test_streaming_resampler_matches_batch_after_delay():
+    tone = _tone(8000)
+    batch = dsp.resample(tone, 8000, 16000)
+    resampler = dsp.Resampler(8000, 16000)
+    streamed = np.concatenate([resampler.process(tone[i : i + 160]) for i in range(0, len(tone), 160)])
+    delay = dsp._HALF_WIDTH * 2
+    assert np.array_equal(streamed[delay + 100 : -100], batch[100 : len(streamed) - delay - 100])
+
+
+def test_normalize_gain_boosts_quiet_audio_with_cap():
+    quiet = _tone(8000, amplitude=300)
+    boosted = dsp.normalize_gain(quiet, max_gain_db=12.0)
+    ratio = np.max(np.abs(boosted)) / np.max(np.abs(quiet))
+    assert 3.5 < ratio <= 10 ** (12 / 20) + 0.01
+
+
+def test_normalize_gain_prevents_clipping():
+    loud = np.full(800, 32000, dtype=np.int16)
+    assert np.max(dsp.normalize_gain(loud, target_dbfs=0.0)) <= round(0.95 * 32767)
+
+
+def test_normalize_gain_leaves_silence_alone():
+    silence = np.zeros(160, dtype=np.int16)
+    assert not dsp.normalize_gain(silence).any()
+
+
+def test_linear16_wav_to_twilio_mulaw():
+    pcm = _tone(24000).tobytes()
+    header = (
+        b"RIFF" + (36 + len(pcm)).to_bytes(4, "little") + b"WAVE"
+        + b"fmt " + (16).to_bytes(4, "little") + (1).to_bytes(2, "little") + (1).to_bytes(2, "little")
+        + (24000).to_bytes(4, "little") + (48000).to_bytes(4, "little") + (2).to_bytes(2, "little")
+        + (16).to_bytes(2, "little") + b"data" + len(pcm).to_bytes(4, "little")
+    )
+    mulaw = dsp.linear16_to_twilio(header + pcm, sample_rate=16000)
+    assert len(mulaw) == 4000  # 0.5 s at 8 kHz, rate taken from the WAV header
+
+
+def test_normalize_audio_resamples_to_expected_rate():
+    assert normalize_audio(b"") == b""
+    out = normalize_audio(_tone(16000).tobytes(), expected_rate=8000, source_rate=16000, source_encoding="linear16")
+    assert len(out) == 4000
@@ -0,0 +1,158 @@
+"""Tests for keypad (DTMF) collection and the direct order lookup."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.gemini_client import GeminiResponse
+from src.telephony.dtmf import DtmfCollector, keypad_transcript
+from src.utils.metrics import metrics
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _collector(**kwargs):
+    completed = []
+
+    async def on_complete(keyed):
+        completed.append(keyed)
+
+    return DtmfCollector(on_complete, **kwargs), completed
+
+
+def test_terminator_completes_and_star_clears():
+    collector, completed = _collector()
+
+    async def scenario():
+        for key in "12*4567#":
+            await collector.press(key)
+
+    _run(scenario())
+    assert [(k.digits, k.reason) for k in completed] == [("4567", "terminator")]
+
+
+def test_max_digits_and_inter_digit_timeout():
+    collector, completed = _collector(inter_digit_timeout=0.05, max_digits=3)
+
+    async def scenario():
+        for key in "123":
+            await collector.press(key)
+        await collector.press("9")
+        await asyncio.sleep(0.02)
+        await collector.press("8")  # restarts the timer
+        await asyncio.sleep(0.1)
+
+    _run(scenario())
+    assert [(k.digits, k.reason) for k in completed] == [("123", "max_digits"), ("98", "timeout")]
+
+
+def test_lone_terminator_is_ignored():
+    collector, completed = _collector()
+    _run(collector.press("#"))
+    assert completed == []
+
+
+@pytest.fixture
+def orchestrator():
+    with patch("src.ai.conversation.create_stt"), \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock):
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"\x00" * 100)
+
+        from src.ai.conversation import ConversationOrchestrator
+
+        orch = ConversationOrchestrator(call_sid="test-dtmf", websocket=AsyncMock())
+        orch.context.add_message("user", "Where is my package?")
+        orch.context.add_message("model", "I can check that. What's your order number?")
+        yield orch
+
+
+def _key_in(orchestrator, keys):
+    async def scenario():
+        for key in keys:
+            await orchestrator.on_dtmf({"event": "dtmf", "dtmf": {"track": "inbound_track", "digit": key}})
+
+    _run(scenario())
+
+
+def test_keyed_order_number_skips_the_llm(orchestrator):
+    metrics.reset()
+    orchestrator.gemini.generate_response = AsyncMock()
+
+    _key_in(orchestrator, "12345#")
+
+    orchestrator.gemini.generate_response.assert_not_called()
+    assert orchestrator.context.pinned["order number"] == "12345"
+    assert orchestrator.context.history[-1]["content"] == "Order 12345 has shipped and is on the way."
+    sent = [call.args[0] for call in orchestrator.websocket.send_json.call_args_list]
+    assert sent[0]["event"] == "mark" and sent[1]["event"] == "media"
+    assert metrics.counter("dtmf.direct_lookups") == 1
+
+
+def test_keyed_digits_outside_an_order_conversation_are_a_regular_turn(orchestrator):
+    orchestrator.context.add_message("user", "I'd like to book an appointment")
+    orchestrator.context.add_message("model", "Sure. What phone number can we reach you on?")
+    orchestrator.handlers.check_order_status = AsyncMock()
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="Thanks, noted."))
+
+    _key_in(orchestrator, "5551234#")
+
+    orchestrator.handlers.check_order_status.assert_not_called()
+    assert orchestrator.gemini.generate_response.call_args.args[1] == keypad_transcript("5551234")
+
+
+def test_short_sequence_is_a_regular_turn(orchestrator):
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="Great, booked."))
+
+    _key_in(orchestrator, "1#")
+
+    orchestrator.gemini.generate_response.assert_called_once()
+    assert orchestrator.gemini.generate_response.call_args.args[1] == keypad_transcript("1")
+
+
+def test_failed_lookup_falls_back_to_the_llm(orchestrator):
+    orchestrator.handlers.check_order_status = AsyncMock(side_effect=RuntimeError("backend down"))
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="Sorry, try again."))
+
+    _key_in(orchestrator, "99887#")
+
+    orchestrator.gemini.generate_response.assert_called_once()
+
+
+def test_timed_out_sequence_waits_for_the_stream_handler(orchestrator):
+    orchestrator.handlers.check_order_status = AsyncMock(return_value={"message": "Order 12345 has shipped."})
+    orchestrator.stt.process_audio_chunk = AsyncMock()
+    orchestrator.stt.get_transcript = AsyncMock(return_value=None)
+    orchestrator.keypad.inter_digit_timeout = 0.01
+
+    async def scenario():
+        for key in "12345":
+            await orchestrator.on_dtmf({"event": "dtmf", "dtmf": {"digit": key}})
+        await asyncio.sleep(0.05)
+        # Timed out, but the turn runs on the handler's next message, not in the timer
+        orchestrator.handlers.check_order_status.assert_not_called()
+        await orchestrator.on_audio_chunk(b"\xff" * 160)
+
+    _run(scenario())
+    orchestrator.handlers.check_order_status.assert_awaited_once_with(order_number="12345")
+
+
+def test_cleanup_drops_pending_keypad_turns(orchestrator):
+    orchestrator.handlers.check_order_status = AsyncMock()
+    orchestrator.stt.close = AsyncMock()
+    orchestrator.keypad.inter_digit_timeout = 0.01
+
+    async def scenario():
+        await orchestrator.on_dtmf({"event": "dtmf", "dtmf": {"digit": "7"}})
+        await asyncio.sleep(0.05)
+        await orchestrator.cleanup()
+        await orchestrator.on_dtmf({"event": "dtmf", "dtmf": {"digit": "#"}})
+
+    _run(scenario())
+    orchestrator.handlers.check_order_status.assert_not_called()
+    orchestrator.gemini.generate_response.assert_not_called()
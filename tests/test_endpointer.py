@@ -0,0 +1,182 @@
+"""Tests for early end-of-utterance detection."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.speech.dsp import pcm16_to_mulaw
+from src.speech.endpointer import Endpointer, PauseModel
+from src.utils.metrics import metrics
+
+FRAME_S = 0.02
+SPEECH = pcm16_to_mulaw((4000 * np.sin(np.arange(160) * 2 * np.pi * 300 / 8000)).astype(np.int16))
+SILENCE = pcm16_to_mulaw(np.zeros(160, dtype=np.int16))
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def feed(self, endpointer, frame, seconds):
+        """Feed ``seconds`` of one kind of frame; returns the first utterance released."""
+        released = None
+        for _ in range(round(seconds / FRAME_S)):
+            self.now += FRAME_S
+            utterance = endpointer.on_audio(frame, self.now)
+            released = released or utterance
+        return released
+
+
+def test_declares_end_after_pause_with_stable_interim_and_final_confirms():
+    endpointer = Endpointer(initial_pause_ms=700, stable_ms=200)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 1.0)
+    endpointer.on_interim("where is my order", clock.now)
+
+    assert clock.feed(endpointer, SILENCE, 0.6) is None
+    utterance = clock.feed(endpointer, SILENCE, 0.2)
+
+    assert utterance == "where is my order"
+    assert utterance.endpoint.source == "endpoint"
+    assert 700 <= utterance.endpoint.decision_ms < 760
+    assert endpointer.on_final("Where is my order?", clock.now + 0.5) is None
+    assert metrics.counter("endpoint.confirmed") == 1
+
+
+def test_changing_interim_holds_the_endpoint():
+    endpointer = Endpointer(initial_pause_ms=400, stable_ms=300)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    clock.feed(endpointer, SILENCE, 0.3)
+    endpointer.on_interim("book an appointment", clock.now)  # recognizer still catching up
+
+    assert clock.feed(endpointer, SILENCE, 0.2) is None
+    assert clock.feed(endpointer, SILENCE, 0.2) == "book an appointment"
+
+
+def test_words_after_an_early_endpoint_become_the_next_turn():
+    endpointer = Endpointer(initial_pause_ms=400, stable_ms=100)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    endpointer.on_interim("check my order", clock.now)
+    assert clock.feed(endpointer, SILENCE, 0.5) == "check my order"
+
+    clock.feed(endpointer, SPEECH, 0.5)
+    rest = endpointer.on_final("check my order number 12345", clock.now + 0.3)
+
+    assert rest == "number 12345"
+    assert rest.endpoint.source == "final"
+    assert metrics.counter("endpoint.premature") == 1
+
+
+def test_remainder_after_an_early_endpoint_ignores_punctuation():
+    endpointer = Endpointer(initial_pause_ms=400, stable_ms=100)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    endpointer.on_interim("hi, it's Sam", clock.now)
+    assert clock.feed(endpointer, SILENCE, 0.5) == "hi, it's Sam"
+
+    rest = endpointer.on_final("Hi. It's Sam - order 42", clock.now + 0.3)
+
+    assert rest == "order 42"
+
+
+def test_revised_final_is_delivered_as_a_corrective_turn():
+    endpointer = Endpointer(initial_pause_ms=400, stable_ms=100)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    endpointer.on_interim("cancel my order", clock.now)
+    assert clock.feed(endpointer, SILENCE, 0.5) == "cancel my order"
+
+    corrected = endpointer.on_final("can I see my order", clock.now + 0.3)
+
+    assert corrected == "can I see my order"
+    assert corrected.endpoint.source == "revised"
+    assert metrics.counter("endpoint.revised") == 1
+
+
+@pytest.mark.parametrize("lose_final", ["timeout", "restart"])
+def test_lost_final_does_not_wedge_the_endpointer(lose_final):
+    endpointer = Endpointer(initial_pause_ms=400, stable_ms=100)
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    endpointer.on_interim("hello", clock.now)
+    assert clock.feed(endpointer, SILENCE, 0.5) == "hello"
+    # The final for "hello" never arrives
+    if lose_final == "timeout":
+        clock.feed(endpointer, SILENCE, 5.0)
+    else:
+        endpointer.reset_pending()
+
+    clock.feed(endpointer, SPEECH, 0.5)
+    endpointer.on_interim("I need help", clock.now)
+    assert clock.feed(endpointer, SILENCE, 1.5) == "I need help"
+    assert endpointer.on_final("I need help", clock.now) is None
+    assert metrics.counter("endpoint.abandoned") == 1
+
+
+def test_final_without_early_endpoint_is_released_with_its_latency():
+    endpointer = Endpointer()
+    clock = Clock()
+    clock.feed(endpointer, SPEECH, 0.5)
+    clock.feed(endpointer, SILENCE, 0.3)
+
+    utterance = endpointer.on_final("yes", clock.now)
+
+    assert utterance == "yes"
+    assert utterance.endpoint.source == "final"
+    assert utterance.endpoint.decision_ms == pytest.approx(300, abs=25)
+
+
+def test_pause_model_adapts_to_the_caller():
+    slow, fast = PauseModel(700, 300, 1500), PauseModel(700, 300, 1500)
+    for _ in range(10):
+        slow.observe(1000)
+        fast.observe(200)
+    assert slow.threshold_ms > 1000
+    assert fast.threshold_ms == 300
+
+
+def test_mid_utterance_pauses_train_the_model():
+    endpointer = Endpointer(initial_pause_ms=700)
+    clock = Clock()
+    for _ in range(5):
+        clock.feed(endpointer, SPEECH, 0.3)
+        clock.feed(endpointer, SILENCE, 0.25)
+    assert endpointer.pauses.samples == 4  # the last pause has not ended yet
+    assert endpointer.pauses.threshold_ms < 700
+
+
+def test_stt_releases_endpoint_before_final():
+    from src.speech.google_stt import AsyncGoogleSTT
+
+    clock = Clock()
+    interim = SimpleNamespace(
+        results=[SimpleNamespace(is_final=False, alternatives=[SimpleNamespace(transcript="cancel my order")])]
+    )
+
+    async def scenario():
+        stt = AsyncGoogleSTT(client=MagicMock())
+        for frame, seconds in ((SPEECH, 0.4), (SILENCE, 1.0)):
+            for _ in range(round(seconds / FRAME_S)):
+                clock.now += FRAME_S
+                await stt.process_audio_chunk(frame)
+            stt._handle_response(interim)
+        return await stt.get_transcript()
+
+    with patch("src.speech.google_stt.speech"), \
+         patch("src.speech.endpointer.time", SimpleNamespace(monotonic=lambda: clock.now)):
+        transcript = asyncio.get_event_loop().run_until_complete(scenario())
+
+    assert transcript == "cancel my order"
+    assert transcript.endpoint.source == "endpoint"
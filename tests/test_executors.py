@@ -0,0 +1,74 @@
+"""Tests for per-subsystem executors and the STT thread budget."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.executors import InstrumentedExecutor, ThreadBudget
+from src.utils.metrics import metrics
+
+
+def test_run_executes_in_named_pool():
+    executor = InstrumentedExecutor("unit", max_workers=2)
+    name = asyncio.get_event_loop().run_until_complete(
+        executor.run(lambda: threading.current_thread().name)
+    )
+    assert name.startswith("unit-worker")
+    executor.shutdown()
+
+
+def test_run_records_queue_wait_and_resets_gauges():
+    executor = InstrumentedExecutor("unit-wait", max_workers=1)
+
+    async def scenario():
+        return await asyncio.gather(*(executor.run(sum, [i, 1]) for i in range(5)))
+
+    results = asyncio.get_event_loop().run_until_complete(scenario())
+    assert results == [1, 2, 3, 4, 5]
+    assert metrics.quantile("executor.unit-wait.queue_wait_ms", 50) is not None
+    stats = executor.stats()
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    executor.shutdown()
+
+
+def test_exceptions_propagate():
+    executor = InstrumentedExecutor("unit-err", max_workers=1)
+
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        asyncio.get_event_loop().run_until_complete(executor.run(boom))
+    assert executor.stats()["active"] == 0
+    executor.shutdown()
+
+
+def test_job_cancelled_while_queued_leaves_the_queue():
+    executor = InstrumentedExecutor("unit-cancel", max_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(executor.run(release.wait))
+        waiting = asyncio.ensure_future(executor.run(sum, [1, 2]))
+        await asyncio.sleep(0.05)
+        assert executor.stats()["queued"] == 1
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        release.set()
+        await busy
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    stats = executor.stats()
+    assert stats["queued"] == 0
+    assert stats["active"] == 0
+    executor.shutdown()
+
+
+def test_thread_budget_caps_and_releases():
+    budget = ThreadBudget("unit-stt", limit=1)
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    budget.release()
+    assert budget.try_acquire()
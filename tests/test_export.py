@@ -0,0 +1,107 @@
+"""Tests for streaming CSV/JSONL exports."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.export import iter_export
+from src.database.models import Base, Call, Conversation
+
+BASE = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def db(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr("src.database.export.SessionLocal", TestSession)
+
+    session = TestSession()
+    for i in range(5):
+        session.add(Call(call_sid=f"CA{i}", start_time=BASE + timedelta(hours=i)))
+        session.add(Conversation(call_sid=f"CA{i}", role="user", message=f"hi, {i}", timestamp=BASE + timedelta(hours=i)))
+    session.commit()
+    session.close()
+    yield TestSession
+
+
+def test_jsonl_export_streams_in_batches():
+    chunks = list(iter_export("conversations", "jsonl", batch_size=2))
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert [row["call_sid"] for row in rows] == ["CA0", "CA1", "CA2", "CA3", "CA4"]
+    assert rows[0]["timestamp"] == BASE.isoformat()
+
+
+def test_csv_export_with_filters():
+    data = b"".join(
+        iter_export(
+            "calls",
+            "csv",
+            start=BASE + timedelta(hours=1),
+            end=BASE + timedelta(hours=4),
+            call_sids=["CA1", "CA3", "CA4"],
+        )
+    ).decode()
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert [row["call_sid"] for row in rows] == ["CA1", "CA3"]
+    assert rows[0]["end_time"] == ""
+
+
+def test_gzip_export_is_valid_gzip():
+    data = gzip.decompress(b"".join(iter_export("conversations", "csv", compress=True)))
+    assert data.decode().splitlines()[1].endswith('"hi, 0",')
+
+
+def test_unknown_table_rejected():
+    with pytest.raises(ValueError):
+        list(iter_export("secrets"))
+
+
+def test_export_endpoint_streams_response():
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+
+    client = TestClient(app)
+    assert client.get("/export/conversations").status_code == 404  # no ADMIN_TOKEN configured
+
+    client.headers["Authorization"] = "Bearer s3cret"
+    with patch("src.api.auth.settings") as fake_settings:
+        fake_settings.admin_token = "s3cret"
+        response = client.get("/export/conversations", params={"call_sid": "CA1,CA2", "gzip": "true"})
+        assert client.get("/export/secrets").status_code == 404
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+    lines = gzip.decompress(response.content).decode().splitlines()
+    assert [json.loads(line)["call_sid"] for line in lines] == ["CA1", "CA2"]
+
+
+def test_streaming_export_leaves_the_db_executor_free():
+    import asyncio
+
+    from src.database.export import stream_export
+    from src.utils.executors import db_executor, export_executor
+
+    async def scenario():
+        body = stream_export("conversations", "jsonl", batch_size=1)
+        first = await body.__anext__()
+        busy = (db_executor.stats()["active"], export_executor.stats()["active"])
+        await body.aclose()
+        return first, busy
+
+    first, (db_active, export_active) = asyncio.get_event_loop().run_until_complete(scenario())
+    assert json.loads(first)["call_sid"] == "CA0"
+    assert db_active == 0
+    assert export_active == 1
@@ -0,0 +1,146 @@
+"""Tests for filler audio that masks slow turns."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.gemini_client import GeminiResponse
+from src.speech.filler import FillerBank, LatencyMask
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+async def _loaded_bank() -> FillerBank:
+    bank = FillerBank({"lookup": ["checking"], "thinking": ["moment"]})
+    tts = AsyncMock()
+    tts.synthesize = AsyncMock(side_effect=lambda text: text.encode())
+    await bank.load(tts)
+    return bank
+
+
+def test_bank_loads_and_rotates_clips():
+    bank = FillerBank({"lookup": ["a", "b"]})
+    tts = AsyncMock()
+    tts.synthesize = AsyncMock(side_effect=lambda text: text.encode())
+    _run(bank.load(tts))
+    assert [bank.pick("lookup") for _ in range(3)] == [b"a", b"b", b"a"]
+    # Unknown kinds fall back to any loaded clip
+    assert bank.pick("thinking") in (b"a", b"b")
+
+
+def test_bank_skips_failed_phrases():
+    bank = FillerBank({"lookup": ["ok", "bad"]})
+    tts = AsyncMock()
+    tts.synthesize = AsyncMock(side_effect=lambda text: b"" if text == "bad" else b"ok")
+    _run(bank.load(tts))
+    assert bank.pick("lookup") == b"ok"
+    assert bank.pick("lookup") == b"ok"
+
+
+def test_empty_bank_plays_nothing():
+    played = []
+
+    async def scenario():
+        mask = LatencyMask(AsyncMock(side_effect=played.append), FillerBank({}), threshold_ms=0)
+        mask.start()
+        await asyncio.sleep(0.01)
+        await mask.finish()
+
+    _run(scenario())
+    assert played == []
+
+
+def test_fast_turn_plays_no_filler():
+    played = []
+
+    async def scenario():
+        mask = LatencyMask(AsyncMock(side_effect=played.append), await _loaded_bank(), threshold_ms=200)
+        mask.start()
+        await mask.finish()
+        return mask
+
+    mask = _run(scenario())
+    assert played == []
+    assert not mask.played
+
+
+def test_slow_turn_plays_thinking_filler_once():
+    played = []
+
+    async def scenario():
+        mask = LatencyMask(AsyncMock(side_effect=played.append), await _loaded_bank(), threshold_ms=10)
+        mask.start()
+        await asyncio.sleep(0.05)
+        mask.on_tool_call()  # already played this turn
+        await mask.finish()
+
+    _run(scenario())
+    assert played == [b"moment"]
+
+
+def test_tool_call_plays_lookup_filler_and_response_waits():
+    events = []
+
+    async def slow_play(audio):
+        events.append(("filler-start", audio))
+        await asyncio.sleep(0.02)
+        events.append(("filler-end", audio))
+
+    async def scenario():
+        mask = LatencyMask(slow_play, await _loaded_bank(), threshold_ms=5000)
+        mask.start()
+        mask.on_tool_call()
+        await asyncio.sleep(0)
+        await mask.finish()
+        events.append(("response", b""))
+
+    _run(scenario())
+    assert events == [("filler-start", b"checking"), ("filler-end", b"checking"), ("response", b"")]
+
+
+@pytest.fixture
+def orchestrator():
+    with patch("src.ai.conversation.create_stt"), \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_call_end", new_callable=AsyncMock), \
+         patch("src.ai.conversation.filler_bank", _run(_loaded_bank())):
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"response-audio")
+
+        from src.ai.conversation import ConversationOrchestrator
+
+        yield ConversationOrchestrator(call_sid="test-filler", websocket=AsyncMock())
+
+
+def test_orchestrator_sends_filler_before_mark_and_response(orchestrator):
+    orchestrator.gemini.generate_response = AsyncMock(
+        return_value=GeminiResponse(function_call="check_order_status", function_args={"order_number": "1"})
+    )
+    orchestrator.gemini.send_function_result = AsyncMock(return_value=GeminiResponse(text="Shipped."))
+
+    _run(orchestrator.handle_user_input("where is my order"))
+
+    sent = [call.args[0] for call in orchestrator.websocket.send_json.call_args_list]
+    assert [m["event"] for m in sent] == ["media", "mark", "media"]
+    assert sent[1]["mark"]["name"] == "response-1"
+
+
+def test_hangup_before_response_mark_counts_as_abandoned(orchestrator):
+    from src.utils.metrics import metrics
+
+    orchestrator.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="Hi."))
+    _run(orchestrator.handle_user_input("hello"))
+
+    before = metrics.counter("calls.abandoned_mid_turn")
+    _run(orchestrator.on_call_stopped({}))
+    assert metrics.counter("calls.abandoned_mid_turn") == before + 1
+
+    orchestrator._awaiting_mark = None
+    _run(orchestrator.on_mark({"mark": {"name": "response-1"}}))
+    _run(orchestrator.on_call_stopped({}))
+    assert metrics.counter("calls.abandoned_mid_turn") == before + 1
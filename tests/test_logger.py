@@ -0,0 +1,97 @@
+"""Tests for the queued, rate-limited JSON logging pipeline."""
+
+import asyncio
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+from src.utils.call_context import bind_call
+from src.utils.logger import (
+    CallContextFilter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RateLimitFilter,
+)
+from src.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _pipeline(maxsize=100, per_second=0, sample_every=1):
+    """Logger -> non-blocking queue -> listener thread -> JSON lines in a buffer."""
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(JsonFormatter())
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=maxsize))
+    handler.addFilter(CallContextFilter())
+    handler.addFilter(RateLimitFilter(per_second, sample_every))
+    logger = logging.getLogger(f"test.pipeline.{id(stream)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    listener = logging.handlers.QueueListener(handler.queue, output)
+    return logger, listener, stream
+
+
+def _lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_carry_call_sid_and_exceptions():
+    logger, listener, stream = _pipeline()
+    listener.start()
+
+    async def in_call():
+        bind_call("CA42")
+        logger.info("User said: %s", "hello")
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            logger.exception("Tool failed")
+
+    asyncio.get_event_loop().run_until_complete(in_call())
+    logger.info("outside any call")
+    listener.stop()
+
+    said, failed, outside = _lines(stream)
+    assert said["msg"] == "User said: hello"
+    assert said["call_sid"] == "CA42"
+    assert "ValueError: bad" in failed["exc"]
+    assert "call_sid" not in outside
+
+
+def test_rate_limit_samples_and_reports_suppressed():
+    logger, listener, stream = _pipeline(per_second=3, sample_every=5)
+    listener.start()
+    for i in range(13):
+        logger.info("Synthesizing TTS for text: %s", i)
+    logger.warning("warnings are never limited")
+    listener.stop()
+
+    lines = _lines(stream)
+    infos = [line for line in lines if line["level"] == "INFO"]
+    # 3 within the limit, then records 8 and 13 (every 5th beyond it)
+    assert [line["msg"][-2:].strip() for line in infos] == ["0", "1", "2", "7", "12"]
+    assert infos[3]["suppressed"] == 4
+    assert lines[-1]["level"] == "WARNING"
+    assert metrics.counter("logging.dropped.rate_limited") == 8
+
+
+def test_full_queue_drops_instead_of_blocking():
+    logger, listener, stream = _pipeline(maxsize=2)
+    for i in range(5):
+        logger.info("frame %d", i)  # listener not started: nothing drains the queue
+    listener.start()
+    listener.stop()
+
+    assert len(_lines(stream)) == 2
+    assert metrics.counter("logging.dropped.queue_full") == 3
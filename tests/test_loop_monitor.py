@@ -0,0 +1,122 @@
+"""Tests for the event-loop slow callback monitor."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.telephony.admission import LoopLagProbe
+from src.utils.loop_monitor import LoopMonitor
+from src.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+async def blocking_step():
+    await asyncio.sleep(0)
+    time.sleep(0.25)  # blocks the loop between two awaits
+
+
+def test_reports_blocking_coroutine_step_with_stack():
+    monitor = LoopMonitor(threshold_ms=50)
+    original_run = asyncio.events.Handle._run
+
+    async def scenario():
+        monitor.start()
+        try:
+            await asyncio.sleep(0.06)  # let the watchdog see a healthy heartbeat first
+            await asyncio.create_task(blocking_step(), name="blocker")
+            await asyncio.sleep(0)
+        finally:
+            monitor.stop()
+
+    _run(scenario())
+
+    assert asyncio.events.Handle._run is original_run
+    report = monitor.report()
+    offender = report["offenders"][0]
+    assert offender["callback"] == "task blocking_step"
+    assert offender["count"] == 1
+    assert offender["max_ms"] >= 250
+    recent = report["recent"][0]
+    assert recent["task"] == "blocker"
+    assert recent["stacks"], "watchdog should have sampled the blocked loop"
+    assert any("time.sleep(0.25)" in line for line in recent["stacks"][0])
+    assert metrics.counter("loop.slow_callbacks") == 1
+
+
+def test_tasks_of_one_coroutine_share_an_offender_entry():
+    monitor = LoopMonitor(threshold_ms=20)
+
+    async def short_block():
+        await asyncio.sleep(0)
+        time.sleep(0.03)
+
+    async def scenario():
+        monitor.start()
+        try:
+            await asyncio.gather(*(asyncio.create_task(short_block()) for _ in range(3)))
+        finally:
+            monitor.stop()
+
+    _run(scenario())
+    offenders = monitor.report()["offenders"]
+    assert [o["callback"] for o in offenders] == [
+        "task test_tasks_of_one_coroutine_share_an_offender_entry.<locals>.short_block"
+    ]
+    assert offenders[0]["count"] == 3
+
+
+def test_fast_callbacks_are_not_reported():
+    monitor = LoopMonitor(threshold_ms=50)
+
+    async def scenario():
+        monitor.start()
+        try:
+            for _ in range(10):
+                await asyncio.sleep(0.001)
+        finally:
+            monitor.stop()
+
+    _run(scenario())
+    assert monitor.report()["offenders"] == []
+
+
+def test_lag_probe_publishes_lag_samples():
+    probe = LoopLagProbe(interval=0.01)
+
+    async def scenario():
+        probe.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.05)
+        await asyncio.sleep(0.03)
+        probe.stop()
+
+    _run(scenario())
+    assert metrics.sample_count("loop.lag_ms") >= 2
+    assert metrics.quantile("loop.lag_ms", 100) >= 20
+
+
+def test_debug_endpoint_lists_offenders():
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+
+    client = TestClient(app)
+    assert client.get("/debug/loop").status_code == 404  # no ADMIN_TOKEN configured
+
+    with patch("src.api.auth.settings") as fake_settings:
+        fake_settings.admin_token = "s3cret"
+        assert client.get("/debug/loop", headers={"Authorization": "Bearer nope"}).status_code == 401
+        body = client.get("/debug/loop", headers={"Authorization": "Bearer s3cret"}).json()
+    assert set(body) >= {"threshold_ms", "lag_ms", "offenders", "recent"}
@@ -0,0 +1,123 @@
+"""Tests for transcript entity extraction and speculative tool prefetch."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.gemini_client import GeminiResponse
+from src.ai.prefetch import EntityExtractor, ToolPrefetcher
+
+
+def test_extracts_contextual_order_number():
+    entities = EntityExtractor().extract("Hi, can you check order number 12 345 for me?")
+    assert entities.order_numbers == ["12345"]
+
+
+def test_extracts_bare_digit_run():
+    entities = EntityExtractor().extract("It's 98765 I think")
+    assert entities.order_numbers == ["98765"]
+
+
+def test_extracts_dates_and_times():
+    entities = EntityExtractor().extract("Can I come in next Tuesday at 3:30 pm or March 4th at noon?")
+    assert "next tuesday" in entities.dates
+    assert "march 4th" in entities.dates
+    assert "3:30 pm" in entities.times
+    assert "noon" in entities.times
+    assert entities.order_numbers == []
+
+
+def test_no_entities_in_small_talk():
+    assert EntityExtractor().extract("thanks so much").is_empty()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def test_prefetch_hit_returns_result_without_second_dispatch():
+    dispatch = AsyncMock(return_value={"status": "shipped"})
+
+    async def scenario():
+        prefetcher = ToolPrefetcher(dispatch)
+        prefetcher.start_turn("where is order 55555")
+        hit, result = await prefetcher.take("check_order_status", {"order_number": "55-555"})
+        return prefetcher, hit, result
+
+    prefetcher, hit, result = _run(scenario())
+    assert hit is True
+    assert result == {"status": "shipped"}
+    dispatch.assert_called_once()
+    assert prefetcher.hit_rate == 1.0
+
+
+def test_prefetch_miss_on_different_args():
+    dispatch = AsyncMock(return_value={"status": "shipped"})
+
+    async def scenario():
+        prefetcher = ToolPrefetcher(dispatch)
+        prefetcher.start_turn("order 55555")
+        hit, _ = await prefetcher.take("check_order_status", {"order_number": "11111"})
+        prefetcher.cancel()
+        return prefetcher, hit
+
+    prefetcher, hit = _run(scenario())
+    assert hit is False
+    assert prefetcher.misses == 1
+    assert prefetcher.hit_rate == 0.0
+
+
+def test_side_effect_tools_never_prefetched():
+    dispatch = AsyncMock()
+
+    async def scenario():
+        prefetcher = ToolPrefetcher(dispatch, allowed_tools=frozenset())
+        prefetcher.start_turn("order 55555")
+        return await prefetcher.take("book_appointment", {"date": "monday", "time": "noon"})
+
+    assert _run(scenario()) == (False, None)
+    dispatch.assert_not_called()
+
+
+def test_error_result_is_not_served():
+    dispatch = AsyncMock(return_value={"error": "backend down"})
+
+    async def scenario():
+        prefetcher = ToolPrefetcher(dispatch)
+        prefetcher.start_turn("order 55555")
+        return await prefetcher.take("check_order_status", {"order_number": "55555"})
+
+    assert _run(scenario()) == (False, None)
+
+
+@pytest.fixture
+def orchestrator():
+    with patch("src.ai.conversation.create_stt"), \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock):
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"\x00" * 100)
+
+        from src.ai.conversation import ConversationOrchestrator
+
+        yield ConversationOrchestrator(call_sid="test-prefetch", websocket=AsyncMock())
+
+
+def test_orchestrator_serves_tool_from_prefetch(orchestrator):
+    orchestrator.handlers.check_order_status = AsyncMock(return_value={"status": "shipped"})
+    orchestrator.gemini.generate_response = AsyncMock(
+        return_value=GeminiResponse(
+            function_call="check_order_status",
+            function_args={"order_number": "12345"},
+        )
+    )
+    orchestrator.gemini.send_function_result = AsyncMock(
+        return_value=GeminiResponse(text="Order 12345 has shipped!")
+    )
+
+    _run(orchestrator.handle_user_input("Check order 12345"))
+
+    orchestrator.handlers.check_order_status.assert_called_once_with(order_number="12345")
+    assert orchestrator.prefetcher.hits == 1
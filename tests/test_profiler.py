@@ -0,0 +1,97 @@
+"""Tests for the on-demand sampling profiler and its debug route."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.utils.call_context import bind_call, bind_thread, unbind_thread
+from src.utils.profiler import ProfilerBusyError, SamplingProfiler
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_attributes_loop_cpu_to_the_bound_call():
+    profiler = SamplingProfiler()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        profile = asyncio.ensure_future(
+            asyncio.to_thread(
+                profiler.run, 0.3, interval=0.002, loop=loop, loop_thread_id=threading.get_ident(), by_call=True
+            )
+        )
+
+        async def call_work():
+            bind_call("CA-busy")
+            await asyncio.sleep(0.02)
+            _spin(0.25)
+
+        await asyncio.create_task(call_work())
+        return await profile
+
+    result = asyncio.get_event_loop().run_until_complete(scenario())
+
+    assert result.cpu_ms_by_call["CA-busy"] > 50
+    assert any(stack.startswith("call:CA-busy;loop;") and "_spin" in stack for stack in result.stacks)
+    assert "CA-busy" in result.as_dict()["calls"]
+    assert " " in result.collapsed().splitlines()[0]
+
+
+def test_samples_bound_stt_threads():
+    profiler = SamplingProfiler()
+    stop = threading.Event()
+
+    def recognition():
+        bind_thread("CA-stt")
+        try:
+            while not stop.is_set():
+                _spin(0.01)
+        finally:
+            unbind_thread()
+
+    worker = threading.Thread(target=recognition, name="stt-stream")
+    worker.start()
+    try:
+        result = profiler.run(0.15, interval=0.002)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result.samples_by_call["CA-stt"] > 0
+    assert "stt-stream" in result.threads.values()
+
+
+def test_only_one_profile_at_a_time():
+    profiler = SamplingProfiler()
+    with profiler._busy:
+        with pytest.raises(ProfilerBusyError):
+            profiler.run(0.01)
+
+
+def test_route_is_hidden_by_default_and_requires_token():
+    from src.api.main import app
+
+    client = TestClient(app)
+    assert client.get("/debug/profile").status_code == 404
+
+    with patch("src.api.routes.settings") as fake_settings:
+        fake_settings.profiler_enabled = True
+        fake_settings.profiler_token = "s3cret"
+        fake_settings.profiler_max_seconds = 5
+        assert client.get("/debug/profile", headers={"Authorization": "Bearer nope"}).status_code == 401
+        response = client.get(
+            "/debug/profile",
+            params={"seconds": 0.05, "format": "json", "wall": True},
+            headers={"Authorization": "Bearer s3cret"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["ticks"] > 0
@@ -0,0 +1,99 @@
+"""Tests for chunked call recording and MULAW WAV output."""
+
+import asyncio
+import struct
+from unittest.mock import patch
+
+from src.speech.recorder import MULAW_SILENCE, CallRecorder, ChunkedTrack
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _parse_wav(data: bytes):
+    assert data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+    fmt_tag, channels, rate = struct.unpack("<HHI", data[20:28])
+    data_offset = data.index(b"data") + 8
+    size = struct.unpack("<I", data[data_offset - 4 : data_offset])[0]
+    return fmt_tag, channels, rate, data[data_offset : data_offset + size]
+
+
+def test_track_fills_and_recycles_chunks():
+    track = ChunkedTrack(chunk_size=4, prealloc=2)
+    track.append(b"abcdefghij")
+    chunks = track.drain()
+    assert [bytes(c) for c in chunks] == [b"abcd", b"efgh"]
+    assert track.tail() == b"ij"
+    assert track.length == 10
+    track.recycle(chunks)
+    assert track.drain() == []
+
+
+def test_pad_to_appends_silence():
+    track = ChunkedTrack(chunk_size=8, prealloc=1)
+    track.append(b"\x01\x02")
+    track.pad_to(5)
+    assert track.tail() == b"\x01\x02" + bytes([MULAW_SILENCE]) * 3
+
+
+def test_stereo_recording_places_bot_audio_on_caller_timeline(tmp_path):
+    async def scenario():
+        recorder = CallRecorder("CA1", directory=str(tmp_path), channels=2, chunk_size=4, prealloc=1)
+        await recorder.start()
+        recorder.record_inbound(b"\x10" * 6)
+        recorder.record_outbound(b"\x20" * 3)
+        recorder.record_inbound(b"\x11" * 2)
+        return await recorder.close()
+
+    path = _run(scenario())
+    fmt_tag, channels, rate, frames = _parse_wav(open(path, "rb").read())
+    assert (fmt_tag, channels, rate) == (7, 2, 8000)
+    left, right = frames[0::2], frames[1::2]
+    assert left == b"\x10" * 6 + b"\x11" * 2 + bytes([MULAW_SILENCE])
+    assert right == bytes([MULAW_SILENCE]) * 6 + b"\x20" * 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["CA1.wav"]
+
+
+def test_mono_recording_mixes_legs(tmp_path):
+    async def scenario():
+        recorder = CallRecorder("CA2", directory=str(tmp_path), channels=1, chunk_size=16, prealloc=1)
+        await recorder.start()
+        recorder.record_inbound(b"\x80" * 10)
+        return await recorder.close()
+
+    path = _run(scenario())
+    fmt_tag, channels, _, frames = _parse_wav(open(path, "rb").read())
+    assert (fmt_tag, channels) == (7, 1)
+    # Caller audio mixed with bot silence is unchanged
+    assert frames == b"\x80" * 10
+
+
+def test_close_without_start_returns_none(tmp_path):
+    recorder = CallRecorder("CA3", directory=str(tmp_path))
+    assert _run(recorder.close()) is None
+
+
+def test_start_prepares_spools_off_the_loop(tmp_path):
+    import threading
+
+    from src.speech import recorder as recorder_module
+
+    create_spools = recorder_module._create_spools
+    threads = []
+
+    def tracking_create(directory, spools):
+        threads.append(threading.current_thread().name)
+        create_spools(directory, spools)
+
+    async def scenario():
+        recorder = CallRecorder("CA4", directory=str(tmp_path / "new"))
+        await recorder.start()
+        return recorder
+
+    with patch("src.speech.recorder._create_spools", tracking_create):
+        recorder = _run(scenario())
+
+    assert threads and threads[0].startswith("recording-worker")
+    assert sorted(p.name for p in (tmp_path / "new").iterdir()) == [".CA4.in.ulaw", ".CA4.out.ulaw"]
+    _run(recorder.close())
@@ -0,0 +1,95 @@
+"""Tests for session capture and deterministic replay."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.gemini_client import GeminiResponse
+from src.telephony.capture import SessionCapture, read_capture
+from src.telephony.replay import format_report, replay_session
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _twilio(t, message):
+    return {"t": t, "kind": "twilio", "raw": json.dumps(message)}
+
+
+def _media(t):
+    return _twilio(t, {"event": "media", "media": {"payload": "//8="}})
+
+
+@pytest.fixture
+def no_db():
+    with patch("src.ai.conversation.log_call_start", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_call_end", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock):
+        yield
+
+
+def test_capture_round_trip(tmp_path):
+    async def scenario():
+        capture = SessionCapture("CA1", directory=str(tmp_path), flush_every=2)
+        capture.record_message('{"event": "start"}', "start")
+        capture.record_message('{"event": "media"}', "media")
+        capture.record_transcript("hello")
+        capture.record_llm(GeminiResponse(function_call="check_order_status", function_args={"order_number": "1"}))
+        await asyncio.sleep(0)
+        return await capture.close()
+
+    entries = list(read_capture(_run(scenario())))
+    assert [entry["kind"] for entry in entries] == ["twilio", "twilio", "transcript", "llm"]
+    assert entries[2]["frame"] == 1
+    assert entries[3]["function_args"] == {"order_number": "1"}
+
+
+def test_replay_reports_turn_timings(no_db):
+    entries = [
+        _twilio(0.0, {"event": "start", "start": {"callSid": "CA-replay"}}),
+        _media(0.02),
+        _media(0.04),
+        {"t": 0.05, "kind": "transcript", "frame": 2, "text": "where is order 12345"},
+        {"t": 0.06, "kind": "llm", "function_call": "check_order_status", "function_args": {"order_number": "12345"}},
+        {"t": 0.07, "kind": "llm", "text": "It has shipped."},
+        _media(0.06),
+        _twilio(0.08, {"event": "stop"}),
+    ]
+
+    turns = _run(replay_session(entries, speed=0, llm_latency_ms=5, tts_latency_ms=5))
+
+    assert len(turns) == 1
+    turn = turns[0]
+    assert turn.transcript == "where is order 12345"
+    assert turn.audio_ms == 40
+    assert turn.llm_calls == 2
+    assert turn.first_audio_ms is not None and turn.first_audio_ms >= 10
+    assert turn.complete_ms >= turn.first_audio_ms
+    line = json.loads(format_report(turns))
+    assert list(line) == sorted(line)
+
+
+def test_replay_bookings_stay_in_a_private_calendar():
+    from datetime import date, timedelta
+
+    from src.business.availability import Slot, availability, parse_slot_time
+    from src.telephony.replay import ReplayHandlers
+
+    today = date.today()
+    monday = (today + timedelta(days=7 - today.weekday())).isoformat()
+    handlers = ReplayHandlers(call_sid="CA-replay")
+
+    with patch("src.business.availability._insert_appointment") as insert:
+        booked = _run(handlers.book_appointment(monday, "10am"))
+        again = _run(ReplayHandlers(call_sid="CA-other").book_appointment(monday, "10am"))
+        taken = _run(handlers.book_appointment(monday, "10am"))
+
+    insert.assert_not_called()
+    assert booked["confirmed"] is True
+    assert again["confirmed"] is True  # each replay starts from an empty calendar
+    assert taken["confirmed"] is False
+    assert availability.is_free(Slot("default", parse_slot_time(monday, "10am")))
@@ -0,0 +1,138 @@
+"""Tests for hedged, deadline-bound LLM requests and jittered retries."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ai.request_policy import HedgedRequestPolicy
+from src.utils.helpers import retry_async
+from src.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _seed_latency(name, value_ms, count=20):
+    for _ in range(count):
+        metrics.observe(f"{name}.latency_ms", value_ms)
+
+
+def test_retry_async_applies_jitter_and_reports_retries():
+    calls = []
+    on_retry = MagicMock()
+
+    @retry_async(max_attempts=3, delay=0.01, jitter=0.5, on_retry=on_retry)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with patch("src.utils.helpers.random.uniform", return_value=1.2) as uniform:
+        assert _run(flaky()) == "ok"
+    assert uniform.call_count == 2
+    assert on_retry.call_count == 2
+
+
+def test_no_hedge_without_enough_samples():
+    policy = HedgedRequestPolicy("t1", deadline=1.0, min_samples=5)
+    assert policy.hedge_delay() is None
+
+
+def test_hedge_wins_and_loser_is_cancelled():
+    policy = HedgedRequestPolicy("t2", deadline=2.0, min_hedge_delay_ms=10, max_attempts=1)
+    _seed_latency("t2", 10)
+    started = []
+    cancelled = []
+
+    async def attempt():
+        index = len(started)
+        started.append(index)
+        try:
+            # First copy straggles, the hedge is fast
+            await asyncio.sleep(1.0 if index == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return index
+
+    async def scenario():
+        result = await policy.call(attempt)
+        await asyncio.sleep(0)
+        return result
+
+    assert _run(scenario()) == 1
+    assert cancelled == [0]
+    assert metrics.counter("t2.hedged") == 1
+    assert metrics.counter("t2.hedge_wins") == 1
+
+
+def test_failed_attempt_is_retried():
+    policy = HedgedRequestPolicy("t3", deadline=1.0, hedge=False, max_attempts=2, retry_delay=0.001)
+    outcomes = [RuntimeError("unavailable"), "ok"]
+
+    async def attempt():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert _run(policy.call(attempt)) == "ok"
+    assert metrics.counter("t3.retries") == 1
+
+
+def test_deadline_bounds_the_whole_call():
+    policy = HedgedRequestPolicy("t4", deadline=0.05, hedge=False)
+
+    async def attempt():
+        await asyncio.sleep(1.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        _run(policy.call(attempt))
+    assert metrics.counter("t4.deadline_exceeded") == 1
+
+
+def test_gemini_client_falls_back_when_policy_fails():
+    from src.ai.gemini_client import TROUBLE_RESPONSE, GeminiClient, tenant_models
+    from src.ai.router import CAPABLE
+
+    tenant_models.clear()
+    with patch("src.ai.gemini_client.genai"), \
+         patch("src.ai.gemini_client.settings") as fake_settings:
+        fake_settings.gemini_api_key = "key"
+        client = GeminiClient()
+        client.policies[CAPABLE] = HedgedRequestPolicy(
+            "t5", deadline=1.0, hedge=False, max_attempts=2, retry_delay=0.001
+        )
+        client.model.start_chat.side_effect = RuntimeError("503")
+        response = _run(client.generate_response([], "hello"))
+
+    assert response.text == TROUBLE_RESPONSE
+    assert client.model.start_chat.call_count == 2
+
+
+def test_each_tier_keeps_its_own_latency_distribution():
+    from src.ai.gemini_client import GeminiClient, tenant_models
+    from src.ai.router import CAPABLE, DEFAULT_TIERS
+
+    tenant_models.clear()
+    small = next(tier for name, tier in DEFAULT_TIERS.items() if name != CAPABLE)
+    with patch("src.ai.gemini_client.genai"), \
+         patch("src.ai.gemini_client.settings") as fake_settings:
+        fake_settings.gemini_api_key = "key"
+        client = GeminiClient(tiers=DEFAULT_TIERS)
+        _run(client.generate_response([], "hi", tier=small))
+        _run(client.generate_response([], "where is my order?"))
+
+    assert client.policies[small.name] is not client.policies[CAPABLE]
+    assert metrics.sample_count(f"llm.{small.name}.latency_ms") == 1
+    assert metrics.sample_count(f"llm.{CAPABLE}.latency_ms") == 1
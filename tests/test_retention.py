@@ -0,0 +1,78 @@
+"""Tests for the retention / archival job."""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base, Call, CallMetrics, Conversation
+from src.database.retention import run_retention, run_retention_sync
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr("src.database.retention.SessionLocal", TestSession)
+
+    now = datetime.utcnow()
+    session = TestSession()
+    for age_days in (40, 40, 35, 1):
+        moment = now - timedelta(days=age_days)
+        session.add(Conversation(call_sid=f"CA{age_days}", role="user", message="hi", timestamp=moment))
+        session.add(CallMetrics(call_sid=f"CA{age_days}", total_latency=500, created_at=moment))
+    session.add(Call(call_sid="CA-old", start_time=now - timedelta(days=40), status="completed"))
+    session.add(Call(call_sid="CA-stuck", start_time=now - timedelta(days=40), status="active"))
+    session.commit()
+    session.close()
+    yield TestSession
+
+
+def _count(session_factory, model):
+    session = session_factory()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+def test_archives_expired_rows_in_batches(db, tmp_path):
+    report = run_retention_sync(max_age_days=30, batch_size=2, archive_dir=str(tmp_path), pause=0)
+
+    assert report.rows == {"conversations": 3, "call_metrics": 3, "calls": 1}
+    assert _count(db, Conversation) == 1
+    assert _count(db, CallMetrics) == 1
+    # Calls still in progress are never archived
+    assert _count(db, Call) == 1
+
+    partitions = sorted(p.name for p in (tmp_path / "conversations").iterdir())
+    assert len(partitions) == 2
+    records = [
+        json.loads(line)
+        for name in partitions
+        for line in gzip.decompress((tmp_path / "conversations" / name).read_bytes()).decode().splitlines()
+    ]
+    assert len(records) == 3
+    assert {record["call_sid"] for record in records} == {"CA40", "CA35"}
+
+
+def test_second_run_moves_nothing(db, tmp_path):
+    run_retention_sync(max_age_days=30, archive_dir=str(tmp_path), pause=0)
+    report = run_retention_sync(max_age_days=30, archive_dir=str(tmp_path), pause=0)
+    assert report.total == 0
+
+
+def test_async_run_matches_sync(db, tmp_path):
+    report = asyncio.get_event_loop().run_until_complete(
+        run_retention(max_age_days=30, batch_size=2, archive_dir=str(tmp_path), tables=["call_metrics"])
+    )
+    assert report.as_dict()["rows"] == {"call_metrics": 3}
+    assert _count(db, CallMetrics) == 1
@@ -0,0 +1,85 @@
+"""Tests for per-turn model tier routing."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.ai.context import ConversationContext
+from src.ai.gemini_client import GeminiResponse
+from src.ai.prefetch import EntityExtractor
+from src.ai.router import CAPABLE, SMALL, ModelRouter, load_tiers
+from src.utils.metrics import metrics
+
+
+@pytest.fixture
+def router():
+    return ModelRouter(load_tiers())
+
+
+@pytest.mark.parametrize("transcript", ["Yes.", "no thanks", "Okay, thank you!", "bye, have a good day"])
+def test_small_talk_goes_to_small_tier(router, transcript):
+    decision = router.route(transcript, EntityExtractor().extract(transcript), ConversationContext())
+    assert decision.tier.name == SMALL
+    assert decision.tier.max_output_tokens < router.tiers[CAPABLE].max_output_tokens
+
+
+@pytest.mark.parametrize(
+    "transcript, reason",
+    [
+        ("Where is order 12345?", "entities"),
+        ("I want to book an appointment", "tool_intent"),
+        ("Can you tell me something about your company and what you do?", "long_turn"),
+        ("Why?", "open_question"),
+    ],
+)
+def test_substantive_turns_go_to_capable_tier(router, transcript, reason):
+    decision = router.route(transcript, EntityExtractor().extract(transcript), ConversationContext())
+    assert (decision.tier.name, decision.reason) == (CAPABLE, reason)
+
+
+def test_confirmation_of_pending_booking_stays_capable(router):
+    context = ConversationContext()
+    context.pin("requested time", "3 pm")
+    assert router.route("yes", None, context).reason == "pending_confirmation"
+
+    context.pin("booked appointment", "tomorrow at 3 pm")
+    assert router.route("yes", None, context).tier.name == SMALL
+
+
+def test_disabled_router_always_uses_capable_tier():
+    assert ModelRouter(load_tiers(), enabled=False).route("yes").tier.name == CAPABLE
+
+
+def test_tier_table_overrides():
+    tiers = load_tiers({"small": {"model": "tiny-model", "max_output_tokens": 30}, "huge": {"model": "x"}})
+    assert tiers[SMALL].model == "tiny-model"
+    assert tiers[SMALL].generation_config()["max_output_tokens"] == 30
+    assert "huge" not in tiers
+
+
+def test_turn_records_chosen_tier():
+    metrics.reset()
+    with patch("src.ai.conversation.create_stt"), \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_message", new_callable=AsyncMock), \
+         patch("src.ai.conversation.log_metrics", new_callable=AsyncMock) as log_metrics:
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"\x00" * 100)
+        from src.ai.conversation import ConversationOrchestrator
+
+        orch = ConversationOrchestrator(call_sid="test-router", websocket=AsyncMock())
+        orch.gemini.generate_response = AsyncMock(return_value=GeminiResponse(text="You're welcome!"))
+
+        async def turn():
+            await orch.handle_user_input("thanks")
+            await asyncio.sleep(0)
+
+        asyncio.get_event_loop().run_until_complete(turn())
+
+    assert orch.gemini.generate_response.call_args.kwargs["tier"].name == SMALL
+    payload = log_metrics.call_args.kwargs["payload"]
+    assert payload["llm_tier"] == SMALL
+    assert payload["llm_route_reason"] == "small_talk"
+    assert metrics.counter("llm.tier.small") == 1
+    metrics.reset()
@@ -0,0 +1,87 @@
+"""Tests for sentence segmentation and ordered concurrent TTS."""
+
+import asyncio
+import random
+
+from src.speech.segmenter import split_sentences, synthesize_segments
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _collect(synthesize, text, max_parallel=3):
+    async def scenario():
+        return [segment async for segment in synthesize_segments(synthesize, text, max_parallel)]
+
+    return _run(scenario())
+
+
+def test_split_sentences():
+    text = "Your order has already shipped. It should arrive on Tuesday! Anything else I can help with?"
+    assert split_sentences(text) == [
+        "Your order has already shipped.",
+        "It should arrive on Tuesday!",
+        "Anything else I can help with?",
+    ]
+
+
+def test_split_keeps_abbreviations_and_merges_fragments():
+    assert split_sentences("Dr. Smith can see you at noon on Friday. Okay?") == [
+        "Dr. Smith can see you at noon on Friday. Okay?"
+    ]
+    assert split_sentences("Sure. I booked you for ten in the morning.") == [
+        "Sure. I booked you for ten in the morning."
+    ]
+
+
+def test_single_sentence_and_empty_text():
+    assert split_sentences("Hello there, how can I help you today") == ["Hello there, how can I help you today"]
+    assert split_sentences("   ") == []
+    assert _collect(None, "") == []
+
+
+def test_segments_yield_in_order_despite_out_of_order_completion():
+    async def synthesize(text):
+        await asyncio.sleep(random.uniform(0, 0.02))
+        return text.encode()
+
+    text = " ".join(f"This is sentence number {i} of the reply." for i in range(6))
+    segments = _collect(synthesize, text)
+    assert [s.index for s in segments] == list(range(6))
+    assert b" ".join(s.audio for s in segments) == text.encode()
+    assert all(s.ready_ms >= 0 and s.synth_ms >= 0 for s in segments)
+
+
+def test_parallelism_is_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def synthesize(text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return b"x"
+
+    text = " ".join(f"This is sentence number {i} of the reply." for i in range(8))
+    _collect(synthesize, text, max_parallel=2)
+    assert peak == 2
+
+
+def test_head_segment_ready_before_tail_finishes():
+    async def synthesize(text):
+        await asyncio.sleep(0.05 if "last" in text else 0.0)
+        return text.encode()
+
+    first_ready = []
+
+    async def scenario():
+        async for segment in synthesize_segments(
+            synthesize, "This is the first sentence here. And this is the last sentence here."
+        ):
+            first_ready.append(segment.ready_ms)
+
+    _run(scenario())
+    assert first_ready[0] < first_ready[1]
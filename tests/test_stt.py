@@ -79,3 +79,51 @@ def test_client_creation_failure():
         # start_stream should not crash
         asyncio.get_event_loop().run_until_complete(stt.start_stream())
         assert stt._running is False
+
+
+def test_audio_queue_drops_oldest_when_full(mock_stt_client):
+    stt = GoogleSTT()
+    stt._audio_queue = asyncio.Queue(maxsize=2)
+    for chunk in (b"a", b"b", b"c"):
+        asyncio.get_event_loop().run_until_complete(stt.process_audio_chunk(chunk))
+    assert stt._audio_queue.get_nowait() == b"b"
+    assert stt._audio_queue.get_nowait() == b"c"
+
+
+def test_start_stream_respects_thread_cap(mock_stt_client):
+    with patch("src.speech.google_stt.stt_threads") as budget:
+        budget.try_acquire.return_value = False
+        stt = GoogleSTT()
+        asyncio.get_event_loop().run_until_complete(stt.start_stream())
+        assert stt._running is False
+        assert stt._thread is None
+
+
+def test_base_class_requires_stream_lifecycle():
+    from src.speech.google_stt import BaseGoogleSTT
+
+    with patch("src.speech.google_stt.speech"), pytest.raises(TypeError):
+        BaseGoogleSTT()
+
+
+def test_recognition_loop_backs_off_between_failed_streams(mock_stt_client):
+    client, _ = mock_stt_client
+    stt = GoogleSTT()
+    stt._loop = MagicMock()
+    stt._running = True
+    attempts = []
+
+    def streaming_recognize(config, requests):
+        attempts.append(config)
+        if len(attempts) == 3:
+            stt._running = False
+        raise RuntimeError("stream reset")
+
+    client.streaming_recognize.side_effect = streaming_recognize
+    with patch("src.speech.google_stt.stt_breaker") as breaker, \
+         patch("src.speech.google_stt.time.sleep") as sleep:
+        breaker.admit.return_value = (True, False)
+        stt._recognition_loop()
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.5]
+    assert breaker.record_failure.call_count == 2
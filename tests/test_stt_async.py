@@ -0,0 +1,144 @@
+"""Tests for the asyncio-native STT backend against a local fake streaming server."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.speech.google_stt import AsyncGoogleSTT, GoogleSTT, create_stt
+
+
+def _response(transcript: str, is_final: bool = True):
+    alternative = SimpleNamespace(transcript=transcript)
+    return SimpleNamespace(results=[SimpleNamespace(is_final=is_final, alternatives=[alternative])])
+
+
+class FakeStreamingServer:
+    """In-process stand-in for the Speech streaming endpoint.
+
+    Consumes the bidirectional request stream like the real service: the
+    first request must carry the config, audio requests follow, and scripted
+    results are emitted after the given number of audio chunks.
+    """
+
+    def __init__(self, script, fail_streams: int = 0):
+        self.script = script
+        self.fail_streams = fail_streams
+        self.streams_opened = 0
+        self.configs = []
+        self.audio = []
+
+    async def streaming_recognize(self, requests):
+        self.streams_opened += 1
+        if self.fail_streams:
+            self.fail_streams -= 1
+            raise RuntimeError("stream reset")
+
+        async def responses():
+            first = await requests.__anext__()
+            self.configs.append(first.streaming_config)
+            count = 0
+            async for request in requests:
+                count += 1
+                self.audio.append(request.audio_content)
+                if count in self.script:
+                    yield _response(self.script[count])
+
+        return responses()
+
+
+@pytest.fixture(autouse=True)
+def mock_speech():
+    with patch("src.speech.google_stt.speech") as mock_speech_mod:
+        mock_speech_mod.RecognitionConfig.AudioEncoding.MULAW = "MULAW"
+        mock_speech_mod.StreamingRecognitionConfig.return_value = "stream_config"
+        mock_speech_mod.StreamingRecognizeRequest = lambda **kw: SimpleNamespace(**kw)
+        yield mock_speech_mod
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def test_streams_audio_and_returns_final_transcript():
+    server = FakeStreamingServer({3: "check my order"})
+
+    async def scenario():
+        stt = AsyncGoogleSTT(client=server)
+        await stt.start_stream()
+        for chunk in (b"a", b"b", b"c"):
+            await stt.process_audio_chunk(chunk)
+        transcript = await stt.get_transcript(timeout=1.0)
+        await stt.close()
+        return transcript
+
+    assert _run(scenario()) == "check my order"
+    assert server.configs == ["stream_config"]
+    assert server.audio == [b"a", b"b", b"c"]
+
+
+def test_interim_results_are_ignored():
+    server = FakeStreamingServer({})
+
+    async def scenario():
+        stt = AsyncGoogleSTT(client=server)
+        for transcript in stt._final_transcripts(_response("partial", is_final=False)):
+            stt._enqueue_transcript(transcript)
+        return await stt.get_transcript()
+
+    assert _run(scenario()) is None
+
+
+def test_reopens_stream_after_error():
+    server = FakeStreamingServer({1: "hello"}, fail_streams=1)
+
+    async def scenario():
+        stt = AsyncGoogleSTT(client=server)
+        await stt.start_stream()
+        await stt.process_audio_chunk(b"a")
+        transcript = await stt.get_transcript(timeout=2.0)
+        await stt.close()
+        return transcript
+
+    assert _run(scenario()) == "hello"
+    assert server.streams_opened == 2
+
+
+def test_no_thread_per_call():
+    servers = [FakeStreamingServer({}) for _ in range(10)]
+
+    async def scenario():
+        before = threading.active_count()
+        streams = [AsyncGoogleSTT(client=server) for server in servers]
+        for stt in streams:
+            await stt.start_stream()
+        during = threading.active_count()
+        for stt in streams:
+            await stt.close()
+        return before, during
+
+    before, during = _run(scenario())
+    assert during == before
+
+
+def test_create_stt_falls_back_to_threaded(mock_speech):
+    mock_speech.SpeechAsyncClient.side_effect = Exception("no grpc.aio")
+    mock_speech.SpeechClient.return_value = MagicMock()
+    with patch("src.speech.google_stt.settings") as mock_settings:
+        mock_settings.stt_backend = "async"
+        mock_settings.stt_audio_queue_size = 10
+        mock_settings.stt_transcript_queue_size = 10
+        mock_settings.stt_sample_rate = 8000
+        stt = create_stt()
+    assert isinstance(stt, GoogleSTT)
+
+
+def test_create_stt_threaded_setting(mock_speech):
+    with patch("src.speech.google_stt.settings") as mock_settings:
+        mock_settings.stt_backend = "threaded"
+        mock_settings.stt_audio_queue_size = 10
+        mock_settings.stt_transcript_queue_size = 10
+        mock_settings.stt_sample_rate = 8000
+        assert isinstance(create_stt(), GoogleSTT)
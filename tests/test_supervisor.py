@@ -0,0 +1,136 @@
+"""Tests for per-call resource accounting and the stale call reaper."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.telephony import call_manager
+from src.telephony.supervisor import CallSupervisor, measure
+from src.utils.metrics import metrics
+
+
+@pytest.fixture
+def patched():
+    with patch("src.ai.conversation.create_stt") as create_stt, \
+         patch("src.ai.conversation.GoogleTTS"), \
+         patch("src.ai.conversation.GeminiClient"), \
+         patch("src.ai.conversation.log_call_start", new_callable=AsyncMock), \
+         patch("src.telephony.supervisor.log_call_end", new_callable=AsyncMock) as log_call_end:
+        create_stt.return_value.close = AsyncMock()
+        create_stt.return_value.resources = lambda: {"threads": 1, "audio_queue": 2, "audio_bytes": 320}
+        metrics.reset()
+        yield log_call_end
+        call_manager._conversations.clear()
+        metrics.reset()
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _silent_websocket():
+    async def never_sends():
+        await asyncio.Event().wait()
+
+    websocket = AsyncMock()
+    websocket.receive_text = never_sends
+    return websocket
+
+
+def test_reaps_call_whose_stream_went_quiet(patched):
+    from src.telephony.audio_stream import handle_audio_stream
+
+    supervisor = CallSupervisor(idle_timeout=30, teardown_timeout=1)
+    websocket = _silent_websocket()
+
+    async def scenario():
+        stream = asyncio.create_task(handle_audio_stream(websocket, "CA-quiet"))
+        await asyncio.sleep(0.01)
+        orchestrator = call_manager._conversations["CA-quiet"]
+        assert supervisor.sweep() == []
+        orchestrator.last_activity -= 45
+        assert supervisor.sweep() == ["CA-quiet"]
+        assert supervisor.sweep() == []  # teardown already under way
+        await asyncio.gather(*supervisor._teardowns)
+        return stream, orchestrator
+
+    stream, orchestrator = _run(scenario())
+
+    assert stream.cancelled()
+    orchestrator.stt.close.assert_awaited()
+    websocket.close.assert_awaited()
+    patched.assert_awaited_once_with("CA-quiet")
+    assert "CA-quiet" not in call_manager._conversations
+    assert metrics.counter("calls.reaped.idle") == 1
+
+
+def test_reaps_orphaned_registration(patched):
+    from src.ai.conversation import ConversationOrchestrator
+
+    supervisor = CallSupervisor()
+
+    async def scenario():
+        orchestrator = ConversationOrchestrator(
+            "CA-orphan", AsyncMock(), on_cleanup=lambda: call_manager.end_conversation("CA-orphan")
+        )
+        call_manager.register_conversation(orchestrator)
+        assert supervisor.sweep() == ["CA-orphan"]
+        await asyncio.gather(*supervisor._teardowns)
+        return orchestrator
+
+    orchestrator = _run(scenario())
+    orchestrator.stt.close.assert_awaited()
+    assert call_manager.active_conversations() == []
+    assert metrics.counter("calls.reaped.orphaned") == 1
+
+
+def test_measures_and_publishes_per_call_resources(patched):
+    from fastapi.testclient import TestClient
+
+    from src.ai.conversation import ConversationOrchestrator
+    from src.api.main import app
+
+    orchestrator = ConversationOrchestrator("CA-busy", AsyncMock())
+    orchestrator.stream_task = MagicMock(done=lambda: False)
+    orchestrator.context.add_message("user", "x" * 400)
+    call_manager.register_conversation(orchestrator)
+
+    resources = measure(orchestrator)
+    assert resources.stream == "running"
+    assert resources.threads == 1
+    assert resources.memory_bytes == 320 + resources.context_bytes
+    assert resources.context_bytes >= 400
+
+    client = TestClient(app)
+    assert client.get("/debug/calls").status_code == 404  # no ADMIN_TOKEN configured
+    with patch("src.api.auth.settings") as fake_settings:
+        fake_settings.admin_token = "s3cret"
+        body = client.get("/debug/calls", headers={"Authorization": "Bearer s3cret"}).json()
+    assert body["calls"][0]["call_sid"] == "CA-busy"
+    assert body["memory_bytes"] == resources.memory_bytes
+
+
+def test_threaded_stt_close_does_not_block_the_loop():
+    from src.speech.google_stt import GoogleSTT
+
+    with patch("src.speech.google_stt.speech"):
+        stt = GoogleSTT()
+    stt._thread = threading.Thread(target=time.sleep, args=(0.3,))
+    stt._thread.start()
+    ticks = []
+
+    async def ticker():
+        while stt._thread.is_alive():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def scenario():
+        await asyncio.gather(stt.close(), ticker())
+
+    _run(scenario())
+    assert not stt._thread.is_alive()
+    assert len(ticks) >= 5
+    assert stt.threads == 0
@@ -0,0 +1,128 @@
+"""Tests for per-tenant bot profiles and the model/voice caches."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.business.tenants import DEFAULT_PROFILE, TenantRegistry, VoiceProfile
+from src.utils.lru import LRUCache
+from src.utils.metrics import metrics
+
+PROFILES = {
+    "+1 (555) 123-0001": {
+        "name": "acme-dental",
+        "system_prompt": "You are the receptionist for Acme Dental.",
+        "greeting": "Thanks for calling Acme Dental!",
+        "voice": {"name": "en-US-Neural2-F"},
+        "tools": ["book_appointment", "get_faq_answer"],
+        "faqs": {"hours": "We're open 8 to 6 on weekdays."},
+    }
+}
+
+
+def _registry(tmp_path):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps(PROFILES))
+    return TenantRegistry.from_file(str(path))
+
+
+def test_registry_resolves_called_number(tmp_path):
+    registry = _registry(tmp_path)
+    profile = registry.resolve("+15551230001")
+    assert profile.key == "acme-dental"
+    assert profile.voice == VoiceProfile(name="en-US-Neural2-F")
+    assert [tool["name"] for tool in profile.tool_declarations] == ["book_appointment", "get_faq_answer"]
+    assert not profile.allows_tool("check_order_status")
+    assert registry.resolve("+15559999999") is DEFAULT_PROFILE
+    assert registry.resolve(None) is DEFAULT_PROFILE
+
+
+def test_invalid_profile_file_falls_back_to_default(tmp_path):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps({"+15551230001": {"tools": ["launch_rockets"]}}))
+    assert len(TenantRegistry.from_file(str(path))) == 0
+
+
+def test_lru_evicts_least_recently_used():
+    metrics.reset()
+    cache = LRUCache("t", maxsize=2)
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    assert cache.get_or_create("a", lambda: 99) == 1
+    cache.get_or_create("c", lambda: 3)
+    assert "b" not in cache and "a" in cache
+    assert metrics.counter("lru.t.evictions") == 1
+    assert metrics.counter("lru.t.hits") == 1
+    metrics.reset()
+
+
+def test_models_are_built_once_per_tenant(tmp_path):
+    from src.ai.gemini_client import GeminiClient, tenant_models
+
+    profile = _registry(tmp_path).resolve("+15551230001")
+    tenant_models.clear()
+    with patch("src.ai.gemini_client.genai") as genai:
+        first = GeminiClient(profile=profile)
+        second = GeminiClient(profile=profile)
+        built = genai.GenerativeModel.call_count
+
+    assert first.models is second.models
+    # One model per tier plus the shared summary model
+    assert built == len(first.tiers) + 1
+    kwargs = genai.GenerativeModel.call_args_list[0].kwargs
+    assert kwargs["system_instruction"] == "You are the receptionist for Acme Dental."
+    assert [tool["name"] for tool in kwargs["tools"]] == ["book_appointment", "get_faq_answer"]
+    tenant_models.clear()
+
+
+def test_tenants_sharing_a_name_get_their_own_models():
+    from src.ai.gemini_client import GeminiClient, tenant_models
+    from src.business.tenants import TenantProfile
+
+    tenant_models.clear()
+    with patch("src.ai.gemini_client.genai"):
+        dental = GeminiClient(profile=TenantProfile(key="Acme", system_prompt="Dental desk.", tools=("book_appointment",)))
+        shop = GeminiClient(profile=TenantProfile(key="Acme", system_prompt="Shop desk.", tools=("check_order_status",)))
+
+    assert dental.models is not shop.models
+    tenant_models.clear()
+
+
+def test_voice_webhook_passes_called_number_to_stream():
+    from src.api.main import app
+
+    response = TestClient(app).post("/voice", data={"To": "+15551230001"})
+    assert '<Parameter name="To" value="+15551230001"' in response.text
+
+
+def test_start_event_switches_call_to_tenant_profile(tmp_path):
+    registry = _registry(tmp_path)
+    with patch("src.ai.conversation.create_stt") as create_stt, \
+         patch("src.ai.conversation.GoogleTTS") as MockTTS, \
+         patch("src.ai.conversation.GeminiClient") as MockGemini, \
+         patch("src.ai.conversation.tenants", registry), \
+         patch("src.ai.conversation.log_call_start", new_callable=AsyncMock):
+        create_stt.return_value.start_stream = AsyncMock()
+        MockTTS.return_value.synthesize = AsyncMock(return_value=b"\x00" * 100)
+        from src.ai.conversation import ConversationOrchestrator
+
+        orch = ConversationOrchestrator(call_sid="test-tenant", websocket=AsyncMock())
+        start = {"callSid": "CA1", "customParameters": {"To": "+15551230001"}}
+        asyncio.get_event_loop().run_until_complete(orch.on_call_started({"start": start}))
+
+        profile = registry.resolve("+15551230001")
+        assert orch.profile is profile
+        MockGemini.assert_called_with(profile=profile)
+        MockTTS.assert_called_with(voice=profile.voice)
+        MockTTS.return_value.synthesize.assert_any_call("Thanks for calling Acme Dental!")
+
+        result = asyncio.get_event_loop().run_until_complete(
+            orch._dispatch_tool("check_order_status", {"order_number": "1"})
+        )
+        assert "not available" in result["error"]
+        answer = asyncio.get_event_loop().run_until_complete(
+            orch._dispatch_tool("get_faq_answer", {"question": "What are your hours?"})
+        )
+        assert answer == "We're open 8 to 6 on weekdays."
@@ -11,7 +11,7 @@ from src.ai.gemini_client import GeminiResponse
 @pytest.fixture
 def orchestrator():
     """Create an orchestrator with mocked dependencies."""
-    with patch("src.ai.conversation.GoogleSTT"), \
+    with patch("src.ai.conversation.create_stt"), \
          patch("src.ai.conversation.GoogleTTS") as MockTTS, \
          patch("src.ai.conversation.GeminiClient") as MockGemini, \
          patch("src.ai.conversation.log_call_start", new_callable=AsyncMock), \
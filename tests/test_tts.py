@@ -77,3 +77,16 @@ def test_client_creation_failure():
         tts = GoogleTTS()
         result = asyncio.get_event_loop().run_until_complete(tts.synthesize("Hello"))
         assert result == b""
+
+
+def test_linear16_mode_converts_to_twilio_mulaw(mock_tts_client):
+    client_instance, _ = mock_tts_client
+    # 0.1 s of LINEAR16 silence at 24 kHz
+    client_instance.synthesize_speech.return_value = MagicMock(audio_content=b"\x00\x00" * 2400)
+    with patch("src.speech.google_tts.settings") as mock_settings:
+        mock_settings.tts_audio_encoding = "linear16"
+        mock_settings.tts_synthesis_rate = 24000
+        tts = GoogleTTS(sample_rate=8000)
+        result = asyncio.get_event_loop().run_until_complete(tts.synthesize("Hello"))
+    assert len(result) == 800
+    assert set(result) == {0xFF}  # mu-law silence
@@ -0,0 +1,54 @@
+"""Tests for lazy imports, startup warm-up and the readiness endpoint."""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, patch
+
+from src.api.warmup import WarmupState, run_warmup
+from src.utils.lazy import import_times, lazy_import
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    sys.modules.pop("colorsys", None)
+    module = lazy_import("colorsys")
+    assert not module.loaded
+    assert "colorsys" not in sys.modules
+
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert module.loaded
+    assert "colorsys" in import_times
+
+
+def test_warmup_marks_ready_even_when_phases_fail():
+    state = WarmupState()
+    with patch("src.api.warmup._load_modules"), \
+         patch("src.api.warmup._fetch_credentials", side_effect=RuntimeError("no credentials")), \
+         patch("src.api.warmup._warm_stt", new_callable=AsyncMock), \
+         patch("src.api.warmup.GoogleTTS.warm_up"), \
+         patch("src.api.warmup.GeminiClient.warm_up", side_effect=RuntimeError("no api key")), \
+         patch("src.api.warmup._preload_audio", new_callable=AsyncMock) as preload:
+        _run(run_warmup(state))
+
+    assert state.ready is True
+    assert set(state.errors) == {"credentials", "gemini"}
+    assert {"imports", "credentials", "stt_client", "tts_client", "gemini", "audio", "total"} <= set(state.phases)
+    preload.assert_awaited_once()
+
+
+def test_ready_endpoint_reflects_warmup_state():
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+    from src.api.warmup import warmup_state
+
+    client = TestClient(app)
+    with patch.object(warmup_state, "ready", False):
+        assert client.get("/ready").status_code == 503
+    with patch.object(warmup_state, "ready", True):
+        response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True